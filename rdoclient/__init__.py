@@ -43,6 +43,20 @@ are sent too frequently:
     >>> r.generate_integers(5, 0, 10)
     [3, 5, 2, 4, 8]
 
+Requests can be spread over several API keys with a RandomOrgClientPool,
+which sends each request with the key able to send it soonest:
+
+    >>> p = RandomOrgClientPool([YOUR_API_KEY_HERE, YOUR_OTHER_API_KEY_HERE])
+    >>> p.generate_integers(5, 0, 10)
+    [2, 7, 7, 0, 4]
+
+Under Python 3.5+ with aiohttp installed, the same methods are 
+available as coroutines through the AsyncRandomOrgClient:
+
+    >>> r = AsyncRandomOrgClient(YOUR_API_KEY_HERE)
+    >>> await r.generate_integers(5, 0, 10)
+    [8, 1, 0, 7, 3]
+
 For a full list of available randomness generation functions see 
 rdoclient.py documentation and https://api.random.org/json-rpc/4
 """
@@ -54,7 +68,11 @@ __author__ = 'RANDOM.ORG'
 __license__ = 'MIT'
 __copyright__ = 'Copyright 2014 RANDOM.ORG'
 
-from .rdoclient import (RandomOrgClient, RandomOrgCache, RandomOrgSendTimeoutError, 
+from .rdoclient import (RandomOrgClient, RandomOrgCache, RandomOrgBatch, 
+                        RandomOrgClientPool, RandomOrgEntropyReservoir, 
+                        RandomOrgLedger, RandomOrgSerialMonitor, 
+                        RandomOrgTicketPool, 
+                        RandomOrgSendTimeoutError, 
                         RandomOrgKeyNonExistentError, RandomOrgKeyNotRunningError, 
                         RandomOrgInsufficientRequestsError, RandomOrgInsufficientBitsError, 
                         RandomOrgKeyInvalidAccessError, RandomOrgKeyInvalidVersionError, 
@@ -63,7 +81,11 @@ from .rdoclient import (RandomOrgClient, RandomOrgCache, RandomOrgSendTimeoutErr
                         RandomOrgTicketNotYetUsedError, RandomOrgLicenseDataRequiredError,
                         RandomOrgLicenseDataNotAllowedError)
 
-__all__ = [ 'RandomOrgClient', 'RandomOrgCache', 'RandomOrgSendTimeoutError', 
+__all__ = [ 'RandomOrgClient', 'RandomOrgCache', 'RandomOrgBatch', 
+           'RandomOrgClientPool', 'RandomOrgEntropyReservoir', 
+           'RandomOrgLedger', 'RandomOrgSerialMonitor', 
+           'RandomOrgTicketPool', 
+           'RandomOrgSendTimeoutError', 
            'RandomOrgKeyNonExistentError', 'RandomOrgKeyNotRunningError', 
            'RandomOrgInsufficientRequestsError', 'RandomOrgInsufficientBitsError', 
            'RandomOrgKeyInvalidAccessError', 'RandomOrgKeyInvalidVersionError', 
@@ -72,6 +94,13 @@ __all__ = [ 'RandomOrgClient', 'RandomOrgCache', 'RandomOrgSendTimeoutError',
            'RandomOrgTicketNotYetUsedError', 'RandomOrgLicenseDataRequiredError',
            'RandomOrgLicenseDataNotAllowedError' ]
 
+import sys
+
+if sys.version_info >= (3, 5):
+    # asyncio client, requires aiohttp to be instantiated
+    from .rdoclient_async import AsyncRandomOrgClient
+    __all__.append('AsyncRandomOrgClient')
+
 import logging
 
 try:
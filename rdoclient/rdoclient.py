@@ -13,6 +13,19 @@ RandomOrgClient -- main class through which API functions are accessed.
 
 RandomOrgCache -- for precaching API responses.
 
+RandomOrgEntropyReservoir -- for drawing typed values locally from 
+                             precached blobs.
+
+RandomOrgLedger -- for keeping signed results locally.
+
+RandomOrgSerialMonitor -- for detecting missing signed results.
+
+RandomOrgTicketPool -- for handing out tickets created in advance.
+
+RandomOrgBatch -- for sending several requests in one round trip.
+
+RandomOrgClientPool -- for spreading requests over several API keys.
+
 RandomOrgSendTimeoutError -- when request can't be sent in a set time.
 
 RandomOrgKeyNonExistentError -- key does not exist. 
@@ -44,25 +57,71 @@ RandomOrgLicenseDataNotAllowedError -- your API key type does not support
                                        the license data parameter.
 """
 
-from collections import OrderedDict
+from array import array
+from collections import OrderedDict, deque
 import base64
+import binascii
+import bisect
+import functools
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import math
+import os
 import re
 import threading
 import time
 import sys
 import uuid
+import weakref
 
-from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as _FutureTimeoutError
+from datetime import datetime, timedelta
+try:
+    # Unix
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
 try:
     # Python 2.7
-    from Queue import Queue, Empty
+    from Queue import Empty
 except ImportError:
     # Python 3+
-    from queue import Queue, Empty
+    from queue import Empty
+try:
+    # Python 2.7
+    import anydbm as dbm
+except ImportError:
+    # Python 3+
+    import dbm
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    # Python 3.3+
+    _monotonic = time.monotonic
+except AttributeError:
+    # Python 2.7
+    _monotonic = time.time
+
+try:
+    # Python 3.3+
+    _replace_file = os.replace
+except AttributeError:
+    # Python 2.7, atomic on POSIX
+    _replace_file = os.rename
 
 # Basic RANDOM.ORG API functions https://api.random.org/json-rpc/4/basic
 _INTEGER_METHOD                  = 'generateIntegers'
@@ -89,13 +148,92 @@ _LIST_TICKETS_METHOD             = 'listTickets'
 _GET_TICKET_METHOD               = 'getTicket'
 _VERIFY_SIGNATURE_METHOD         = 'verifySignature'
 
+# Methods whose responses hold a random object signed by RANDOM.ORG
+_SIGNED_METHODS                  = (_SIGNED_INTEGER_METHOD, 
+                                    _SIGNED_INTEGER_SEQUENCES_METHOD, 
+                                    _SIGNED_DECIMAL_FRACTION_METHOD, 
+                                    _SIGNED_GAUSSIAN_METHOD, 
+                                    _SIGNED_STRING_METHOD, 
+                                    _SIGNED_UUID_METHOD, 
+                                    _SIGNED_BLOB_METHOD, 
+                                    _GET_RESULT_METHOD)
+
 # Blob format literals
 _BLOB_FORMAT_BASE64              = 'base64'
 _BLOB_FORMAT_HEX                 = 'hex'
 
+# Output types of integers, decimals and blobs
+_OUTPUT_LIST                     = 'list'
+_OUTPUT_NUMPY                    = 'numpy'
+_OUTPUT_BYTES                    = 'bytes'
+_OUTPUT_MEMORYVIEW               = 'memoryview'
+_NUMBER_OUTPUTS                  = (_OUTPUT_LIST, _OUTPUT_NUMPY)
+_BLOB_OUTPUTS                    = (_OUTPUT_LIST, _OUTPUT_BYTES, 
+                                    _OUTPUT_MEMORYVIEW)
+
+# RANDOM.ORG JSON-RPC API (Release 4) endpoint
+_API_URL                         = 'https://api.random.org/json-rpc/4/invoke'
+
 # Default backoff to use if no advisoryDelay backoff supplied by server
 _DEFAULT_DELAY                   = 1.0
 
+# Largest number of values a single request of each basic method may 
+# return, and the largest total size of a single request for integer 
+# sequences and for blobs, see: https://api.random.org/json-rpc/4/basic
+_MAX_N                           = { _INTEGER_METHOD: 10000, 
+                                     _INTEGER_SEQUENCES_METHOD: 1000, 
+                                     _DECIMAL_FRACTION_METHOD: 10000, 
+                                     _GAUSSIAN_METHOD: 10000, 
+                                     _STRING_METHOD: 10000, 
+                                     _UUID_METHOD: 1000, 
+                                     _BLOB_METHOD: 100 }
+_MAX_SEQUENCE_VALUES             = 10000
+_MAX_BLOB_BITS                   = 1048576
+
+# Largest number of tickets a single createTickets request may create, 
+# see: https://api.random.org/json-rpc/4/signed#createTickets
+_MAX_TICKETS                     = 50
+
+# Number of signatures verified locally by a process at a time, and the
+# largest number verified with the server in a single JSON-RPC batch
+_VERIFY_CHUNK_SIZE               = 256
+_VERIFY_BATCH_SIZE               = 100
+
+# Weight of the latest observation in a RandomOrgCache's smoothed 
+# consumption rate and request duration
+_CACHE_RATE_SMOOTHING            = 0.2
+
+# A RandomOrgCache issuing requests in bulk requests no more result sets 
+# at a time than it expects to be consumed within this many seconds
+_CACHE_DEMAND_HORIZON            = 60.0
+
+# Priority of requests issued by a RandomOrgCache, lower than the default 
+# priority 0 of all other requests
+_CACHE_REQUEST_PRIORITY          = -1
+
+# Start of the epoch in which times shared between processes are measured
+_EPOCH                           = datetime(1970, 1, 1)
+
+# Default size in bits of the blobs feeding a RandomOrgEntropyReservoir
+_ENTROPY_BLOB_SIZE               = 131072
+
+# Seconds between checks of a cache shared between processes: for result 
+# sets by waiting consumers, and of its level or whether it may fetch by 
+# the cache manager
+_SHARED_CACHE_POLL_INTERVAL      = 0.05
+_SHARED_CACHE_CHECK_INTERVAL     = 0.5
+
+# DER encoded object identifier of RSA public keys, and DigestInfo 
+# prefix of a SHA-512 digest in an EMSA-PKCS1-v1_5 encoded signature
+_RSA_ENCRYPTION_OID              = b'\x06\x09\x2a\x86\x48\x86\xf7\x0d\x01\x01\x01'
+_SHA512_DIGEST_INFO              = (b'\x30\x51\x30\x0d\x06\x09\x60\x86\x48\x01'
+                                    b'\x65\x03\x04\x02\x03\x05\x00\x04\x40')
+
+# Default number of keep-alive connections held open to the server and 
+# the time after which an unused connection pool is discarded
+_DEFAULT_HTTP_POOL_SIZE          = 10
+_DEFAULT_HTTP_IDLE_TIMEOUT       = 60.0
+
 # On request fetch fresh allowance state if current state data is older 
 # than this value
 _ALLOWANCE_STATE_REFRESH_SECONDS = 3600.0
@@ -235,27 +373,44 @@ class RandomOrgCache(object):
     obtained using RandomOrgClient's create_x_cache methods, never 
     created separately.
     
-    This class strives to keep a Queue of response results populated 
-    for instant access via its public get method. Work is done by a 
-    background Thread, which issues the appropriate request at suitable 
+    This class strives to keep a store of response results populated 
+    for instant access via its public get methods. Work is done by the 
+    background Thread of a cache manager shared by all caches of the 
+    RandomOrgClient, which issues the appropriate request at suitable 
     intervals.
     
+    The cache can also be iterated over, which yields responses as 
+    they become available until the cache is stopped and empty:
+    
+        >>> for result in c:
+        ...     use(result)
+    
+    Caches of decimal integers can instead keep their results in a 
+    preallocated ring buffer, from which any number of threads take 
+    result sets without acquiring a lock. Result sets are then returned
+    as array.array('l') objects rather than lists.
+    
     Public methods:
     
     stop -- instruct cache to stop repopulating itself.
     resume -- if cache is stopped, restart repopulation.
     get -- return a response for the request this RandomOrgCache 
         represents or raise a Queue.Empty exception.
+    get_many -- return several responses at once or raise a 
+        Queue.Empty exception.
     """
     
     def __init__(self, request_function, process_function, request, 
-                 cache_size, bulk_request_number=0, request_number=0):
+                 cache_size, bulk_request_number=0, request_number=0, 
+                 manager=None, low_watermark=None, high_watermark=None, 
+                 ring_buffer=False, path=None, shared=False, 
+                 output=_OUTPUT_LIST):
         """
         Constructor.
         
-        Initialize class and start Queue population Thread running as a
-        daemon. Should only be called by RandomOrgClient's 
-        create_x_cache methods.
+        Initialize class and register with the cache manager, which 
+        starts populating the store. Should only be called by 
+        RandomOrgClient's create_x_cache methods.
         
         Keyword arguments:
         
@@ -265,107 +420,95 @@ class RandomOrgCache(object):
         request -- request to send to server via request_function.
         cache_size -- number of request responses to try maintain.
         bulk_request_number -- if request is set to be issued in bulk, 
-            number of result sets in a bulk request (default 0).
+            number of result sets in a bulk request until the rate of 
+            consumption is known (default 0).
         request_number -- if request is set to be issued in bulk, 
             number of results in a single request (default 0).
+        manager -- _RandomOrgCacheManager populating the store, or None
+            for a cache manager of its own (default None).
+        low_watermark -- if request is set to be issued in bulk, number
+            of result sets at or below which the store is refilled 
+            (default cache_size//2).
+        high_watermark -- if request is set to be issued in bulk, 
+            number of result sets up to which the store is refilled 
+            (default cache_size).
+        ring_buffer -- keep result sets of request_number integers in a
+            ring buffer and return them as array.array('l') objects 
+            (default False).
+        path -- path of a file in which to keep result sets across 
+            restarts, or None to keep them in memory only. Can't be 
+            combined with ring_buffer (default None).
+        shared -- share the result sets kept in the file at path with 
+            the caches of other processes using the same path, one of 
+            which refills it (default False).
+        output -- 'numpy' if process_function returns NumPy arrays, 
+            so that result sets are sliced from them as views and 
+            restored as arrays from the file at path, 'bytes' or 
+            'memoryview' if it returns decoded blobs, so that these are
+            restored from the file at path (default 'list').
         """
         
         self._request_function = request_function
         self._process_function = process_function
         self._request = request
         
-        self._queue = Queue(cache_size)
-        
         self._bulk_request_number = bulk_request_number
         self._request_number = request_number
         
+        if ring_buffer and path is not None:
+            raise ValueError('A ring buffer cache can\'t be persisted')
+        if shared and path is None:
+            raise ValueError('A shared cache requires a path')
+        if ring_buffer and output == _OUTPUT_NUMPY:
+            raise ValueError('A ring buffer cache can\'t return NumPy arrays')
+        
+        self._output = output
+        
+        if ring_buffer:
+            self._store = _RandomOrgRingBuffer(cache_size, request_number)
+        elif shared:
+            self._store = _RandomOrgSharedStore(cache_size, path, 
+                                                self._persistence_header(), 
+                                                self._persistence_decoder())
+        elif path is not None:
+            self._store = _RandomOrgPersistentStore(cache_size, path, 
+                                                    self._persistence_header(), 
+                                                    self._persistence_decoder())
+        else:
+            self._store = _RandomOrgResultStore(cache_size)
+        
+        # Levels between which the store is kept if issuing requests in
+        # bulk, and the most result sets a single request may return.
+        if high_watermark is None:
+            high_watermark = cache_size
+        self._high_watermark = min(high_watermark, cache_size)
+        self._low_watermark = (cache_size//2 if low_watermark is None 
+                               else low_watermark)
+        self._max_bulk_request_number = self._max_result_sets()
+        
         # Handle integers with non-decimal base
         if 'base' in self._request['params']:
             self._decimal = self._request['params']['base'] == 10
         else:
             self._decimal = True
         
-        # Condition lock to allow notification when an item is consumed
-        # or pause state is updated.
-        self._lock = threading.Condition()
         self._paused = False
         
-        # Thread to keep RandomOrgCache populated.
-        self._thread = threading.Thread(target=self._populate_queue)
-        self._thread.daemon = True
-        self._thread.start()
-    
-    def _populate_queue(self):
-        # Keep issuing requests to server until Queue is full. When 
-        # Queue is full if requests are being issued in bulk, wait 
-        # until Queue has enough space to accomodate all of a bulk 
-        # request before issuing a new request, otherwise issue a new 
-        # request every time an item in the Queue has been consumed.
-        #
-        # Note that requests to the server are blocking, i.e., only one
-        # request will be issued by the cache at any given time.
-        
-        while True:
-            while self._paused:
-                self._lock.acquire()
-                self._lock.wait()
-                self._lock.release()
-                
-            # If we're issuing bulk requests...
-            if self._bulk_request_number > 0:
-                
-                # Is there space for a bulk response in the queue?
-                if self._queue.qsize() < (self._queue.maxsize 
-                                          - self._bulk_request_number):
-                    
-                    # Issue and process request and response.
-                    try:
-                        response = self._request_function(self._request)
-                        if self._decimal: 
-                            result = self._process_function(response)
-                        else:
-                            result = self._process_function(response, self._decimal)
-                        
-                        # Split bulk response into result sets.
-                        try:
-                            # Python 2.7
-                            for i in xrange(0, len(result), self._request_number):
-                                self._queue.put(result[i:i+self._request_number])    
-                    
-                        except NameError:
-                            # Python 3+
-                            for i in range(0, len(result), self._request_number):
-                                self._queue.put(result[i:i+self._request_number])
-                        
-                    except Exception as e:
-                        # Don't handle failures from _request_function()
-                        # Just try again later.
-                        logging.info("RandomOrgCache populate Exception: " + str(e))
-                    
-                # No space, sleep and wait for consumed notification.
-                else:
-                    self._lock.acquire()
-                    self._lock.wait()
-                    self._lock.release()
-            
-            # Not in bulk mode, repopulate queue as it empties.
-            elif not self._queue.full():
-                try:
-                    response = self._request_function(self._request)
-                    if self._decimal:
-                        self._queue.put(self._process_function(response))
-                    else:
-                        self._queue.put(self._process_function(response, self._decimal))
-                except Exception as e:
-                    # Don't handle failures from _request_function()
-                    # Just try again later.
-                    logging.info("RandomOrgCache populate Exception: " + str(e))
-            
-            # No space, sleep and wait for consumed notification.
-            else:
-                self._lock.acquire()
-                self._lock.wait()
-                self._lock.release()
+        # Smoothed number of result sets consumed per second, from 
+        # which the manager estimates when the cache will run empty, 
+        # and time before which a failed request isn't retried.
+        self._consumption_rate = 0.0
+        self._last_get_time = None
+        self._retry_time = 0
+        
+        # Smoothed time in seconds from issuing a request to receiving
+        # its response, including any wait for the advisory delay.
+        self._refill_duration = None
+        
+        if manager is None:
+            manager = _RandomOrgCacheManager()
+        self._manager = manager
+        self._manager.register(self)
     
     def stop(self):
         """
@@ -375,10 +518,10 @@ class RandomOrgCache(object):
         """
         
         self._paused = True
+        self._manager.notify()
         
-        self._lock.acquire()
-        self._lock.notify()
-        self._lock.release()
+        # Let iterators waiting for responses finish.
+        self._store.wake()
     
     def resume(self):
         """
@@ -388,1046 +531,2663 @@ class RandomOrgCache(object):
         """
         
         self._paused = False
+        self._manager.notify()
+    
+    def __iter__(self):
+        """
+        Iterate over responses.
         
-        self._lock.acquire()
-        self._lock.notify()
-        self._lock.release()
+        Yield responses for the request this RandomOrgCache represents 
+        as they become available, waiting as long as necessary, until 
+        the cache is stopped and empty.
+        """
+        
+        while True:
+            results = self._take(1, -1, True)
+            if not results:
+                return
+            yield results[0]
     
-    def get(self):
+    def get(self, timeout=0):
         """
         Get next response.
         
         Get next appropriate response for the request this 
-        RandomOrgCache represents or if Queue is empty raise a 
-        Queue.Empty exception.
-        """
+        RandomOrgCache represents or if none is available within 
+        timeout raise a Queue.Empty exception.
         
-        result = self._queue.get(False)
+        Keyword arguments:
         
-        self._lock.acquire()
-        self._lock.notify()
-        self._lock.release()
+        timeout -- time in seconds and fractions of seconds to wait for
+            a response if the cache is empty. Supply a value of -1 to 
+            wait indefinitely (default 0, i.e., don't wait).
+        """
         
-        return result
-    
-
-class RandomOrgClient(object):
-    """
-    RandomOrgClient main class through which API functions are accessed.
+        results = self._take(1, timeout)
+        if not results:
+            raise Empty
+        
+        return results[0]
     
-    This class provides either serialized or unserialized (determined 
-    on class creation) access to both the signed and unsigned methods 
-    of the RANDOM.ORG API. These are threadsafe and implemented as 
-    blocking remote procedure calls.
+    def get_many(self, k, timeout=0):
+        """
+        Get several responses.
+        
+        Get up to k appropriate responses for the request this 
+        RandomOrgCache represents at once, as a list. Waits up to 
+        timeout for k responses to be available and then returns those
+        available, or raises a Queue.Empty exception if there are none.
+        
+        Keyword arguments:
+        
+        k -- maximum number of responses to return.
+        timeout -- time in seconds and fractions of seconds to wait for
+            k responses to be available. Supply a value of -1 to wait 
+            indefinitely (default 0, i.e., don't wait).
+        """
+        
+        results = self._take(k, timeout)
+        if not results:
+            raise Empty
+        
+        return results
     
-    If requests are to be issued serially a background Thread will 
-    maintain a Queue of requests to process in sequence. 
+    def _take(self, k, timeout, until_stopped=False):
+        # Remove up to k result sets from the store, updating the 
+        # consumption rate and notifying the manager once.
+        deadline = None if timeout == -1 else _monotonic() + timeout
+        stopped = (lambda: self._paused) if until_stopped else None
+        
+        results = self._store.take(k, deadline, stopped)
+        
+        if results:
+            # Update consumption rate.
+            now = _monotonic()
+            if self._last_get_time is not None:
+                interval = max(now - self._last_get_time, 1e-6)
+                self._consumption_rate += (_CACHE_RATE_SMOOTHING 
+                                           * (len(results) / interval 
+                                              - self._consumption_rate))
+            self._last_get_time = now
+            
+            self._manager.notify()
+        
+        return results
     
-    The class also provides access to creation of a convenience class,
-    RandomOrgCache, for precaching API responses when the request is 
-    known in advance.
+    def _needs_refill(self, now):
+        # Whether a request should be issued now. If requests are 
+        # issued in bulk, wait until the store has dropped to the low 
+        # watermark, raised to what will be consumed while a request 
+        # is under way, otherwise issue a new request every time an 
+        # item in the store has been consumed.
+        if self._paused or now < self._retry_time:
+            return False
+        
+        if self._bulk_request_number > 0:
+            low_watermark = max(self._low_watermark, 
+                                self._expected_consumption(now, 
+                                                           self._refill_duration))
+            needed = len(self._store) <= min(low_watermark, 
+                                             self._high_watermark - 1)
+        else:
+            needed = len(self._store) < self._store.capacity
+        
+        # A store shared between processes is consumed from unnoticed 
+        # by the cache manager and only refilled by one process, so 
+        # check it again after a while.
+        if self._store.shared and not (needed and self._store.fetching()):
+            self._retry_time = now + _SHARED_CACHE_CHECK_INTERVAL
+            return False
+        
+        return needed
     
-    This class will only allow the creation of one instance per API 
-    key. If an instance of this class already exists for a given key, 
-    that instance will be returned on init instead of a new instance.
+    def _bulk_size(self, now):
+        # Number of result sets to request: enough to fill the store to
+        # the high watermark, but no more than is expected to be 
+        # consumed within _CACHE_DEMAND_HORIZON or the API allows. 
+        # Until the rate of consumption is known, the initial number.
+        space = self._high_watermark - len(self._store)
+        
+        if self._last_get_time is None:
+            sets = self._bulk_request_number
+        else:
+            sets = max(self._expected_consumption(now, _CACHE_DEMAND_HORIZON),
+                       self._expected_consumption(now, self._refill_duration), 
+                       1)
+        
+        return max(1, min(sets, space, self._max_bulk_request_number))
     
-    This class obeys most of the guidelines set forth in 
-    https://api.random.org/json-rpc/4
-    All requests respect the server's advisoryDelay returned in any 
-    responses, or use _DEFAULT_DELAY if no advisoryDelay is returned. If
-    the supplied API key is has exceeded its daily request allowance, 
-    this implementation will back off until midnight UTC.
+    def _expected_consumption(self, now, duration):
+        # Number of result sets expected to be consumed within duration.
+        if duration is None or self._last_get_time is None:
+            return 0
+        
+        rate = min(self._consumption_rate, 
+                   1.0 / max(now - self._last_get_time, 1e-6))
+        return int(math.ceil(rate * duration))
     
-    Public methods:
+    def _max_result_sets(self):
+        # Most result sets a single request may return, see _MAX_N.
+        method = self._request['method']
+        params = self._request['params']
+        
+        if (self._request_number <= 0 or method not in _MAX_N 
+                or isinstance(params.get('length'), list)):
+            return max(self._bulk_request_number, 1)
+        
+        sets = _MAX_N[method] // self._request_number
+        
+        if method == _INTEGER_SEQUENCES_METHOD:
+            sets = min(sets, _MAX_SEQUENCE_VALUES 
+                       // (self._request_number * params['length']))
+        elif method == _BLOB_METHOD:
+            sets = min(sets, _MAX_BLOB_BITS 
+                       // (self._request_number * params['size']))
+        
+        return max(sets, 1)
     
-    Basic methods for generating randomness, see:
-        https://api.random.org/json-rpc/4/basic
+    def _time_to_empty(self, now):
+        # Estimated time in seconds until the store runs empty. The 
+        # rate decays while no result sets are consumed.
+        size = len(self._store)
+        if size == 0:
+            return 0.0
+        
+        rate = self._consumption_rate
+        if self._last_get_time is not None:
+            rate = min(rate, 1.0 / max(now - self._last_get_time, 1e-6))
+        
+        return size / rate if rate > 0 else float('inf')
     
-    generate_integers -- get a list of random integers.
-    generate_integer_sequences -- get sequences of random integers.
-    generate_decimal_fractions -- get a list of random doubles.
-    generate_gaussians -- get a list of random numbers.
-    generate_strings -- get a list of random strings.
-    generate_UUIDs -- get a list of random UUIDs.
-    generate_blobs -- get a list of random blobs.
+    def _persistence_header(self):
+        # Identify the result sets of this request on disk, regardless 
+        # of API key and the number of result sets requested at a time.
+        params = dict((key, value) for key, value 
+                      in self._request['params'].items() 
+                      if key not in ('apiKey', 'n'))
+        return json.dumps({ 'method':self._request['method'], 
+                            'params':params, 
+                            'requestNumber':self._request_number }, 
+                          sort_keys=True)
     
-    Signed methods for generating randomness, see:
-        https://api.random.org/json-rpc/4/signed
+    def _persistence_decoder(self):
+        # Restore the UUID objects, NumPy arrays and decoded blobs 
+        # written to disk as strings, lists and base64 strings.
+        if self._request['method'] == _UUID_METHOD:
+            return lambda result: list(map(uuid.UUID, result))
+        if self._output == _OUTPUT_NUMPY:
+            return numpy.array
+        if self._output == _OUTPUT_BYTES:
+            return lambda result: list(map(base64.b64decode, result))
+        if self._output == _OUTPUT_MEMORYVIEW:
+            return lambda result: [memoryview(base64.b64decode(value)) 
+                                   for value in result]
+        return None
     
-    generate_signed_integers -- get a signed response containing a list
-        of random integers and a signature.
-    generate_signed_integer_sequences -- get a signed response 
-        containing sequences of random integers and a signature.    
-    generate_signed_decimal_fractions -- get a signed response
-        containing a list of random doubles and a signature.
-    generate_signed_gaussians -- get a signed response containing a
-        list of random numbers and a signature.
-    generate_signed_strings -- get a signed response containing a list
-        of random strings and a signature.
-    generate_signed_UUIDs -- get a signed response containing a list of
-        random UUIDs and a signature.
-    generate_signed_blobs -- get a signed response containing a list of
-        random blobs and a signature.
+    def _refill(self):
+        # Issue and process request and response, splitting a bulk 
+        # response into result sets.
+        start = _monotonic()
         
-    Retrieving previously generated signed results (within 24h), see:
-        https://api.random.org/json-rpc/4/signed#getResult
-    
-    get_result -- retrieve previously generated signed results using
-       a serial number (restricted to within 24 hours after generation)
-    
-    Tickets for use in methods which generate signed random values, see:
-       https://api.random.org/json-rpc/4/signed
+        request = self._request
+        if self._bulk_request_number > 0:
+            sets = self._bulk_size(start)
+            request = dict(request, params=dict(request['params'], 
+                                                n=sets * self._request_number))
+        
+        try:
+            response = self._request_function(request)
+            if self._decimal:
+                result = self._process_function(response)
+            else:
+                result = self._process_function(response, self._decimal)
+        except Exception as e:
+            # Don't handle failures from _request_function()
+            # Just try again later.
+            logging.info("RandomOrgCache populate Exception: " + str(e))
+            self._retry_time = _monotonic() + _DEFAULT_DELAY
+            return
+        
+        # Update refill duration.
+        duration = _monotonic() - start
+        if self._refill_duration is None:
+            self._refill_duration = duration
+        else:
+            self._refill_duration += (_CACHE_RATE_SMOOTHING 
+                                      * (duration - self._refill_duration))
+        
+        if self._bulk_request_number > 0:
+            self._store.put([result[i:i+self._request_number] 
+                             for i in range(0, len(result), 
+                                            self._request_number)])
+        else:
+            self._store.put([result])
+
+
+class RandomOrgEntropyReservoir(object):
+    """
+    RandomOrgEntropyReservoir for drawing typed values from precached 
+    random bits.
     
-    create_tickets -- create tickets for use in methods that generate
-       random values with signatures
-    list_tickets -- obtain a list of tickets of a certain type (singleton,
-      head or tail)
-    get_ticket -- obtain information on a single ticket
+    Instances should only be obtained using RandomOrgClient's 
+    create_entropy_reservoir method, never created separately.
     
-    Signature verification for signed methods, see:
-        https://api.random.org/json-rpc/4/signed
+    A reservoir draws on a RandomOrgCache of large blobs and derives 
+    integers, decimal fractions, UUIDs and strings of any parameters 
+    from their bits locally, so that a single bulk request serves every
+    type of value and no bits are spent on the decimal or JSON encoding
+    of typed responses:
     
-    verify_signature -- verify a response against its signature.
+        >>> e = r.create_entropy_reservoir()
+        >>> e.get_integers(5, 1, 6)
+        [3, 6, 1, 1, 4]
+        >>> e.get_UUIDs(1)
+        [UUID('9c5ba6a5-5f2e-4ef5-a3a6-64c8d1d8b8f0')]
     
-    # Methods used to create a cache for any given randomness request.
+    Integers are drawn without bias by rejection sampling using the 
+    least number of bits covering their range, decimal fractions are 
+    uniform doubles in [0, 1) made from 53 bits, UUIDs are version 4 
+    UUIDs as defined in RFC 4122 and strings pick each character 
+    uniformly from the given alphabet. Bits are never used twice.
     
-    create_integer_cache -- get a RandomOrgCache from which to obtain a 
-        list of random integers.
-    create_integer_sequences_cache - get a RandomCache from which to 
-        obtain sequences of random integers.
-    create_decimal_fraction_cache -- get a RandomOrgCache from which to
-        obtain a list of random doubles.
-    create_gaussian_cache -- get a RandomOrgCache from which to obtain
-        a list of random numbers.
-    create_string_cache -- get a RandomOrgCache from which to obtain a
-        list of random strings.
-    create_UUID_cache -- get a RandomOrgCache from which to obtain a
-        list of random UUIDs.
-    create_blob_cache -- get a RandomOrgCache from which to obtain a
-        list of random blobs.
+    If not enough bits are available within the given timeout a 
+    Queue.Empty exception is raised. Bits drawn for the failed call are
+    discarded.
     
-    # Methods for accessing server usage statistics
+    Public methods:
     
-    get_requests_left -- get estimated number of remaining API requests.
-    get_bits_left -- get estimated number of bits left.    
+    stop -- instruct the blob cache to stop repopulating itself.
+    resume -- if the blob cache is stopped, restart repopulation.
+    get_integers -- get a list of random integers.
+    get_decimal_fractions -- get a list of random doubles in [0, 1).
+    get_UUIDs -- get a list of random version 4 UUIDs.
+    get_strings -- get a list of random strings.
     """
     
-    # Maintain a dictionary of API keys and their instances.
-    __key_indexed_instances = {}
-    
-    def __new__(cls, *args, **kwds):
+    def __init__(self, cache):
         """
-        Instance creation.
+        Constructor.
         
-        Ensure only one instance of RandomOrgClient exists per API key.
-        Create a new instance if the supplied key isn't already known, 
-        otherwise return the previously instantiated one.
+        Initialize class. Should only be called by RandomOrgClient's 
+        create_entropy_reservoir method.
+        
+        Keyword arguments:
+        
+        cache -- RandomOrgCache of base64 encoded blobs, one blob per 
+            result set.
         """
-        instance = RandomOrgClient.__key_indexed_instances.get(args[0], 
-                                                               None)
         
-        if instance is None:
-            instance = object.__new__(cls)
-            RandomOrgClient.__key_indexed_instances[args[0]] = instance
+        self._cache = cache
         
-        return instance
+        self._lock = threading.Lock()
+        
+        # Bytes of the current blob not yet turned into bits.
+        self._blob = bytearray()
+        self._offset = 0
+        
+        # Unused bits, as an integer and its number of bits.
+        self._bits = 0
+        self._bit_count = 0
     
-    def __init__(self, api_key, 
-                 blocking_timeout=24.0*60.0*60.0, http_timeout=120.0, 
-                 serialized=True):
+    def stop(self):
         """
-        Constructor.
+        Stop reservoir.
         
-        Initialize class and start serialized request sending Thread 
-        running as a daemon if applicable.
+        The blob cache will not continue to populate itself. Bits 
+        already obtained can still be drawn.
+        """
         
-        Keyword arguments:
+        self._cache.stop()
+    
+    def resume(self):
+        """
+        Resume reservoir.
         
-        api_key -- API key obtained from the RANDOM.ORG website, see: 
-            https://api.random.org/api-keys
-        blocking_timeout -- maximum time in seconds and fractions of 
-            seconds to wait before being allowed to send a request. 
-            Note this is a hint not a guarantee. Be advised advisory 
-            delay from server must always be obeyed. Supply a value 
-            of -1 to allow blocking forever. (default 24.0*60.0*60.0,
-            i.e., 1 day)
-        http_timeout -- maximum time in seconds and fractions of 
-            seconds to wait for the server response to a request.
-            (default 120.0).
-        serialized -- determines whether or not requests from this 
-            instance will be added to a Queue and issued serially or 
-            sent when received, obeying any advisory delay (default 
-            True).
+        The blob cache will resume populating itself if stopped.
         """
         
-        # __init__ will always be called after __new__, but if an 
-        # instance already exists for the API key we want to bail 
-        # before actually doing anything in init.
-        if not hasattr(self, '_api_key'):
-            
-            if serialized:
-                # set send function
-                self._send_request = self._send_serialized_request
-            
-                # set up the serialized request Queue and Thread
-                self._serialized_queue = Queue()
-            
-                self._serialized_thread = threading.Thread(target=self._threaded_request_sending)
-                self._serialized_thread.daemon = True
-                self._serialized_thread.start()
-            else:
-                # set send function
-                self._send_request = self._send_unserialized_request
+        self._cache.resume()
+    
+    def get_integers(self, n, min, max, timeout=0):
+        """
+        Get random integers.
         
-            self._api_key = api_key
-            self._blocking_timeout = blocking_timeout
-            self._http_timeout = http_timeout
+        Return a list of n true random integers within a user-defined 
+        range, each drawn with equal probability.
         
-            # maintain info to obey server advisory delay
-            self._advisory_delay_lock = threading.Lock()
-            self._advisory_delay = 0
-            self._last_response_received_time = 0
+        Raises a Queue.Empty exception if not enough bits are available
+        within timeout.
         
-            # maintain usage statistics from server
-            self._requests_left = None
-            self._bits_left = None
+        Keyword arguments:
         
-            # backoff info for when API key is detected as not running - 
-            # probably because key has exceeded its daily usage limit. 
-            # Backoff runs until midnight UTC.
-            self._backoff = None
-            self._backoff_error = None
-            
-        else:
-            logging.info("Using RandomOrgClient instance already created for key \"" 
-                         + api_key + "\"")
-    
-    
-    # Basic methods for generating randomness, see:
-    # https://api.random.org/json-rpc/4/basic
-    
-    def generate_integers(self, n, min, max, replacement=True, base=10, 
-                          pregenerated_randomization=None):
+        n -- How many random integers you need.
+        min -- The lower boundary for the range from which the random 
+            numbers will be picked.
+        max -- The upper boundary for the range from which the random 
+            numbers will be picked.
+        timeout -- time in seconds and fractions of seconds to wait for
+            bits if the reservoir is empty. Supply a value of -1 to 
+            wait indefinitely (default 0, i.e., don't wait).
         """
-        Generate random integers.
         
-        Request and return a list (size n) of true random integers 
-        within a user-defined range from the server. See:
-        https://api.random.org/json-rpc/4/basic#generateIntegers
+        if max < min:
+            raise ValueError('max must not be less than min')
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        deadline = self._deadline(timeout)
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        self._lock.acquire()
+        try:
+            return [min + self._below(max - min + 1, deadline) 
+                    for _ in range(n)]
+        finally:
+            self._lock.release()
+    
+    def get_decimal_fractions(self, n, timeout=0):
+        """
+        Get random decimal fractions.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        Return a list of n true random doubles, uniformly distributed 
+        over the multiples of 2**-53 in [0, 1).
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        Raises a Queue.Empty exception if not enough bits are available
+        within timeout.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        n -- How many random decimal fractions you need.
+        timeout -- time in seconds and fractions of seconds to wait for
+            bits if the reservoir is empty. Supply a value of -1 to 
+            wait indefinitely (default 0, i.e., don't wait).
+        """
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        deadline = self._deadline(timeout)
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._lock.acquire()
+        try:
+            return [self._take_bits(53, deadline) / 9007199254740992.0 
+                    for _ in range(n)]
+        finally:
+            self._lock.release()
+    
+    def get_UUIDs(self, n, timeout=0):
+        """
+        Get random UUIDs.
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        Return a list of n true random version 4 UUIDs, see RFC 4122 
+        section 4.4.
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        Raises a Queue.Empty exception if not enough bits are available
+        within timeout.
         
         Keyword arguments:
         
-        n -- How many random integers you need. Must be within the 
-            [1,1e4] range.
-        min -- The lower boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        max -- The upper boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        replacement -- Specifies whether the random numbers should be 
-            picked with replacement. If True the resulting numbers may 
-            contain duplicate values, otherwise the numbers will all be
-            unique (default True).
-        base -- The base used to display the numbers in the sequences.
-            Must be an integer with the value 2, 8, 10 or 16.
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
+        n -- How many random UUIDs you need.
+        timeout -- time in seconds and fractions of seconds to wait for
+            bits if the reservoir is empty. Supply a value of -1 to 
+            wait indefinitely (default 0, i.e., don't wait).
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'min':min, 'max':max, 
-                  'replacement':replacement, 'base':base, 
-                  'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_INTEGER_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_ints(response, base == 10)
+        deadline = self._deadline(timeout)
+        
+        self._lock.acquire()
+        try:
+            # The version and variant overwrite 6 of the 128 bits.
+            return [uuid.UUID(int=self._take_bits(128, deadline), version=4) 
+                    for _ in range(n)]
+        finally:
+            self._lock.release()
     
-    def generate_integer_sequences(self, n, length, min, max, replacement=True, 
-                                   base=10, pregenerated_randomization=None):
+    def get_strings(self, n, length, characters, timeout=0):
         """
-        Generate random integer sequences.
-        
-        Request and return a list (size n) of uniform or multiform 
-        sequences of true random integers 
-        within a user-defined range from the server. See:
-        https://api.random.org/json-rpc/4/basic#generateIntegerSequences
+        Get random strings.
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        Return a list of n true random strings, each character picked 
+        with equal probability from characters.
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        Raises a Queue.Empty exception if not enough bits are available
+        within timeout.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        Keyword arguments:
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        n -- How many random strings you need.
+        length -- The length of each string.
+        characters -- A string that contains the set of characters that
+            are allowed to occur in the random strings.
+        timeout -- time in seconds and fractions of seconds to wait for
+            bits if the reservoir is empty. Supply a value of -1 to 
+            wait indefinitely (default 0, i.e., don't wait).
+        """
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        if not characters:
+            raise ValueError('characters must not be empty')
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        deadline = self._deadline(timeout)
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        self._lock.acquire()
+        try:
+            return [''.join(characters[self._below(len(characters), deadline)] 
+                            for _ in range(length)) 
+                    for _ in range(n)]
+        finally:
+            self._lock.release()
+    
+    def _deadline(self, timeout):
+        # Monotonic time until which to wait for blobs, None for ever.
+        return None if timeout == -1 else _monotonic() + timeout
+    
+    def _below(self, r, deadline):
+        # Unbiased random integer in [0, r), rejecting values drawn 
+        # with the least number of bits covering the range which fall 
+        # outside of it.
+        count = (r - 1).bit_length()
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        while True:
+            value = self._take_bits(count, deadline)
+            if value < r:
+                return value
+    
+    def _take_bits(self, count, deadline):
+        # Remove count bits from the reservoir as an integer, refilling
+        # the unused bits whole bytes at a time from the blobs.
+        if self._bit_count < count:
+            size = max((count - self._bit_count + 7) // 8, 8)
+            chunk = self._take_bytes(size, deadline)
+            self._bits = (self._bits << (8 * size)) | int(binascii.hexlify(chunk), 16)
+            self._bit_count += 8 * size
+        
+        self._bit_count -= count
+        value = self._bits >> self._bit_count
+        self._bits &= (1 << self._bit_count) - 1
+        
+        return value
+    
+    def _take_bytes(self, size, deadline):
+        # Remove size bytes from the blobs, getting further blobs from 
+        # the cache as necessary.
+        chunk = bytearray()
+        
+        while len(chunk) < size:
+            if self._offset >= len(self._blob):
+                timeout = -1
+                if deadline is not None:
+                    timeout = max(deadline - _monotonic(), 0)
+                
+                # Drop any bits already taken rather than reuse them.
+                try:
+                    blob = self._cache.get(timeout)[0]
+                except Empty:
+                    self._bits = 0
+                    self._bit_count = 0
+                    raise
+                
+                self._blob = bytearray(base64.b64decode(blob))
+                self._offset = 0
+            
+            end = min(self._offset + size - len(chunk), len(self._blob))
+            chunk += self._blob[self._offset:end]
+            self._offset = end
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        return bytes(chunk)
+
+
+class RandomOrgLedger(object):
+    """
+    RandomOrgLedger keeping signed results in an append-only file.
+    
+    A RandomOrgClient created with a ledger records every signed result
+    it receives, and its get_result method answers from the ledger 
+    before asking the server, which only keeps results for 24 hours:
+    
+        >>> ledger = RandomOrgLedger('/var/lib/myapp/ledger')
+        >>> r = RandomOrgClient(YOUR_API_KEY_HERE, ledger=ledger)
+        >>> s = r.generate_signed_integers(5, 0, 10)
+        >>> ledger.get(s['random']['serialNumber'])['data']
+        [3, 9, 0, 4, 4]
+    
+    Each result is appended to the file as a line of JSON and synced to
+    disk. On opening, the file is read once to index the results by 
+    serialNumber, ticketId and completionTime in memory, so that any 
+    result is then found with a single read. A line left incomplete by 
+    a crash is discarded. Serial numbers are only unique per API key, 
+    so a ledger must not be shared by clients of different keys, e.g., 
+    by those of a RandomOrgClientPool. Results already recorded are 
+    ignored.
+    
+    Results are returned like those of RandomOrgClient's get_result 
+    method, i.e., as a dictionary of the data, random and signature 
+    fields.
+    
+    Public methods:
+    
+    record -- record a signed result.
+    get -- get a signed result by serialNumber.
+    get_by_ticket -- get the signed result of a ticket.
+    get_range -- get the signed results completed in a period of time.
+    close -- close the file.
+    """
+    
+    def __init__(self, path):
+        """
+        Constructor.
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        Open the ledger's file, creating it if necessary, and index the
+        results recorded in it.
         
         Keyword arguments:
         
-        n -- How many integer sequences you need. Must be within the 
-            [1,1e3] range.
-        length -- Lengths of the sequences requested. Uniform: Must be 
-            an integer within the [1,1e4] range. Multiform: an array of 
-            length n where each value is within the [1,1e4] range and 
-            the sum of all n values is within the [1,1e4] range.  
-        min -- The lower boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        max -- The upper boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        replacement -- Specifies whether the random numbers should be 
-            picked with replacement. If True the resulting numbers may 
-            contain duplicate values, otherwise the numbers will all be
-            unique (default True). For multiform sequences this can be
-            an array of n boolean values, each specifying whether the 
-            sequence identified by its index will be created with (true) 
-            or without (false) replacement.
-        base -- The base used to display the numbers in the sequences.
-            Must be an integer with the value 2, 8, 10 or 16. For multiform
-            sequences the values may be an array of length n with values 
-            taken from the same set.  
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
-        """
-        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 'min':min, 
-                  'max':max, 'replacement':replacement, 'base':base, 
-                  'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_INTEGER_SEQUENCES_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_int_sequences(response, base == 10)
-    
-    def generate_decimal_fractions(self, n, decimal_places, replacement=True, 
-                                   pregenerated_randomization=None):
+        path -- path of the file in which results are kept.
         """
-        Generate random decimal fractions.
         
-        Request and return a list (size n) of true random decimal 
-        fractions, from a uniform distribution across the [0,1] 
-        interval with a user-defined number of decimal places from the
-        server. See:
-        https://api.random.org/json-rpc/4/basic#generateDecimalFractions
+        self._lock = threading.Lock()
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        # file offsets by serialNumber and serialNumbers by ticketId
+        self._offsets = {}
+        self._tickets = {}
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        # (completionTime, serialNumber) tuples in ascending order
+        self._times = []
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        self._file = open(path, 'a+b')
+        self._load()
+    
+    def __len__(self):
+        return len(self._offsets)
+    
+    def record(self, random, signature):
+        """
+        Record a signed result.
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        Append the result to the ledger unless its serialNumber has 
+        already been recorded.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        random -- The random field from a response returned by 
+            RANDOM.ORG through one of the Signed API methods.
+        signature -- The signature field from the same response.
+        """
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        line = ('{"random":' + _signed_json(random) + ',"signature":' 
+                + json.dumps(signature) + '}')
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._lock.acquire()
+        try:
+            if random['serialNumber'] in self._offsets:
+                return
+            
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(line.encode('utf-8') + b'\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            
+            self._index(random, offset)
+        finally:
+            self._lock.release()
+    
+    def get(self, serial_number):
+        """
+        Get a signed result by its serialNumber, or None if not 
+        recorded.
+        """
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._lock.acquire()
+        try:
+            offset = self._offsets.get(serial_number)
+            if offset is None:
+                return None
+            return self._read(offset)
+        finally:
+            self._lock.release()
+    
+    def get_by_ticket(self, ticket_id):
+        """
+        Get the signed result generated with a ticket, or None if not 
+        recorded.
+        """
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        self._lock.acquire()
+        try:
+            serial_number = self._tickets.get(ticket_id)
+            if serial_number is None:
+                return None
+            return self._read(self._offsets[serial_number])
+        finally:
+            self._lock.release()
+    
+    def get_range(self, start, end):
+        """
+        Get the signed results completed in a period of time.
+        
+        Return a list of the signed results whose completionTime is at 
+        or after start and before end, in the order of completion.
         
         Keyword arguments:
         
-        n -- How many random decimal fractions you need. Must be within
-            the [1,1e4] range.
-        decimal_places -- The number of decimal places to use. Must be 
-            within the [1,20] range.
-        replacement -- Specifies whether the random numbers should be 
-            picked with replacement. If True the resulting numbers may 
-            contain duplicate values, otherwise the numbers will all be
-            unique (default True).
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
+        start -- start of the period, as a UTC datetime or string in 
+            the format of completionTime, e.g., '2014-05-19 14:26:14Z'.
+        end -- end of the period, in the same format as start.
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 
-                   'decimalPlaces':decimal_places, 'replacement':replacement, 
-                   'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_DECIMAL_FRACTION_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_doubles(response)
+        start = self._completion_time(start)
+        end = self._completion_time(end)
+        
+        self._lock.acquire()
+        try:
+            first = bisect.bisect_left(self._times, (start,))
+            last = bisect.bisect_left(self._times, (end,))
+            return [self._read(self._offsets[serial_number]) 
+                    for _, serial_number in self._times[first:last]]
+        finally:
+            self._lock.release()
     
-    def generate_gaussians(self, n, mean, standard_deviation, significant_digits, 
-                           pregenerated_randomization=None):
+    def close(self):
+        """
+        Close the ledger's file.
         """
-        Generate random numbers.
         
-        Request and return a list (size n) of true random numbers from 
-        a Gaussian distribution (also known as a normal distribution). 
-        The form uses a Box-Muller Transform to generate the Gaussian 
-        distribution from uniformly distributed numbers. See:
-        https://api.random.org/json-rpc/4/basic#generateGaussians
+        self._lock.acquire()
+        try:
+            self._file.close()
+        finally:
+            self._lock.release()
+    
+    def _load(self):
+        # Index the results in the file, truncating a line left 
+        # incomplete by a crash.
+        self._file.seek(0)
+        offset = 0
+        
+        for line in self._file:
+            if not line.endswith(b'\n'):
+                logging.info('RandomOrgLedger discarding incomplete line')
+                self._file.truncate(offset)
+                break
+            
+            self._index(json.loads(line.decode('utf-8'))['random'], offset)
+            offset += len(line)
+    
+    def _index(self, random, offset):
+        # Index a result recorded at offset.
+        serial_number = random['serialNumber']
+        self._offsets[serial_number] = offset
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        if random.get('ticketData'):
+            self._tickets[random['ticketData']['ticketId']] = serial_number
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        bisect.insort(self._times, (random['completionTime'], serial_number))
+    
+    def _read(self, offset):
+        # Read the result recorded at offset, keeping the order of the 
+        # fields and the text of the numbers of random.
+        self._file.seek(offset)
+        entry = json.loads(self._file.readline().decode('utf-8'), 
+                           object_pairs_hook=OrderedDict, 
+                           parse_float=_RandomOrgFloat)
+        
+        return { 'data':entry['random']['data'], 'random':entry['random'], 
+                'signature':entry['signature'] }
+    
+    def _completion_time(self, time):
+        # Time as a string comparable with completionTime.
+        if isinstance(time, datetime):
+            return time.strftime('%Y-%m-%d %H:%M:%SZ')
+        return time
+
+
+class RandomOrgSerialMonitor(object):
+    """
+    RandomOrgSerialMonitor tracking the serial numbers of signed 
+    results.
+    
+    A RandomOrgClient created with a serial monitor records the 
+    serialNumber of every new signed result it receives, per API key, 
+    so that any results missing from the sequence, received twice or 
+    received after a later one are known as soon as they occur:
+    
+        >>> m = RandomOrgSerialMonitor()
+        >>> r = RandomOrgClient(YOUR_API_KEY_HERE, serial_monitor=m)
+        ...
+        >>> m.get_stats()[HASHED_KEY_HERE]['missing']
+        0
+    
+    The serial numbers received are kept as a set of disjoint 
+    intervals, so memory grows with the number of gaps rather than the
+    number of results, and statistics are kept per day of completion.
+    Results retrieved again with get_result are not new and are 
+    ignored. A monitor may be shared by the clients of several API 
+    keys, e.g., by those of a RandomOrgClientPool, as keys are told 
+    apart by the hashedApiKey of each result. Serial numbers before the
+    first one received are unknown, so a gap can only be detected 
+    between results received.
+    
+    Public methods:
+    
+    record -- record the serialNumber of a signed result.
+    get_stats -- get statistics of the serial numbers of each API key.
+    get_gaps -- get the ranges of serial numbers missing for a key.
+    get_report -- get statistics, gaps and daily statistics of each
+        API key.
+    """
+    
+    def __init__(self):
+        """
+        Constructor.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        Initialize class.
+        """
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        self._lock = threading.Lock()
+        self._keys = {}
+    
+    def record(self, random):
+        """
+        Record the serialNumber of a new signed result.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        random -- The random field from a response returned by 
+            RANDOM.ORG through one of the Signed API methods.
+        """
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        serial_number = random['serialNumber']
+        day = random['completionTime'][:10]
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._lock.acquire()
+        try:
+            key = self._keys.get(random['hashedApiKey'])
+            if key is None:
+                key = {'starts': [], 'ends': [], 'received': 0, 
+                       'duplicates': 0, 'out_of_order': 0, 'days': {}}
+                self._keys[random['hashedApiKey']] = key
+            
+            stats = key['days'].get(day)
+            if stats is None:
+                stats = {'received': 0, 'duplicates': 0, 'out_of_order': 0}
+                key['days'][day] = stats
+            
+            late = len(key['ends']) > 0 and serial_number < key['ends'][-1]
+            
+            if not self._insert(key, serial_number):
+                logging.info('RandomOrgSerialMonitor serialNumber ' 
+                             + str(serial_number) + ' received twice')
+                counter = 'duplicates'
+            elif late:
+                counter = 'out_of_order'
+            else:
+                counter = None
+            
+            for counts in (key, stats):
+                counts['received'] += 1
+                if counter is not None:
+                    counts[counter] += 1
+        finally:
+            self._lock.release()
+    
+    def get_stats(self):
+        """
+        Get statistics of the serial numbers of each API key.
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        Return a dictionary of statistics by hashedApiKey, each a 
+        dictionary of the first and last serialNumber received, the 
+        number of results received, the number of serial numbers 
+        missing in between, and the number of results received twice
+        or after a later one.
+        """
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        self._lock.acquire()
+        try:
+            return dict((hashed_api_key, self._stats(key)) 
+                        for hashed_api_key, key in self._keys.items())
+        finally:
+            self._lock.release()
+    
+    def get_gaps(self, hashed_api_key):
+        """
+        Get the ranges of serial numbers missing for an API key.
+        
+        Return a list of (first, last) tuples of the inclusive ranges 
+        of serial numbers not received between the first and last one 
+        received, in ascending order.
         
         Keyword arguments:
         
-        n -- How many random numbers you need. Must be within the 
-            [1,1e4] range.
-        mean -- The distribution's mean. Must be within the [-1e6,1e6] 
-            range.
-        standard_deviation -- The distribution's standard deviation. 
-            Must be within the [-1e6,1e6] range.
-        significant_digits -- The number of significant digits to use. 
-            Must be within the [2,20] range.
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
+        hashed_api_key -- The hashedApiKey of the results of the key.
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'mean':mean,
-                   'standardDeviation':standard_deviation, 
-                   'significantDigits':significant_digits, 
-                   'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_GAUSSIAN_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_doubles(response)
+        self._lock.acquire()
+        try:
+            key = self._keys.get(hashed_api_key)
+            if key is None:
+                return []
+            return self._gaps(key)
+        finally:
+            self._lock.release()
     
-    def generate_strings(self, n, length, characters, replacement=True, 
-                         pregenerated_randomization=None):
+    def get_report(self):
         """
-        Generate random strings.
-        
-        Request and return a list (size n) of true random unicode 
-        strings from the server. See:
-        https://api.random.org/json-rpc/4/basic#generateStrings
+        Get a report of the serial numbers of each API key.
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
-        
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        Return a dictionary by hashedApiKey of the statistics returned
+        by get_stats, with the gaps returned by get_gaps under 'gaps', 
+        and under 'days' the number of results received, received 
+        twice and received after a later one by day of completion in 
+        the format 'YYYY-MM-DD'.
+        """
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        self._lock.acquire()
+        try:
+            report = {}
+            for hashed_api_key, key in self._keys.items():
+                report[hashed_api_key] = self._stats(key)
+                report[hashed_api_key]['gaps'] = self._gaps(key)
+                report[hashed_api_key]['days'] = dict((day, dict(stats)) 
+                                                      for day, stats 
+                                                      in key['days'].items())
+            return report
+        finally:
+            self._lock.release()
+    
+    def _insert(self, key, serial_number):
+        # Add serial_number to the key's disjoint intervals, merging it
+        # with its neighbours. Return False if already present.
+        starts = key['starts']
+        ends = key['ends']
+        
+        i = bisect.bisect_right(starts, serial_number) - 1
+        if i >= 0 and serial_number <= ends[i]:
+            return False
+        
+        joins_previous = i >= 0 and ends[i] == serial_number - 1
+        joins_next = i + 1 < len(starts) and starts[i + 1] == serial_number + 1
+        
+        if joins_previous and joins_next:
+            ends[i] = ends[i + 1]
+            del starts[i + 1]
+            del ends[i + 1]
+        elif joins_previous:
+            ends[i] = serial_number
+        elif joins_next:
+            starts[i + 1] = serial_number
+        else:
+            starts.insert(i + 1, serial_number)
+            ends.insert(i + 1, serial_number)
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        return True
+    
+    def _gaps(self, key):
+        # Ranges of serial numbers between the key's intervals.
+        return [(end + 1, start - 1) for end, start 
+                in zip(key['ends'][:-1], key['starts'][1:])]
+    
+    def _stats(self, key):
+        # Statistics of a key, serial numbers missing being those 
+        # between the first and last not received.
+        first = key['starts'][0]
+        last = key['ends'][-1]
+        distinct = key['received'] - key['duplicates']
+        
+        return {'first': first, 'last': last, 'received': key['received'], 
+                'missing': last - first + 1 - distinct, 
+                'duplicates': key['duplicates'], 
+                'out_of_order': key['out_of_order']}
+
+
+class RandomOrgTicketPool(object):
+    """
+    RandomOrgTicketPool handing out unused tickets created in advance.
+    
+    Instances should only be obtained using RandomOrgClient's 
+    create_ticket_pool method, never created separately.
+    
+    A ticket pool keeps a number of unused tickets ready, refilled in 
+    the background by a RandomOrgCache of createTickets requests, so 
+    that a signed draw using a ticket doesn't first wait for one to be 
+    created. A ticket is either taken from the pool and passed to one 
+    of the signed methods, or the draw is made through the pool:
+    
+        >>> t = r.create_ticket_pool(20)
+        >>> r.generate_signed_integers(5, 0, 10, ticket_id=t.get())
+        ...
+        >>> t.generate('generate_signed_integers', 5, 0, 10)
+        ...
+    
+    When a ticket is used RANDOM.ORG creates its successor, the next 
+    ticket of its chain. A chained pool puts the successor of each 
+    ticket used by its generate method back into the pool, so that its
+    draws continue the chains of the tickets it created. Tickets 
+    returned to the pool with put, e.g., successors of tickets used 
+    otherwise, are handed out before those created by the cache.
+    
+    If no ticket is available within the given timeout a Queue.Empty 
+    exception is raised.
+    
+    Public methods:
+    
+    stop -- instruct the ticket cache to stop repopulating itself.
+    resume -- if the ticket cache is stopped, restart repopulation.
+    get -- get the ID of an unused ticket.
+    put -- return the ID of an unused ticket to the pool.
+    generate -- make a signed draw with a ticket from the pool.
+    """
+    
+    def __init__(self, client, cache, chained=False, ticket_ids=()):
+        """
+        Constructor.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        Initialize class. Should only be called by RandomOrgClient's 
+        create_ticket_pool method.
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        client -- RandomOrgClient making draws for generate.
+        cache -- RandomOrgCache of ticket IDs, one per result set.
+        chained -- put the successor of each ticket used by generate 
+            back into the pool (default False).
+        ticket_ids -- IDs of unused tickets to hand out first 
+            (default ()).
+        """
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._client = client
+        self._cache = cache
+        self._chained = chained
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._lock = threading.Lock()
+        self._ticket_ids = deque(ticket_ids)
+    
+    def stop(self):
+        """
+        Stop cache.
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        Cache will not continue to populate itself.
+        """
         
-        Keyword arguments:
+        self._cache.stop()
+    
+    def resume(self):
+        """
+        Resume cache.
         
-        n -- How many random strings you need. Must be within the 
-            [1,1e4] range.
-        length -- The length of each string. Must be within the [1,20] 
-            range. All strings will be of the same length.
-        characters -- A string that contains the set of characters that
-            are allowed to occur in the random strings. The maximum 
-            number of characters is 80.
-        replacement -- Specifies whether the random strings should be 
-            picked with replacement. If True the resulting list of 
-            strings may contain duplicates, otherwise the strings will 
-            all be unique (default True).
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
+        Cache will resume populating itself if stopped.
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 
-                   'characters':characters, 'replacement':replacement, 
-                   'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_STRING_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_strings(response)
+        self._cache.resume()
     
-    def generate_UUIDs(self, n, pregenerated_randomization=None):
+    def get(self, timeout=0):
         """
-        Generate random UUIDs.
+        Get the ID of an unused ticket.
         
-        Request and return a list (size n) of version 4 true random 
-        Universally Unique IDentifiers (UUIDs) in accordance with 
-        section 4.4 of RFC 4122, from the server. See:
-        https://api.random.org/json-rpc/4/basic#generateUUIDs
+        Raises a Queue.Empty exception if no ticket is available within
+        timeout.
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        timeout -- time in seconds to wait for a ticket. Supply a value
+            of -1 to wait indefinitely (default 0).
+        """
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        self._lock.acquire()
+        try:
+            if self._ticket_ids:
+                return self._ticket_ids.popleft()
+        finally:
+            self._lock.release()
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        return self._cache.get(timeout)[0]
+    
+    def put(self, ticket_id):
+        """
+        Return the ID of an unused ticket to the pool.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        ticket_id -- ID of a ticket which hasn't been used.
+        """
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        self._lock.acquire()
+        self._ticket_ids.append(ticket_id)
+        self._lock.release()
+    
+    def generate(self, method, *args, **kwargs):
+        """
+        Make a signed draw with a ticket from the pool.
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        Call a signed method of the client with the ID of a ticket from
+        the pool and return its result. If the draw fails before its 
+        request left the client, i.e., it couldn't be sent in time, was
+        cancelled, had invalid arguments or no connection to the server
+        could be opened, the ticket is returned to the pool. Otherwise 
+        RANDOM.ORG may have used the ticket, and it is dropped.
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        Raises a ValueError if method does not name a signed method 
+        generating randomness.
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        Raises a Queue.Empty exception if no ticket is available within
+        timeout.
         
         Keyword arguments:
         
-        n -- How many random UUIDs you need. Must be within the [1,1e3]
-            range.
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
+        method -- name of any of the signed methods generating 
+            randomness, e.g., 'generate_signed_integers'.
+        *args, **kwargs -- arguments of the method, other than 
+            ticket_id.
+        timeout -- time in seconds to wait for a ticket. Supply a value
+            of -1 to wait indefinitely (default 0).
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 
-                  'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_UUID_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_UUIDs(response)
-    
-    def generate_blobs(self, n, size, format=_BLOB_FORMAT_BASE64, 
-                       pregenerated_randomization=None):
-        """
-        Generate random BLOBs.
+        timeout = kwargs.pop('timeout', 0)
         
-        Request and return a list (size n) of Binary Large OBjects 
-        (BLOBs) as unicode strings containing true random data from the
-        server. See:
-        https://api.random.org/json-rpc/4/basic#generateBlobs
+        if (not method.startswith('generate_signed_') 
+                or not callable(getattr(self._client, method, None))):
+            raise ValueError('\'' + str(method) + '\' is not a signed '
+                             'method generating randomness.')
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        ticket_id = self.get(timeout)
+        try:
+            result = getattr(self._client, method)(*args, ticket_id=ticket_id, 
+                                                   **kwargs)
+        except Exception as e:
+            if self._unsent(e):
+                self.put(ticket_id)
+            raise
+        
+        if self._chained:
+            ticket_data = result['random'].get('ticketData') or {}
+            if ticket_data.get('nextTicketId'):
+                self.put(ticket_data['nextTicketId'])
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        return result
+    
+    def _unsent(self, error):
+        # Whether the request failing with error certainly never left 
+        # the client, so its ticket can't have been used.
+        if isinstance(error, (RandomOrgSendTimeoutError, CancelledError, 
+                              TypeError, requests.exceptions.ConnectTimeout)):
+            return True
+        
+        # Backoff in effect before sending, or a request refused for 
+        # lack of allowance, which doesn't use its ticket either.
+        if isinstance(error, RandomOrgInsufficientRequestsError):
+            return True
+        
+        # Invalid arguments, rather than a response that couldn't be 
+        # parsed.
+        if isinstance(error, ValueError):
+            return not isinstance(error, getattr(json, 'JSONDecodeError', 
+                                                 ValueError))
+        
+        # A connection couldn't be opened, rather than one failing 
+        # after the request was written.
+        if isinstance(error, requests.exceptions.ConnectionError):
+            reason = getattr(error.args[0] if error.args else None, 
+                             'reason', None)
+            return isinstance(reason, NewConnectionError)
+        
+        return False
+
+
+class _RandomOrgResultStore(object):
+    """
+    Store of the result sets held by a RandomOrgCache.
+    
+    A deque of result sets guarded by a Condition, so that any number 
+    of result sets are added or removed under a single acquisition of 
+    the lock, and consumers can wait for result sets to be added.
+    """
+    
+    shared = False
+    
+    def __init__(self, capacity):
+        """
+        Constructor.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        Keyword arguments:
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        capacity -- number of result sets the store is meant to hold.
+        """
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        self.capacity = capacity
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        self._lock = threading.Condition()
+        self._results = deque()
+    
+    def __len__(self):
+        return len(self._results)
+    
+    def put(self, results):
+        # Add a list of result sets and wake waiting consumers.
+        self._lock.acquire()
+        try:
+            self._appended(results)
+            self._results.extend(results)
+            self._lock.notify_all()
+        finally:
+            self._lock.release()
+    
+    def take(self, k, deadline=None, stopped=None):
+        # Remove and return a list of up to k result sets, waiting 
+        # until k are available, the monotonic time deadline has passed
+        # (never if None), or the function stopped returns True.
+        self._lock.acquire()
+        try:
+            while len(self._results) < k:
+                if stopped is not None and stopped():
+                    break
+                
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - _monotonic()
+                    if timeout <= 0:
+                        break
+                
+                self._lock.wait(timeout)
+            
+            results = [self._results.popleft() 
+                       for _ in range(min(k, len(self._results)))]
+            if results:
+                self._removed(results)
+            
+            return results
+        finally:
+            self._lock.release()
+    
+    def wake(self):
+        # Wake waiting consumers to re-check their stop condition.
+        self._lock.acquire()
+        self._lock.notify_all()
+        self._lock.release()
+    
+    def _appended(self, results):
+        # Called with the lock held before result sets are added.
+        pass
+    
+    def _removed(self, results):
+        # Called with the lock held after result sets are removed.
+        pass
+
+
+class _RandomOrgPersistentStore(_RandomOrgResultStore):
+    """
+    Store of the result sets held by a RandomOrgCache, kept on disk 
+    across restarts.
+    
+    Result sets are appended to a data file, one JSON line each, after
+    a header line identifying the request they belong to. Before result
+    sets are handed out, the total number consumed is appended to a 
+    journal file and synced to disk. A new instance with the same path
+    loads the result sets not yet consumed, so a restarted process 
+    starts with a populated cache, and no result set is ever handed 
+    out twice, even after a crash.
+    
+    The data file is rewritten without the consumed result sets on 
+    loading and whenever more than capacity have been consumed.
+    """
+    
+    def __init__(self, capacity, path, header, decode=None):
+        """
+        Constructor.
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        Keyword arguments:
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        capacity -- number of result sets the store is meant to hold.
+        path -- path of the data file, the journal is kept next to it 
+            with the suffix '.journal'.
+        header -- string identifying the request, result sets stored 
+            with a different header are discarded.
+        decode -- function restoring a result set from its JSON value,
+            or None if no conversion is necessary (default None).
+        """
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        _RandomOrgResultStore.__init__(self, capacity)
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        self._path = path
+        self._journal_path = path + '.journal'
+        self._header = header
+        self._decode = decode
         
-        Keyword arguments:
+        self._data_file = None
+        self._journal_file = None
+        self._consumed = 0
         
-        n -- How many random blobs you need. Must be within the [1,100]
-            range.
-        size -- The size of each blob, measured in bits. Must be within
-            the [1,1048576] range and must be divisible by 8.
-        format -- Specifies the format in which the blobs will be 
-            returned. Values allowed are _BLOB_FORMAT_BASE64 and 
-            _BLOB_FORMAT_HEX (default _BLOB_FORMAT_BASE64).
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
-        """
+        self._load()
+    
+    def _appended(self, results):
+        # Append result sets to the data file. If it can't be written 
+        # they are only kept in memory.
+        try:
+            for result in results:
+                self._data_file.write(_encode_result(result))
+            self._data_file.flush()
+            os.fsync(self._data_file.fileno())
+        except (IOError, OSError) as e:
+            logging.warning('RandomOrgCache result sets not persisted: ' 
+                            + str(e))
+    
+    def _removed(self, results):
+        # Record result sets as consumed before they are handed out. 
+        # If the journal can't be written an exception is raised and 
+        # the result sets are dropped rather than risk reuse.
+        self._consumed += len(results)
+        self._write_journal(self._consumed)
+        
+        if self._consumed > self.capacity:
+            self._compact()
+    
+    def _load(self):
+        # Load the result sets left over by a previous instance.
+        try:
+            with open(self._path, 'rb') as f:
+                lines = f.read().split(b'\n')
+        except (IOError, OSError):
+            lines = [b'']
+        
+        # The last line is empty, or torn by a crash while appending.
+        lines = [line.decode('utf-8') for line in lines[:-1]]
+        
+        if lines and lines[0] == self._header:
+            consumed = self._read_journal()
+            for line in lines[1 + consumed:]:
+                result = json.loads(line)
+                if self._decode is not None:
+                    result = self._decode(result)
+                self._results.append(result)
+        elif lines:
+            logging.info('Discarding result sets of a different request in '
+                         + self._path)
+        
+        self._compact()
+    
+    def _compact(self):
+        # Replace the data file by one holding the result sets not yet
+        # consumed, then reset the journal. A crash in between makes 
+        # the old journal skip some of these result sets, which are 
+        # lost but never handed out twice.
+        temp_path = self._path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(self._header.encode('utf-8') + b'\n')
+            for result in self._results:
+                f.write(_encode_result(result))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if self._data_file is not None:
+            self._data_file.close()
+        _replace_file(temp_path, self._path)
+        self._data_file = open(self._path, 'ab')
+        
+        if self._journal_file is not None:
+            self._journal_file.close()
+        self._journal_file = open(self._journal_path, 'wb')
+        self._consumed = 0
+        self._write_journal(0)
+    
+    def _read_journal(self):
+        # Last number of consumed result sets written completely.
+        try:
+            with open(self._journal_path, 'rb') as f:
+                entries = f.read().split(b'\n')[:-1]
+        except (IOError, OSError):
+            return 0
         
-        params = { 'apiKey':self._api_key, 'n':n, 'size':size, 'format':format, 
-                  'pregeneratedRandomization':pregenerated_randomization }
-        request = self._generate_request(_BLOB_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_blobs(response)
+        return int(entries[-1]) if entries else 0
     
+    def _write_journal(self, consumed):
+        self._journal_file.write(('%d\n' % consumed).encode('utf-8'))
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+
+class _RandomOrgSharedStore(object):
+    """
+    Store of the result sets held by RandomOrgCaches in several 
+    processes, e.g., the workers of a server on one host.
     
-    # Signed methods for generating randomness, see:
-    # https://api.random.org/json-rpc/4/signed
+    Result sets are kept in a data file as for _RandomOrgPersistentStore,
+    ideally on a memory backed file system such as /dev/shm. A state 
+    file holds the offsets of the first result set not yet consumed and
+    of the end of the last one, and the number of result sets 
+    available. It is locked with flock while result sets are added or 
+    removed, so that each result set is consumed by exactly one process.
     
-    def generate_signed_integers(self, n, min, max, replacement=True, 
-                                 base=10, pregenerated_randomization=None, 
-                                 license_data=None, user_data=None, 
-                                 ticket_id=None):
+    Only the process holding an exclusive flock on a third file fetches
+    result sets, the others just consume them. If the fetching process 
+    exits its lock is released and another process takes over.
+    
+    Consumers waiting for result sets poll the state file every 
+    _SHARED_CACHE_POLL_INTERVAL.
+    """
+    
+    shared = True
+    
+    def __init__(self, capacity, path, header, decode=None):
         """
-        Generate digitally signed random integers.
+        Constructor.
         
-        Request a list (size n) of true random integers within a 
-        user-defined range from the server. Returns a dictionary object 
-        with the parsed integer list mapped to 'data', the original 
-        response mapped to 'random', and the response's signature 
-        mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedIntegers
+        Raises a NotImplementedError if flock is not available on this 
+        platform.
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        capacity -- number of result sets the store is meant to hold.
+        path -- path of the data file, the state and fetcher lock files
+            are kept next to it with the suffixes '.state' and '.fetcher'.
+        header -- string identifying the request, result sets stored 
+            with a different header are discarded.
+        decode -- function restoring a result set from its JSON value,
+            or None if no conversion is necessary (default None).
+        """
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        if fcntl is None:
+            raise NotImplementedError('Sharing a RandomOrgCache between '
+                                      'processes requires flock')
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        self.capacity = capacity
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        self._path = path
+        self._header = (header + '\n').encode('utf-8')
+        self._decode = decode
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        # flock doesn't exclude threads using the same file descriptor.
+        self._lock = threading.Lock()
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        self._data_fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._state_fd = os.open(path + '.state', os.O_RDWR | os.O_CREAT, 
+                                 0o600)
+        self._fetcher_fd = None
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
-
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
-
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
+        self._acquire()
+        try:
+            # Start afresh if the data file belongs to another request.
+            os.lseek(self._data_fd, 0, os.SEEK_SET)
+            if (os.read(self._data_fd, len(self._header)) != self._header 
+                    or self._read_state() is None):
+                os.ftruncate(self._data_fd, 0)
+                os.lseek(self._data_fd, 0, os.SEEK_SET)
+                os.write(self._data_fd, self._header)
+                self._write_state(len(self._header), len(self._header), 0)
+        finally:
+            self._release()
+    
+    def __len__(self):
+        self._acquire()
+        try:
+            return self._read_state()[2]
+        finally:
+            self._release()
+    
+    def fetching(self):
+        # Whether this process is the one to fetch result sets, trying 
+        # to become it if no process is.
+        if self._fetcher_fd is None:
+            fd = os.open(self._path + '.fetcher', os.O_RDWR | os.O_CREAT, 
+                         0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (IOError, OSError):
+                os.close(fd)
+                return False
+            
+            self._fetcher_fd = fd
         
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
+        return True
+    
+    def put(self, results):
+        # Append a list of result sets, first moving the unconsumed ones
+        # to the start once the consumed ones take up more space. Data 
+        # is written after the end recorded in the state, so anything 
+        # left by a process exiting before updating the state is 
+        # overwritten.
+        data = b''.join(_encode_result(result) for result in results)
+        
+        self._acquire()
+        try:
+            offset, end, count = self._read_state()
+            
+            if offset - len(self._header) > end - offset:
+                os.lseek(self._data_fd, offset, os.SEEK_SET)
+                left = self._read(end - offset)
+                os.lseek(self._data_fd, len(self._header), os.SEEK_SET)
+                os.write(self._data_fd, left)
+                offset = len(self._header)
+                end = offset + len(left)
+                self._write_state(offset, end, count)
+            
+            os.lseek(self._data_fd, end, os.SEEK_SET)
+            os.write(self._data_fd, data)
+            os.ftruncate(self._data_fd, end + len(data))
+            self._write_state(offset, end + len(data), count + len(results))
+        finally:
+            self._release()
+    
+    def take(self, k, deadline=None, stopped=None):
+        # Remove and return a list of up to k result sets, waiting 
+        # until k are available, the monotonic time deadline has passed
+        # (never if None), or the function stopped returns True.
+        results = []
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        while True:
+            results.extend(self._remove(k - len(results)))
+            
+            if len(results) == k or (stopped is not None and stopped()):
+                return results
+            
+            timeout = _SHARED_CACHE_POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - _monotonic())
+                if timeout <= 0:
+                    return results
+            
+            time.sleep(timeout)
+    
+    def wake(self):
+        # Waiting consumers poll, so there is nobody to wake.
+        pass
+    
+    def _remove(self, k):
+        # Remove up to k result sets without waiting.
+        self._acquire()
+        try:
+            offset, end, count = self._read_state()
+            k = min(k, count)
+            if k == 0:
+                return []
+            
+            # Read whole lines until k result sets are complete.
+            os.lseek(self._data_fd, offset, os.SEEK_SET)
+            data = b''
+            while data.count(b'\n') < k and offset + len(data) < end:
+                chunk = os.read(self._data_fd, 
+                                min(65536, end - offset - len(data)))
+                if not chunk:
+                    break
+                data += chunk
+            
+            lines = data.split(b'\n')[:k]
+            
+            self._write_state(offset + sum(len(line) + 1 for line in lines), 
+                              end, count - len(lines))
+        finally:
+            self._release()
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        results = [json.loads(line.decode('utf-8')) for line in lines]
+        if self._decode is not None:
+            results = [self._decode(result) for result in results]
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        return results
+    
+    def _acquire(self):
+        self._lock.acquire()
+        try:
+            fcntl.flock(self._state_fd, fcntl.LOCK_EX)
+        except Exception:
+            self._lock.release()
+            raise
+    
+    def _release(self):
+        fcntl.flock(self._state_fd, fcntl.LOCK_UN)
+        self._lock.release()
+    
+    def _read_state(self):
+        # Offsets of the first unconsumed result set and of the end of 
+        # the last one and number of result sets available, or None if 
+        # the state was never written.
+        os.lseek(self._state_fd, 0, os.SEEK_SET)
+        state = os.read(self._state_fd, 128).split()
+        if len(state) != 3:
+            return None
+        
+        return tuple(int(value) for value in state)
+    
+    def _write_state(self, offset, end, count):
+        # Fixed width, so the state is overwritten completely.
+        state = '%020d %020d %020d\n' % (offset, end, count)
+        os.lseek(self._state_fd, 0, os.SEEK_SET)
+        os.write(self._state_fd, state.encode('utf-8'))
+    
+    def _read(self, size):
+        # Read size bytes from the current offset of the data file.
+        data = b''
+        while len(data) < size:
+            chunk = os.read(self._data_fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        
+        return data
+
+
+def _encode_result(result):
+    # One line of JSON for a result set kept in a file, UUIDs are 
+    # written as strings, NumPy arrays as lists and decoded blobs as 
+    # base64 strings.
+    return (json.dumps(result, default=_encode_value) + '\n').encode('utf-8')
+
+
+def _encode_value(value):
+    # JSON serializable form of a value in a result set.
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode('ascii')
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class _RandomOrgRingBuffer(object):
+    """
+    Ring buffer store of the integer result sets held by a 
+    RandomOrgCache.
+    
+    Result sets of a fixed number of integers are copied into slots of
+    a single preallocated array. Indices of free and filled slots are 
+    kept in deques, whose append and popleft are atomic, so the cache 
+    manager fills slots and any number of consumers take them without 
+    acquiring a lock. The lock is only used by consumers waiting for 
+    result sets to be added.
+    
+    Taken result sets are slices copied out of the array, so a slot can
+    be refilled as soon as it has been taken.
+    """
+    
+    shared = False
+    
+    def __init__(self, capacity, width):
+        """
+        Constructor.
         
         Keyword arguments:
         
-        n -- How many random integers you need. Must be within the 
-            [1,1e4] range.
-        min -- The lower boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        max -- The upper boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        replacement -- Specifies whether the random numbers should be 
-            picked with replacement. If True the resulting numbers may 
-            contain duplicate values, otherwise the numbers will all be
-            unique (default True).
-        base -- The base used to display the numbers in the sequences.
-            Must be an integer with the value 2, 8, 10 or 16.
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
-        """
-        
-        params = { 'apiKey':self._api_key, 'n':n, 'min':min, 'max':max, 
-                  'replacement':replacement, 'base':base, 
-                  'pregeneratedRandomization':pregenerated_randomization, 
-                  'licenseData':license_data, 'userData':user_data, 
-                  'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_INTEGER_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_ints, base == 10)
-    
-    def generate_signed_integer_sequences(self, n, length, min, max, 
-                                          replacement=True, base=10, 
-                                          pregenerated_randomization=None, 
-                                          license_data=None, user_data=None, 
-                                          ticket_id=None):
+        capacity -- number of result sets the store holds.
+        width -- number of integers in each result set.
         """
-        Generate digitally signed sequences of random integers.
         
-        Request a list (size n) of sequences of true random integers within 
-        a user-defined range from the server. Returns a dictionary object 
-        with the parsed integer list mapped to 'data', the original 
-        response mapped to 'random', and the response's signature 
-        mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedIntegerSequences
+        self.capacity = capacity
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        self._width = width
+        self._values = array('l', [0]) * (capacity * width)
+        self._free = deque(range(capacity))
+        self._ready = deque()
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
-        
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
-        
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
-        
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
-        
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        self._lock = threading.Condition()
+        self._waiting = 0
+    
+    def __len__(self):
+        return len(self._ready)
+    
+    def put(self, results):
+        # Copy a list of result sets into free slots and wake waiting 
+        # consumers. Slots still being copied out of by consumers 
+        # aren't free yet, result sets which don't fit are dropped. 
+        # Result sets of the wrong length or with values out of range 
+        # of a C long are dropped too, as copying them would shift or 
+        # corrupt the other slots.
+        for result in results:
+            try:
+                values = array('l', result)
+            except (OverflowError, TypeError):
+                values = None
+            
+            if values is None or len(values) != self._width:
+                logging.info('RandomOrgCache ring buffer dropping result '
+                             'set not of ' + str(self._width) + ' C long '
+                             'integers')
+                continue
+            
+            try:
+                slot = self._free.popleft()
+            except IndexError:
+                logging.info('RandomOrgCache ring buffer full, dropping '
+                             'result set')
+                break
+            
+            start = slot * self._width
+            self._values[start:start + self._width] = values
+            self._ready.append(slot)
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        if self._waiting:
+            self.wake()
+    
+    def take(self, k, deadline=None, stopped=None):
+        # Remove and return a list of up to k result sets, waiting 
+        # until k are available, the monotonic time deadline has passed
+        # (never if None), or the function stopped returns True.
+        results = []
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
+        while True:
+            while len(results) < k:
+                try:
+                    slot = self._ready.popleft()
+                except IndexError:
+                    break
+                
+                start = slot * self._width
+                results.append(self._values[start:start + self._width])
+                self._free.append(slot)
+            
+            if len(results) == k or (stopped is not None and stopped()):
+                return results
+            
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - _monotonic()
+                if timeout <= 0:
+                    return results
+            
+            # Register as waiting before checking for result sets once
+            # more, so that a producer can't add them unnoticed.
+            self._lock.acquire()
+            try:
+                self._waiting += 1
+                if not self._ready:
+                    self._lock.wait(timeout)
+                self._waiting -= 1
+            finally:
+                self._lock.release()
+    
+    def wake(self):
+        # Wake waiting consumers to check for result sets or their 
+        # stop condition.
+        self._lock.acquire()
+        self._lock.notify_all()
+        self._lock.release()
 
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
 
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
-        
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
+class _RandomOrgCacheManager(object):
+    """
+    Populates the RandomOrgCaches of a RandomOrgClient.
+    
+    A single background Thread services all caches of a client, which 
+    share its API key's advisory delay. Whenever a request can be 
+    issued, the cache expected to run empty soonest, judged from its 
+    fill level and recent consumption rate, is refilled first. Caches 
+    which are never consumed from are refilled in order of their fill 
+    level. Caches which are no longer referenced are dropped.
+    
+    Note that requests to the server are blocking, i.e., only one
+    request will be issued by the manager at any given time.
+    """
+    
+    def __init__(self):
+        """
+        Constructor.
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        The Thread is started once the first cache is registered.
+        """
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        # Condition lock to allow notification when an item is 
+        # consumed, a cache is added or pause state is updated.
+        self._lock = threading.Condition()
+        self._caches = weakref.WeakSet()
+        self._thread = None
+    
+    def register(self, cache):
+        # Start populating cache.
+        self._lock.acquire()
+        try:
+            self._caches.add(cache)
+            
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._populate_caches)
+                self._thread.daemon = True
+                self._thread.start()
+            
+            self._lock.notify()
+        finally:
+            self._lock.release()
+    
+    def notify(self):
+        # Wake the Thread to reconsider which cache to refill.
+        self._lock.acquire()
+        self._lock.notify()
+        self._lock.release()
+    
+    def _populate_caches(self):
+        # Keep refilling the most urgent cache.
+        while True:
+            cache = self._next_cache()
+            cache._refill()
+            cache = None
+    
+    def _next_cache(self):
+        # Block until a cache needs refilling and return the one 
+        # expected to run empty soonest.
+        self._lock.acquire()
+        try:
+            while True:
+                now = _monotonic()
+                caches = list(self._caches)
+                
+                waiting = [cache for cache in caches if cache._needs_refill(now)]
+                if waiting:
+                    return min(waiting, 
+                               key=lambda cache: (cache._time_to_empty(now), 
+                                                  len(cache._store) 
+                                                  / float(cache._store.capacity)))
+                
+                # Sleep until notified, or until a failed request may 
+                # be retried.
+                retries = [cache._retry_time for cache in caches 
+                           if not cache._paused and cache._retry_time > now]
+                caches = None
+                
+                self._lock.wait(min(retries) - now if retries else None)
+        finally:
+            self._lock.release()
+
+
+class _RandomOrgScheduler(object):
+    """
+    Scheduler for requests sent with a single API key.
+    
+    Keeps track of the server advisory delay and of any backoff in
+    effect, and from these computes the earliest time at which the next
+    request may be sent. Times are measured with a monotonic wall
+    clock, so waits are neither stretched by an idle process nor
+    affected by changes to the system time.
+    
+    Threads waiting for their slot sleep on a Condition until the slot
+    is reached, and are woken early whenever a response updates the
+    advisory delay.
+    """
+    
+    shared = False
+    
+    def __init__(self):
+        """
+        Constructor.
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        The first slot is one advisory delay after creation.
+        """
         
-        Keyword arguments:
+        self._lock = threading.Condition()
         
-        n -- How many integer sequences you need. Must be within the 
-            [1,1e3] range.
-        length -- Lengths of the sequences requested. Uniform: Must be 
-            an integer within the [1,1e4] range. Multiform: an array of 
-            length n where each value is within the [1,1e4] range and 
-            the sum of all n values is within the [1,1e4] range.  
-        min -- The lower boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        max -- The upper boundary for the range from which the random 
-            numbers will be picked. Must be within the [-1e9,1e9] range.
-        replacement -- Specifies whether the random numbers should be 
-            picked with replacement. If True the resulting numbers may 
-            contain duplicate values, otherwise the numbers will all be
-            unique (default True). For multiform sequences this can be
-            an array of n boolean values, each specifying whether the 
-            sequence identified by its index will be created with (true) 
-            or without (false) replacement.
-        base -- The base used to display the numbers in the sequences.
-            Must be an integer with the value 2, 8, 10 or 16. For multiform
-            sequences the values may be an array of length n with values 
-            taken from the same set.
-        pregenerated_randomization -- Allows the client to specify that 
-            the random values should be generated from a pregenerated, 
-            historical randomization instead of a one-time on-the-fly 
-            randomization. There are three possible cases:
-            - null: the standard way of calling for random values, i.e.
-              true randomness is generated and discarded afterwards
-            - date: RANDOM.ORG uses historical true randomness generated 
-              on the corresponding date (past or present, format: 
-              { "date": "YYYY-MM-DD" })
-            - id: RANDOM.ORG uses historical true randomness derived 
-              from the corresponding identifier in a deterministic 
-              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
-              "PERSISTENT-IDENTIFIER" is a string with length in the 
-              [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
-        """
+        # server advisory delay in seconds and the monotonic time at
+        # which the last response was received
+        self.advisory_delay = 0
+        self.last_response_time = _monotonic()
         
-        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 'min':min,
-                  'max':max, 'replacement':replacement, 'base':base, 
-                  'pregeneratedRandomization':pregenerated_randomization, 
-                  'licenseData':license_data, 'userData':user_data, 
-                  'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_INTEGER_SEQUENCES_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_int_sequences, 
-                                             base == 10)
+        # backoff until midnight UTC when the API key's daily request
+        # allowance is exhausted, as a UTC datetime, and the error
+        # message to raise until then
+        self.backoff = None
+        self.backoff_error = None
     
-    def generate_signed_decimal_fractions(self, n, decimal_places, 
-                                          replacement=True, 
-                                          pregenerated_randomization=None, 
-                                          license_data=None, user_data=None, 
-                                          ticket_id=None):
+    def advisory_slot_time(self):
+        # Monotonic time at which the advisory delay is up, ignoring 
+        # any backoff.
+        self._lock.acquire()
+        try:
+            return self.last_response_time + self.advisory_delay
+        finally:
+            self._lock.release()
+    
+    def next_slot_time(self):
+        # Monotonic time at which the next request may be sent.
+        self._lock.acquire()
+        try:
+            slot = self.advisory_slot_time()
+            
+            if self.backoff is not None:
+                backoff = self.backoff - datetime.utcnow()
+                slot = max(slot, _monotonic() + backoff.total_seconds())
+            
+            return slot
+        finally:
+            self._lock.release()
+    
+    def check(self, deadline=None):
+        # Return the time to wait before a request may be sent, or the
+        # exception preventing it from being sent by deadline, the
+        # monotonic time after which no request may wait any longer.
+        self._lock.acquire()
+        try:
+            # If a backoff is set, no more requests can be issued until
+            # the required backoff time is up.
+            if self.backoff is not None:
+                # Time not yet up, throw exception.
+                if datetime.utcnow() < self.backoff:
+                    return { 'exception':
+                            RandomOrgInsufficientRequestsError(self.backoff_error) }
+                
+                # Time is up, clear backoff.
+                self.backoff = None
+                self.backoff_error = None
+            
+            now = _monotonic()
+            slot = self.advisory_slot_time()
+            wait = slot - now
+            
+            # The specified delay must be waited if necessary, unless
+            # the slot is beyond the deadline.
+            if wait > 0 and deadline is not None and slot > deadline:
+                return { 'exception':
+                        RandomOrgSendTimeoutError('The server advisory delay of '
+                                                  + str(wait) + 's is greater than '
+                                                  'the defined maximum allowed '
+                                                  'blocking time of '
+                                                  + str(deadline - now) + 's.') }
+            
+            return { 'wait': max(wait, 0) }
+        finally:
+            self._lock.release()
+    
+    def wait(self, deadline=None):
+        # Block until the next slot is reached. Return None once a
+        # request may be sent, or the exception preventing it as for
+        # check.
+        self._lock.acquire()
+        try:
+            while True:
+                check = self.check(deadline)
+                if 'exception' in check or check['wait'] <= 0:
+                    return check.get('exception')
+                
+                # Sleep until the slot, a response may move it earlier
+                # or later in the meantime.
+                self._lock.wait(check['wait'])
+        finally:
+            self._lock.release()
+    
+    def response_received(self, advisory_delay):
+        # Start a new advisory delay from now and wake waiting threads.
+        self._lock.acquire()
+        try:
+            self.advisory_delay = advisory_delay
+            self.last_response_time = _monotonic()
+            self._lock.notify_all()
+        finally:
+            self._lock.release()
+    
+    def set_backoff(self, error):
+        # Back off until midnight UTC.
+        self._lock.acquire()
+        try:
+            today = datetime.utcnow().replace(hour=0, minute=0, second=0,
+                                              microsecond=0)
+            self.backoff = today + timedelta(days=1)
+            self.backoff_error = error
+            self._lock.notify_all()
+        finally:
+            self._lock.release()
+
+
+class _RandomOrgSharedScheduler(_RandomOrgScheduler):
+    """
+    Scheduler for requests sent with a single API key by several 
+    processes on one host.
+    
+    In addition to the state kept by _RandomOrgScheduler, the time at 
+    which the next request may be sent by any of the processes, the 
+    latest advisory delay and any backoff in effect are kept in a file 
+    shared by the processes. The file is locked with flock while read 
+    or written. As monotonic clocks aren't comparable between 
+    processes, times in the file are measured by the system clock.
+    
+    A process about to send a request first reserves the slot: with 
+    the file locked exclusively, it moves the shared slot one advisory 
+    delay ahead, so processes waiting for the same slot send one after 
+    the other rather than all at once. The shared slot is cached 
+    between reservations, so waiting for it doesn't read the file.
+    """
+    
+    shared = True
+    
+    def __init__(self, path):
         """
-        Generate digitally signed random decimal fractions.
+        Constructor.
         
-        Request a list (size n) of true random decimal fractions, from
-        a uniform distribution across the [0,1] interval with a 
-        user-defined number of decimal places from the server. Returns 
-        a dictionary object with the parsed decimal fraction list 
-        mapped to 'data', the original response mapped to 'random', and
-        the response's signature mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedDecimalFractions
+        Raises a NotImplementedError if flock is not available on this 
+        platform.
         
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
+        Keyword arguments:
         
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
+        path -- path of the file holding the shared state.
+        """
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        if fcntl is None:
+            raise NotImplementedError('Coordinating RandomOrgClients '
+                                      'between processes requires flock')
         
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
+        _RandomOrgScheduler.__init__(self)
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._fd_lock = threading.Lock()
         
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
+        # monotonic time of the shared slot when last read or written
+        self._shared_slot = None
+    
+    def advisory_slot_time(self):
+        # Monotonic time at which the advisory delay of this or any 
+        # other process is up, ignoring any backoff, as last seen.
+        self._lock.acquire()
+        try:
+            slot = _RandomOrgScheduler.advisory_slot_time(self)
+            
+            if self._shared_slot is not None:
+                slot = max(slot, self._shared_slot)
+            
+            return slot
+        finally:
+            self._lock.release()
+    
+    def next_slot_time(self):
+        # Monotonic time at which the next request may be sent by this 
+        # or any other process.
+        self._lock.acquire()
+        try:
+            self._adopt(self._read())
+            return _RandomOrgScheduler.next_slot_time(self)
+        finally:
+            self._lock.release()
+    
+    def check(self, deadline=None):
+        # As for _RandomOrgScheduler, but once the slot last seen is 
+        # reached, reserve it. A request may only be sent if the 
+        # reservation succeeds, otherwise another process got the slot 
+        # first, or has backed off, and the new slot is checked.
+        self._lock.acquire()
+        try:
+            while True:
+                check = _RandomOrgScheduler.check(self, deadline)
+                if 'exception' in check or check['wait'] > 0:
+                    return check
+                
+                reserved = []
+                self._update(lambda shared: reserved.append(self._reserve(shared)))
+                if reserved[0]:
+                    return check
+        finally:
+            self._lock.release()
+    
+    def response_received(self, advisory_delay):
+        # Share the end of the advisory delay, unless another process 
+        # must wait longer already.
+        self._lock.acquire()
+        try:
+            _RandomOrgScheduler.response_received(self, advisory_delay)
+            
+            slot = time.time() + advisory_delay
+            
+            def share(shared):
+                shared.update(slot=max(slot, shared['slot'] or 0), 
+                              delay=advisory_delay)
+                self._adopt(shared)
+            
+            self._update(share)
+        finally:
+            self._lock.release()
+    
+    def set_backoff(self, error):
+        # Share the backoff.
+        _RandomOrgScheduler.set_backoff(self, error)
         
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
+        backoff = (self.backoff - _EPOCH).total_seconds()
+        self._update(lambda shared: shared.update(backoff=backoff, 
+                                                  error=error))
+    
+    def _reserve(self, shared):
+        # Take the shared slot if it has been reached and no other 
+        # process has backed off, moving it one advisory delay ahead. 
+        # Return whether the slot was taken. Called with the file 
+        # locked exclusively.
+        self._adopt(shared)
+        
+        now = time.time()
+        if self.backoff is not None or (shared['slot'] or 0) > now:
+            return False
+        
+        delay = shared['delay']
+        if delay is None:
+            delay = self.advisory_delay
+        
+        shared['slot'] = now + delay
+        self._shared_slot = shared['slot'] - now + _monotonic()
+        return True
+    
+    def _adopt(self, shared):
+        # Remember the shared slot, and back off if another process 
+        # has backed off.
+        if shared['slot'] is not None:
+            self._shared_slot = shared['slot'] - time.time() + _monotonic()
+        
+        if self.backoff is None and shared['backoff'] is not None:
+            backoff = _EPOCH + timedelta(seconds=shared['backoff'])
+            if datetime.utcnow() < backoff:
+                self.backoff = backoff
+                self.backoff_error = shared['error']
+    
+    def _read(self):
+        # Shared state, with None for values never written.
+        self._fd_lock.acquire()
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                return self._load()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._fd_lock.release()
+    
+    def _update(self, function):
+        # Apply function to the shared state and write it back, with 
+        # no other process reading or writing in between.
+        self._fd_lock.acquire()
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                shared = self._load()
+                function(shared)
+                
+                data = json.dumps(shared).encode('utf-8')
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, data)
+                os.ftruncate(self._fd, len(data))
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._fd_lock.release()
+    
+    def _load(self):
+        # Parse the shared state, ignoring a file left incomplete.
+        shared = { 'slot':None, 'delay':None, 'backoff':None, 'error':None }
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        data = os.read(self._fd, 65536)
+        try:
+            shared.update(json.loads(data.decode('utf-8')))
+        except ValueError:
+            pass
+        
+        return shared
 
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
 
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
+class _RandomOrgRequestQueue(object):
+    """
+    Priority queue of requests waiting to be sent serially.
+    
+    Requests are taken highest priority first, and in order of 
+    submission within a priority, once the scheduler's next slot has 
+    been reached, so the request sent is always the most urgent one 
+    pending at the time of sending. Requests which can no longer be 
+    sent by their deadline are failed with a RandomOrgSendTimeoutError
+    as soon as this is known, rather than when their turn comes.
+    """
+    
+    def __init__(self, scheduler):
+        """
+        Constructor.
         
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
+        Keyword arguments:
         
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        scheduler -- _RandomOrgScheduler of the client sending the 
+            requests.
+        """
         
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
+        self._scheduler = scheduler
         
-        Can also raise connection errors as described here:
+        self._lock = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def put(self, data, priority=0, deadline=None):
+        # Add a request, data as created by RandomOrgClient's submit 
+        # functions.
+        self._lock.acquire()
+        try:
+            heapq.heappush(self._heap, (-priority, next(self._counter), 
+                                        deadline, data))
+            self._lock.notify()
+        finally:
+            self._lock.release()
+    
+    def get(self):
+        # Block until a request is pending and the next slot has been 
+        # reached, then remove and return the most urgent request.
+        self._lock.acquire()
+        try:
+            while True:
+                self._expire()
+                
+                if not self._heap:
+                    self._lock.wait()
+                    continue
+                
+                # Requests may be added while waiting for the slot.
+                wait = self._scheduler.advisory_slot_time() - _monotonic()
+                if wait > 0:
+                    self._lock.wait(wait)
+                    continue
+                
+                return heapq.heappop(self._heap)[-1]
+        finally:
+            self._lock.release()
+    
+    def _expire(self):
+        # Drop cancelled requests and fail those whose deadline lies 
+        # before the next slot.
+        slot = max(self._scheduler.advisory_slot_time(), _monotonic())
+        
+        pending = []
+        for entry in self._heap:
+            deadline, data = entry[2], entry[3]
+            
+            if data['request'] is None:
+                continue
+            
+            if deadline is not None and deadline < slot:
+                if data['future'].set_running_or_notify_cancel():
+                    data['future'].set_exception(
+                        RandomOrgSendTimeoutError('The request could not be '
+                                                  'sent before its deadline, '
+                                                  'the next request slot is '
+                                                  'in ' + str(slot - _monotonic()) 
+                                                  + 's.'))
+                continue
+            
+            pending.append(entry)
+        
+        if len(pending) < len(self._heap):
+            heapq.heapify(pending)
+            self._heap = pending
+
+
+class _RandomOrgCoalescer(object):
+    """
+    Merges concurrent compatible requests into a single request.
+    
+    The first of several requests for the same method with the same 
+    parameters other than n waits for a short window, during which 
+    further such requests join it, and then sends a single request for
+    the sum of their n. Each request receives its share of the values 
+    in order, much like RandomOrgCache splits a bulk response into 
+    result sets. Requests only join while the sum of n remains within 
+    the API's per-request maximum.
+    
+    The window ends early once the sum of n reaches the maximum or a 
+    request doesn't fit, as no more can join. Nor is it waited for if 
+    the previous request for the same parameters had nothing to merge 
+    with and no other caller is waiting for its share, so that a lone 
+    caller doesn't wait for others which don't come.
+    
+    Only draws with replacement and without pregenerated randomization
+    are merged, as merging would change the results of any others.
+    """
+    
+    def __init__(self, client, window):
+        """
+        Constructor.
+        
+        Keyword arguments:
+        
+        client -- RandomOrgClient sending the merged requests.
+        window -- time in seconds during which requests are merged.
+        """
+        
+        self._client = client
+        self._window = window
+        
+        # requests collected, whether the last request sent merged 
+        # several, and the number of callers waiting for their share, 
+        # per method and parameters
+        self._lock = threading.Lock()
+        self._groups = {}
+        self._merged = {}
+        self._callers = {}
+    
+    def accepts(self, method, params):
+        # Whether the request may be merged with others.
+        if method not in _MAX_N:
+            return False
+        
+        if (params.get('replacement', True) is not True 
+                or params.get('pregeneratedRandomization') is not None):
+            return False
+        
+        # Sequences of different lengths or ranges can't be merged.
+        return not any(isinstance(value, (list, tuple)) 
+                       for value in params.values())
+    
+    def send(self, method, params):
+        # Send the request merged with those made within the window and
+        # return its share of the response.
+        n = params['n']
+        key = (method, json.dumps(dict((name, value) 
+                                       for name, value in params.items() 
+                                       if name != 'n'), sort_keys=True))
+        
+        self._lock.acquire()
+        try:
+            self._callers[key] = self._callers.get(key, 0) + 1
+            
+            group = self._groups.get(key)
+            leader = group is None or not self._fits(method, params, group['n'] + n)
+            
+            # Start a new request, the current one can't take this one.
+            if leader:
+                if group is not None:
+                    group['closed'].set()
+                
+                group = {'n': 0, 'callers': 0, 'future': Future(), 
+                         'closed': threading.Event()}
+                self._groups[key] = group
+                
+                wait = self._merged.get(key, True) or self._callers[key] > 1
+            
+            offset = group['n']
+            group['n'] += n
+            group['callers'] += 1
+            
+            # Not even a request for a single value can join any more.
+            if not self._fits(method, params, group['n'] + 1):
+                group['closed'].set()
+        finally:
+            self._lock.release()
+        
+        try:
+            if leader:
+                # Give other requests the chance to join until the 
+                # window is up or one doesn't fit, then send.
+                if wait:
+                    group['closed'].wait(self._window)
+                
+                self._lock.acquire()
+                if self._groups.get(key) is group:
+                    del self._groups[key]
+                self._merged[key] = group['callers'] > 1
+                self._lock.release()
+                
+                request = self._client._generate_request(method, 
+                                                         dict(params, n=group['n']))
+                try:
+                    group['future'].set_result(self._client._send_request(request))
+                except Exception as e:
+                    group['future'].set_exception(e)
+            
+            return self._share(group['future'].result(), offset, n)
+        finally:
+            self._lock.acquire()
+            self._callers[key] -= 1
+            if not self._callers[key]:
+                del self._callers[key]
+            self._lock.release()
+    
+    def _fits(self, method, params, n):
+        # Whether a request for n values is within the API's limits.
+        if n > _MAX_N[method]:
+            return False
+        if method == _INTEGER_SEQUENCES_METHOD:
+            return n * params['length'] <= _MAX_SEQUENCE_VALUES
+        if method == _BLOB_METHOD:
+            return n * params['size'] <= _MAX_BLOB_BITS
+        return True
+    
+    def _share(self, response, offset, n):
+        # Response holding only the n values starting at offset.
+        random = dict(response['result']['random'], n=n, 
+                      data=response['result']['random']['data'][offset:offset + n])
+        return dict(response, result=dict(response['result'], random=random))
+
+
+class _RandomOrgPublicKey(object):
+    """
+    RSA public key verifying the signatures of RANDOM.ORG's signed 
+    responses locally.
+    
+    RANDOM.ORG signs the random object of a response, serialized as 
+    compact JSON, with RSASSA-PKCS1-v1_5 and SHA-512. The signature is
+    verified with a single modular exponentiation, without a request to
+    the server.
+    """
+    
+    def __init__(self, key):
+        """
+        Constructor.
+        
+        Raises a ValueError if key isn't an RSA public key.
+        
+        Keyword arguments:
+        
+        key -- PEM encoded X.509 certificate, SubjectPublicKeyInfo 
+            ('PUBLIC KEY') or PKCS#1 ('RSA PUBLIC KEY'), as a string or
+            bytes, or a tuple of the integers modulus and public 
+            exponent.
+        """
+        
+        if isinstance(key, tuple):
+            self._modulus, self._exponent = key
+        else:
+            self._modulus, self._exponent = self._parse_pem(key)
+        
+        self._size = (self._modulus.bit_length() + 7) // 8
+        if self._size < len(_SHA512_DIGEST_INFO) + 64 + 11:
+            raise ValueError('RSA key too short for SHA-512 signatures')
+    
+    def verify(self, random, signature):
+        """
+        Verify a signature.
+        
+        Return True if signature is RANDOM.ORG's signature of random.
+        
+        Keyword arguments:
+        
+        random -- The random field from a response returned by 
+            RANDOM.ORG through one of the Signed API methods, with its 
+            fields and values in the order received.
+        signature -- The base64 encoded signature field from the same 
+            response.
+        """
+        
+        try:
+            signature = base64.b64decode(signature)
+        except (TypeError, ValueError):
+            return False
+        
+        if len(signature) != self._size:
+            return False
+        
+        value = int(binascii.hexlify(signature), 16)
+        if value >= self._modulus:
+            return False
+        
+        value = pow(value, self._exponent, self._modulus)
+        encoded = binascii.unhexlify('%0*x' % (2 * self._size, value))
+        
+        return encoded == self._encode(_canonical_json(random))
+    
+    def _encode(self, message):
+        # EMSA-PKCS1-v1_5 encoding of the SHA-512 digest of message.
+        digest_info = _SHA512_DIGEST_INFO + hashlib.sha512(message).digest()
+        padding = b'\xff' * (self._size - len(digest_info) - 3)
+        return b'\x00\x01' + padding + b'\x00' + digest_info
+    
+    def _parse_pem(self, key):
+        # Modulus and exponent of a PEM encoded certificate or key.
+        if isinstance(key, bytes):
+            key = key.decode('ascii')
+        
+        match = re.search(r'-----BEGIN ([A-Z ]+)-----(.*?)-----END \1-----', 
+                          key, re.DOTALL)
+        if match is None:
+            raise ValueError('No PEM encoded key found')
+        
+        der = bytearray(base64.b64decode(''.join(match.group(2).split())))
+        label = match.group(1)
+        
+        if label == 'CERTIFICATE':
+            # The SubjectPublicKeyInfo follows the optional version, 
+            # serial number, signature algorithm, issuer, validity and
+            # subject of the TBSCertificate.
+            fields = self._der_children(der, self._der_children(der)[0])
+            if der[fields[0][0]] == 0xa0:
+                fields = fields[1:]
+            return self._parse_public_key_info(der, fields[5])
+        elif label == 'PUBLIC KEY':
+            return self._parse_public_key_info(der, self._der_element(der))
+        elif label == 'RSA PUBLIC KEY':
+            return self._parse_rsa_public_key(der, self._der_element(der))
+        else:
+            raise ValueError('Unsupported PEM type: ' + label)
+    
+    def _parse_public_key_info(self, der, element):
+        # Modulus and exponent of a SubjectPublicKeyInfo, which must 
+        # hold an RSA key.
+        algorithm, key = self._der_children(der, element)
+        if _RSA_ENCRYPTION_OID not in bytes(der[algorithm[1]:algorithm[2]]):
+            raise ValueError('Not an RSA public key')
+        
+        # Skip the number of unused bits of the BIT STRING.
+        return self._parse_rsa_public_key(der, 
+                                          self._der_element(der, key[1] + 1))
+    
+    def _parse_rsa_public_key(self, der, element):
+        # Modulus and exponent of a PKCS#1 RSAPublicKey.
+        modulus, exponent = self._der_children(der, element)[:2]
+        return (int(binascii.hexlify(der[modulus[1]:modulus[2]]), 16), 
+                int(binascii.hexlify(der[exponent[1]:exponent[2]]), 16))
+    
+    def _der_children(self, der, element=None):
+        # Elements contained in a constructed DER element, by default 
+        # the outermost one.
+        if element is None:
+            element = self._der_element(der)
+        
+        children = []
+        offset = element[1]
+        while offset < element[2]:
+            child = self._der_element(der, offset)
+            children.append(child)
+            offset = child[2]
+        
+        return children
+    
+    def _der_element(self, der, offset=0):
+        # Offsets of the tag, contents and end of the DER element at 
+        # offset.
+        try:
+            length = der[offset + 1]
+            start = offset + 2
+            if length & 0x80:
+                size = length & 0x7f
+                length = int(binascii.hexlify(der[start:start+size]), 16)
+                start += size
+        except (IndexError, ValueError):
+            raise ValueError('Malformed DER encoding')
+        
+        if start + length > len(der):
+            raise ValueError('Malformed DER encoding')
+        
+        return (offset, start, start + length)
+
+
+class _RandomOrgVerificationCache(object):
+    """
+    Bounded LRU cache of the outcomes of signature verifications with 
+    the server, optionally backed by a dbm database keeping them 
+    across restarts.
+    
+    Outcomes are keyed by a digest of the random object and signature
+    verified. An outcome found only in the database is moved into the 
+    LRU cache.
+    """
+    
+    def __init__(self, size, path=None):
+        """
+        Constructor.
+        
+        Keyword arguments:
+        
+        size -- number of outcomes kept in memory.
+        path -- path of the dbm database in which to keep all outcomes,
+            or None to keep them in memory only (default None).
+        """
+        
+        self._size = size
+        self._lock = threading.Lock()
+        self._outcomes = OrderedDict()
+        
+        if path is None:
+            self._database = None
+        else:
+            self._database = dbm.open(path, 'c')
+    
+    def get(self, digest):
+        """
+        Return the outcome of the verification with digest, or None if
+        unknown.
+        """
+        
+        self._lock.acquire()
+        try:
+            authentic = self._outcomes.pop(digest, None)
+            
+            if authentic is None and self._database is not None:
+                try:
+                    authentic = self._database[digest] == b'1'
+                except KeyError:
+                    return None
+            
+            if authentic is not None:
+                self._remember(digest, authentic)
+            
+            return authentic
+        finally:
+            self._lock.release()
+    
+    def put(self, digest, authentic):
+        """
+        Keep the outcome of the verification with digest.
+        """
+        
+        self._lock.acquire()
+        try:
+            self._outcomes.pop(digest, None)
+            self._remember(digest, authentic)
+            
+            # Every outcome costs a request, so the database may be 
+            # synchronized with disk for each.
+            if self._database is not None:
+                self._database[digest] = b'1' if authentic else b'0'
+                if hasattr(self._database, 'sync'):
+                    self._database.sync()
+        finally:
+            self._lock.release()
+    
+    def _remember(self, digest, authentic):
+        # Add outcome as the most recently used, evicting the least 
+        # recently used beyond size.
+        self._outcomes[digest] = authentic
+        while len(self._outcomes) > self._size:
+            self._outcomes.popitem(last=False)
+
+
+def _verify_chunk(key, pairs):
+    # Authenticity of each (random, signature) pair, in a worker process.
+    return [key.verify(random, signature) for random, signature in pairs]
+
+
+class _RandomOrgFloat(float):
+    """
+    Number of a signed response, keeping the text RANDOM.ORG sent.
+    
+    RANDOM.ORG signs the random object as it serialized it, e.g., 
+    0.00001 rather than Python's 1e-05, so decimal fractions and 
+    gaussians are kept as float subclasses remembering their text, 
+    which is serialized again when verifying the signature.
+    """
+    
+    def __new__(cls, text):
+        value = float.__new__(cls, text)
+        value.text = text
+        return value
+
+
+def _parse_response(content, request):
+    # Parse the body of the response to request. Responses to signed 
+    # methods keep the order of fields and the text of numbers as 
+    # received, so that their random objects serialize as signed.
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+    
+    requests = request if isinstance(request, list) else [request]
+    if not any(r.get('method') in _SIGNED_METHODS for r in requests):
+        return json.loads(content)
+    
+    return json.loads(content, object_pairs_hook=OrderedDict, 
+                      parse_float=_RandomOrgFloat)
+
+
+def _signed_json(value):
+    # Compact JSON of value with fields in the order received and 
+    # numbers of signed responses as received.
+    if isinstance(value, dict):
+        return '{' + ','.join(json.dumps(name, ensure_ascii=False) + ':' 
+                              + _signed_json(item) 
+                              for name, item in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_signed_json(item) for item in value) + ']'
+    if isinstance(value, _RandomOrgFloat):
+        return value.text
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _canonical_json(random):
+    # Serialization of a random object signed by RANDOM.ORG: compact 
+    # JSON with fields and numbers as received.
+    text = _signed_json(random)
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return text
+
+
+class _RandomOrgClientBase(object):
+    """
+    Base class for RANDOM.ORG API clients.
+    
+    Implements the public API methods shared by RandomOrgClient and 
+    AsyncRandomOrgClient in terms of _invoke, which subclasses 
+    implement to issue requests, together with the advisory delay, 
+    backoff and error handling common to all clients.
+    """
+    
+    # Basic methods for generating randomness, see:
+    # https://api.random.org/json-rpc/4/basic
+    
+    def generate_integers(self, n, min, max, replacement=True, base=10, 
+                          pregenerated_randomization=None, 
+                          output=_OUTPUT_LIST, decode=False):
+        """
+        Generate random integers.
+        
+        Request and return a list (size n) of true random integers 
+        within a user-defined range from the server. See:
+        https://api.random.org/json-rpc/4/basic#generateIntegers
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
         https://requests.readthedocs.io/en/latest/api/#exceptions
         
         Keyword arguments:
         
-        n -- How many random decimal fractions you need. Must be within
-            the [1,1e4] range.
-        decimal_places -- The number of decimal places to use. Must be 
-            within the [1,20] range.
+        n -- How many random integers you need. Must be within the 
+            [1,1e4] range.
+        min -- The lower boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        max -- The upper boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
         replacement -- Specifies whether the random numbers should be 
             picked with replacement. If True the resulting numbers may 
             contain duplicate values, otherwise the numbers will all be
             unique (default True).
+        base -- The base used to display the numbers in the sequences.
+            Must be an integer with the value 2, 8, 10 or 16.
         pregenerated_randomization -- Allows the client to specify that 
             the random values should be generated from a pregenerated, 
             historical randomization instead of a one-time on-the-fly 
@@ -1442,47 +3202,34 @@ class RandomOrgClient(object):
               manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
               "PERSISTENT-IDENTIFIER" is a string with length in the 
               [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
+        output -- The type in which the numbers are returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy. Numbers in a base other than 10 are decoded
+            for a NumPy array (default 'list').
+        decode -- Specifies whether numbers in a base other than 10 are
+            decoded and returned as integers rather than strings 
+            (default False).
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 
-                   'decimalPlaces':decimal_places, 'replacement':replacement,
-                   'pregeneratedRandomization':pregenerated_randomization, 
-                   'licenseData':license_data, 'userData':user_data, 
-                   'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_DECIMAL_FRACTION_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_doubles)
+        params = { 'apiKey':self._api_key, 'n':n, 'min':min, 'max':max, 
+                  'replacement':replacement, 'base':base, 
+                  'pregeneratedRandomization':pregenerated_randomization }
+        self._check_output(output)
+        
+        return self._invoke(_INTEGER_METHOD, params, self._extract_ints,
+                            base == 10, output, 
+                            self._decode_base(base, output, decode))
     
-    def generate_signed_gaussians(self, n, mean, standard_deviation, 
-                                  significant_digits, 
-                                  pregenerated_randomization=None, 
-                                  license_data=None, user_data=None, 
-                                  ticket_id=None):
+    def generate_integer_sequences(self, n, length, min, max, replacement=True, 
+                                   base=10, pregenerated_randomization=None, 
+                                   output=_OUTPUT_LIST, decode=False):
         """
-        Generate digitally signed random numbers.
+        Generate random integer sequences.
         
-        Request a list (size n) of true random numbers from a Gaussian 
-        distribution (also known as a normal distribution). The form 
-        uses a Box-Muller Transform to generate the Gaussian 
-        distribution from uniformly distributed numbers. Returns a 
-        dictionary object with the parsed random number list mapped to
-        'data', the original response mapped to 'random', and the 
-        response's signature mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedGaussians
+        Request and return a list (size n) of uniform or multiform 
+        sequences of true random integers 
+        within a user-defined range from the server. See:
+        https://api.random.org/json-rpc/4/basic#generateIntegerSequences
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1505,18 +3252,6 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyInvalidVersionError if this API key is not 
         valid for the version of the API invoked.
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
-
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
-
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
-        
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
-        
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
@@ -1528,14 +3263,27 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        n -- How many random numbers you need. Must be within the 
-            [1,1e4] range.
-        mean -- The distribution's mean. Must be within the [-1e6,1e6] 
-            range.
-        standard_deviation -- The distribution's standard deviation. 
-            Must be within the [-1e6,1e6] range.
-        significant_digits -- The number of significant digits to use. 
-            Must be within the [2,20] range.
+        n -- How many integer sequences you need. Must be within the 
+            [1,1e3] range.
+        length -- Lengths of the sequences requested. Uniform: Must be 
+            an integer within the [1,1e4] range. Multiform: an array of 
+            length n where each value is within the [1,1e4] range and 
+            the sum of all n values is within the [1,1e4] range.  
+        min -- The lower boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        max -- The upper boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        replacement -- Specifies whether the random numbers should be 
+            picked with replacement. If True the resulting numbers may 
+            contain duplicate values, otherwise the numbers will all be
+            unique (default True). For multiform sequences this can be
+            an array of n boolean values, each specifying whether the 
+            sequence identified by its index will be created with (true) 
+            or without (false) replacement.
+        base -- The base used to display the numbers in the sequences.
+            Must be an integer with the value 2, 8, 10 or 16. For multiform
+            sequences the values may be an array of length n with values 
+            taken from the same set.  
         pregenerated_randomization -- Allows the client to specify that 
             the random values should be generated from a pregenerated, 
             historical randomization instead of a one-time on-the-fly 
@@ -1550,45 +3298,35 @@ class RandomOrgClient(object):
               manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
               "PERSISTENT-IDENTIFIER" is a string with length in the 
               [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
+        output -- The type in which the sequences are returned. Values
+            allowed are 'list' and 'numpy' for a 2-D NumPy array if all
+            sequences have the same length, or else a list of NumPy 
+            arrays. 'numpy' requires numpy. Numbers in a base other than
+            10 are decoded for NumPy arrays (default 'list').
+        decode -- Specifies whether numbers in a base other than 10 are
+            decoded and returned as integers rather than strings 
+            (default False).
         """
+        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 'min':min, 
+                  'max':max, 'replacement':replacement, 'base':base, 
+                  'pregeneratedRandomization':pregenerated_randomization }
+        self._check_output(output)
         
-        params = { 'apiKey':self._api_key, 'n':n, 'mean':mean,
-                   'standardDeviation':standard_deviation, 
-                   'significantDigits':significant_digits, 
-                   'pregeneratedRandomization':pregenerated_randomization, 
-                   'licenseData':license_data, 'userData':user_data, 
-                   'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_GAUSSIAN_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_doubles)
+        return self._invoke(_INTEGER_SEQUENCES_METHOD, params,
+                            self._extract_int_sequences, base == 10, output, 
+                            self._decode_base(base, output, decode))
     
-    def generate_signed_strings(self, n, length, characters, 
-                                replacement=True, 
-                                pregenerated_randomization=None, 
-                                license_data=None, user_data=None, 
-                                ticket_id=None):
+    def generate_decimal_fractions(self, n, decimal_places, replacement=True, 
+                                   pregenerated_randomization=None, 
+                                   output=_OUTPUT_LIST):
         """
-        Generate digitally signed random strings.
+        Generate random decimal fractions.
         
-        Request a list (size n) of true random strings from the server.
-        Returns a dictionary object with the parsed random string list 
-        mapped to 'data', the original response mapped to 'random', and
-        the response's signature mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedStrings
+        Request and return a list (size n) of true random decimal 
+        fractions, from a uniform distribution across the [0,1] 
+        interval with a user-defined number of decimal places from the
+        server. See:
+        https://api.random.org/json-rpc/4/basic#generateDecimalFractions
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1611,18 +3349,6 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyInvalidVersionError if this API key is not 
         valid for the version of the API invoked.
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
-
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
-
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
-        
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
-        
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
@@ -1634,17 +3360,14 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        n -- How many random strings you need. Must be within the 
-            [1,1e4] range.
-        length -- The length of each string. Must be within the [1,20] 
-            range. All strings will be of the same length.
-        characters -- A string that contains the set of characters that
-            are allowed to occur in the random strings. The maximum 
-            number of characters is 80.
-        replacement -- Specifies whether the random strings should be 
-            picked with replacement. If True the resulting list of 
-            strings may contain duplicates, otherwise the strings will 
-            all be unique (default True).
+        n -- How many random decimal fractions you need. Must be within
+            the [1,1e4] range.
+        decimal_places -- The number of decimal places to use. Must be 
+            within the [1,20] range.
+        replacement -- Specifies whether the random numbers should be 
+            picked with replacement. If True the resulting numbers may 
+            contain duplicate values, otherwise the numbers will all be
+            unique (default True).
         pregenerated_randomization -- Allows the client to specify that 
             the random values should be generated from a pregenerated, 
             historical randomization instead of a one-time on-the-fly 
@@ -1659,44 +3382,30 @@ class RandomOrgClient(object):
               manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
               "PERSISTENT-IDENTIFIER" is a string with length in the 
               [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
+        output -- The type in which the numbers are returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy (default 'list').
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 
-                   'characters':characters, 'replacement':replacement, 
-                   'pregeneratedRandomization':pregenerated_randomization, 
-                   'licenseData':license_data, 'userData':user_data, 
-                   'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_STRING_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_strings)
+        params = { 'apiKey':self._api_key, 'n':n, 
+                   'decimalPlaces':decimal_places, 'replacement':replacement, 
+                   'pregeneratedRandomization':pregenerated_randomization }
+        self._check_output(output)
+        
+        return self._invoke(_DECIMAL_FRACTION_METHOD, params,
+                            self._extract_doubles, output)
     
-    def generate_signed_UUIDs(self, n, pregenerated_randomization=None, 
-                              license_data=None, user_data=None, 
-                              ticket_id=None):
+    def generate_gaussians(self, n, mean, standard_deviation, significant_digits, 
+                           pregenerated_randomization=None, 
+                           output=_OUTPUT_LIST):
         """
-        Generate digitally signed random UUIDs.
+        Generate random numbers.
         
-        Request a list (size n) of version 4 true random Universally 
-        Unique IDentifiers (UUIDs) in accordance with section 4.4 of 
-        RFC 4122, from the server. Returns a dictionary object with the
-        parsed random UUID list mapped to 'data', the original response
-        mapped to 'random', and the response's signature mapped to 
-        'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedUUIDs
+        Request and return a list (size n) of true random numbers from 
+        a Gaussian distribution (also known as a normal distribution). 
+        The form uses a Box-Muller Transform to generate the Gaussian 
+        distribution from uniformly distributed numbers. See:
+        https://api.random.org/json-rpc/4/basic#generateGaussians
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1719,18 +3428,6 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyInvalidVersionError if this API key is not 
         valid for the version of the API invoked.
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
-
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
-
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
-        
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
-        
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
@@ -1742,8 +3439,14 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        n -- How many random UUIDs you need. Must be within the [1,1e3]
+        n -- How many random numbers you need. Must be within the 
+            [1,1e4] range.
+        mean -- The distribution's mean. Must be within the [-1e6,1e6] 
             range.
+        standard_deviation -- The distribution's standard deviation. 
+            Must be within the [-1e6,1e6] range.
+        significant_digits -- The number of significant digits to use. 
+            Must be within the [2,20] range.
         pregenerated_randomization -- Allows the client to specify that 
             the random values should be generated from a pregenerated, 
             historical randomization instead of a one-time on-the-fly 
@@ -1758,43 +3461,28 @@ class RandomOrgClient(object):
               manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
               "PERSISTENT-IDENTIFIER" is a string with length in the 
               [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
+        output -- The type in which the numbers are returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy (default 'list').
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 
-                  'pregeneratedRandomization':pregenerated_randomization, 
-                  'licenseData':license_data, 'userData':user_data, 
-                  'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_UUID_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_UUIDs)
+        params = { 'apiKey':self._api_key, 'n':n, 'mean':mean,
+                   'standardDeviation':standard_deviation, 
+                   'significantDigits':significant_digits, 
+                   'pregeneratedRandomization':pregenerated_randomization }
+        self._check_output(output)
+        
+        return self._invoke(_GAUSSIAN_METHOD, params, self._extract_doubles, 
+                            output)
     
-    def generate_signed_blobs(self, n, size, format=_BLOB_FORMAT_BASE64, 
-                              pregenerated_randomization=None, 
-                              license_data=None, user_data=None, 
-                              ticket_id=None):
+    def generate_strings(self, n, length, characters, replacement=True, 
+                         pregenerated_randomization=None):
         """
-        Generate digitally signed random BLOBs.
+        Generate random strings.
         
-        Request a list (size n) of Binary Large OBjects (BLOBs) 
-        containing true random data from the server. Returns a 
-        dictionary object with the parsed random BLOB list mapped to 
-        'data', the original response mapped to 'random', and the 
-        response's signature mapped to 'signature'. See:
-        https://api.random.org/json-rpc/4/signed#generateSignedBlobs
+        Request and return a list (size n) of true random unicode 
+        strings from the server. See:
+        https://api.random.org/json-rpc/4/basic#generateStrings
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1817,18 +3505,6 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyInvalidVersionError if this API key is not 
         valid for the version of the API invoked.
         
-        Raises a RandomOrgTicketNonExistentError if the ticket used 
-        does not exist.
-
-        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
-        exists but is not associated with the API key specified.
-
-        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
-        been used.
-        
-        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
-        number of singleton tickets for this API key has been reached.
-        
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
@@ -1840,13 +3516,17 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        n -- How many random blobs you need. Must be within the [1,100]
-            range.
-        size -- The size of each blob, measured in bits. Must be within
-            the [1,1048576] range and must be divisible by 8.
-        format -- Specifies the format in which the blobs will be 
-            returned. Values allowed are _BLOB_FORMAT_BASE64 and 
-            _BLOB_FORMAT_HEX (default _BLOB_FORMAT_BASE64).
+        n -- How many random strings you need. Must be within the 
+            [1,1e4] range.
+        length -- The length of each string. Must be within the [1,20] 
+            range. All strings will be of the same length.
+        characters -- A string that contains the set of characters that
+            are allowed to occur in the random strings. The maximum 
+            number of characters is 80.
+        replacement -- Specifies whether the random strings should be 
+            picked with replacement. If True the resulting list of 
+            strings may contain duplicates, otherwise the strings will 
+            all be unique (default True).
         pregenerated_randomization -- Allows the client to specify that 
             the random values should be generated from a pregenerated, 
             historical randomization instead of a one-time on-the-fly 
@@ -1861,38 +3541,21 @@ class RandomOrgClient(object):
               manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
               "PERSISTENT-IDENTIFIER" is a string with length in the 
               [1,64] range
-        license_data -- Allows the caller to include data of relevance to 
-            the license that is associated with the API Key.This is mandatory
-            for API Keys with the license type "Flexible Gambling" and follows
-            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
-            This information is used in licensing requested random values and 
-            in billing. The currently supported currencies are: "USD".
-        user_data -- Contains an optional object that will be included 
-            in unmodified form in the signed response along with the 
-            random data. If an object is present, its maximum size in 
-            encoded (string) form is 1,000 characters.
-        ticket_id -- A string with ticket identifier obtained via the 
-            create_tickets method. Specifying a value for ticket_id will 
-            cause RANDOM.ORG to record that the ticket was used to generate 
-            the requested random values. Each ticket can only be used once.
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'size':size, 
-                  'format':format, 
-                  'pregeneratedRandomization':pregenerated_randomization, 
-                  'licenseData':license_data, 'userData':user_data, 
-                  'ticketId':ticket_id }
-        request = self._generate_request(_SIGNED_BLOB_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_blobs)
-    
-    def get_result(self, serial_number):
+        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 
+                   'characters':characters, 'replacement':replacement, 
+                   'pregeneratedRandomization':pregenerated_randomization }
+        return self._invoke(_STRING_METHOD, params, self._extract_strings)
+    
+    def generate_UUIDs(self, n, pregenerated_randomization=None):
         """
-        Retrieve previously generated results. 
+        Generate random UUIDs.
         
-        Retrieve results generated using signed methods within the last 
-        24 hours using its serialNumber. See:
-        https://api.random.org/json-rpc/4/signed#getResult  
+        Request and return a list (size n) of version 4 true random 
+        Universally Unique IDentifiers (UUIDs) in accordance with 
+        section 4.4 of RFC 4122, from the server. See:
+        https://api.random.org/json-rpc/4/basic#generateUUIDs
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1925,22 +3588,39 @@ class RandomOrgClient(object):
         https://requests.readthedocs.io/en/latest/api/#exceptions
         
         Keyword arguments:
-        serial_number -- An integer containing the serial number 
-            associated with the response you wish to retrieve.
         
+        n -- How many random UUIDs you need. Must be within the [1,1e3]
+            range.
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
         """
-        params = { 'apiKey':self._api_key, 'serialNumber':serial_number}
-        request = self._generate_request(_GET_RESULT_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_signed_response(response, self._extract_response)
+        
+        params = { 'apiKey':self._api_key, 'n':n, 
+                  'pregeneratedRandomization':pregenerated_randomization }
+        return self._invoke(_UUID_METHOD, params, self._extract_UUIDs)
     
-    def create_tickets(self, n, show_result):
+    def generate_blobs(self, n, size, format=_BLOB_FORMAT_BASE64, 
+                       pregenerated_randomization=None, 
+                       output=_OUTPUT_LIST):
         """
-        Create tickets to be used in signed value-generating methods. 
+        Generate random BLOBs.
         
-        This method creates a number of tickets. The tickets can be 
-        used in one of the methods that generate random values. See:
-        https://api.random.org/json-rpc/4/signed#createTickets
+        Request and return a list (size n) of Binary Large OBjects 
+        (BLOBs) as unicode strings containing true random data from the
+        server, or the decoded data if requested. See:
+        https://api.random.org/json-rpc/4/basic#generateBlobs
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -1948,7 +3628,7 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyNonExistentError if this API key does not 
         exist.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
         
         Raises a RandomOrgInsufficientRequestsError if this API key's 
         server requests allowance has been exceeded and the instance is
@@ -1974,40 +3654,58 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        n -- The number of tickets requested. This must be a number 
-            in the [1, 50] range.
-        showResult -- A boolean value that determines how much information 
-            calls to get_ticket will return. If show_result is false, getTicket 
-            will return only the basic ticket information. If show_result is 
-            true, the full random and signature objects from the response that 
-            was used to satisfy the ticket is returned.        
+        n -- How many random blobs you need. Must be within the [1,100]
+            range.
+        size -- The size of each blob, measured in bits. Must be within
+            the [1,1048576] range and must be divisible by 8.
+        format -- Specifies the format in which the blobs will be 
+            returned. Values allowed are _BLOB_FORMAT_BASE64 and 
+            _BLOB_FORMAT_HEX (default _BLOB_FORMAT_BASE64).
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        output -- The type in which the blobs are returned. Values 
+            allowed are 'list' for strings in format, 'bytes' for 
+            decoded bytes and 'memoryview' for read-only memoryview 
+            slices of a single bytes object, into which all blobs of 
+            the response are decoded together (default 'list').
         """
         
-        params = { 'apiKey':self._api_key, 'n':n, 'showResult':show_result }
-        request = self._generate_request(_CREATE_TICKETS_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_result(response)
+        params = { 'apiKey':self._api_key, 'n':n, 'size':size, 'format':format, 
+                  'pregeneratedRandomization':pregenerated_randomization }
+        self._check_output(output, _BLOB_OUTPUTS)
+        
+        return self._invoke(_BLOB_METHOD, params, self._extract_blobs, 
+                            format, output)
     
-    def reveal_tickets(self, ticket_id):
+    
+    # Signed methods for generating randomness, see:
+    # https://api.random.org/json-rpc/4/signed
+    
+    def generate_signed_integers(self, n, min, max, replacement=True, 
+                                 base=10, pregenerated_randomization=None, 
+                                 license_data=None, user_data=None, 
+                                 ticket_id=None):
         """
-        Change the show_result value of a ticket and its predecessors to
-        "True".
+        Generate digitally signed random integers.
         
-        This method marks a specific ticket and all its predecessors in its
-        chain as being revealed, meaning that subsequent calls to get_ticket
-        will return the full details of the tickets, including the random
-        values produced when the tickets were used. Using reveal_tickets
-        effectively changes the value of show_result (which was specified
-        when the first ticket in the chain was created using create_tickets)
-        from "False" to "True". The reason that not only the ticket specified
-        (but also its predecessors in its chain) are revealed is to ensure
-        maximum transparency. The method does not affect any successors to
-        the ticket in the chain. Returns a number value that specifies how
-        many tickets were revealed. This will include the ticket specified
-        as well as all its predecessors. If this method is invoked on a ticket
-        that is already revealed (or which was created with show_result set
-        to True), then the value returned will be zero. See:
-        https://api.random.org/json-rpc/4/signed#revealTickets
+        Request a list (size n) of true random integers within a 
+        user-defined range from the server. Returns a dictionary object 
+        with the parsed integer list mapped to 'data', the original 
+        response mapped to 'random', and the response's signature 
+        mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedIntegers
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -2015,7 +3713,7 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyNonExistentError if this API key does not 
         exist.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
         
         Raises a RandomOrgInsufficientRequestsError if this API key's 
         server requests allowance has been exceeded and the instance is
@@ -2032,9 +3730,15 @@ class RandomOrgClient(object):
         
         Raises a RandomOrgTicketNonExistentError if the ticket used 
         does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
         
-        Raises a RandomOrgTicketNotYetUsedError if the ticket specified
-        has not yet been used.
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
         
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
@@ -2047,74 +3751,71 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        ticket_id -- A string value that uniquely identifies the ticket.
-        """
-        params = { 'apiKey':self._api_key, 'ticketId':ticket_id }
-        request = self._generate_request(_REVEAL_TICKETS_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_result(response)
-    
-    def list_tickets(self, ticket_type):
+        n -- How many random integers you need. Must be within the 
+            [1,1e4] range.
+        min -- The lower boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        max -- The upper boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        replacement -- Specifies whether the random numbers should be 
+            picked with replacement. If True the resulting numbers may 
+            contain duplicate values, otherwise the numbers will all be
+            unique (default True).
+        base -- The base used to display the numbers in the sequences.
+            Must be an integer with the value 2, 8, 10 or 16.
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
         """
-        Obtain information about tickets linked with your API key.
-        
-        This method obtains information about tickets that exist 
-        for a given API key. See:
-        https://api.random.org/json-rpc/4/signed#listTickets
-        
-        Raises a RandomOrgSendTimeoutError if time spent waiting before
-        request is sent exceeds this instance's blocking_timeout.
-        
-        Raises a RandomOrgKeyNonExistentError if this API key does not 
-        exist.
-        
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
-        
-        Raises a RandomOrgInsufficientRequestsError if this API key's 
-        server requests allowance has been exceeded and the instance is
-        backing off until midnight UTC.
         
-        Raises a RandomOrgInsufficientBitsError if this API key's 
-        server bits allowance has been exceeded.
-        
-        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
-        valid for this method.
-        
-        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
-        valid for the version of the API invoked.
-        
-        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
-        
-        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
-        https://api.random.org/json-rpc/4/error-codes
-        
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
-        
-        Keyword arguments:
-        
-        ticket_type -- A string describing the type of tickets you want to obtain 
-            information about. Possible values are singleton, head and tail. 
-            Specifying singleton will cause list_tickets to return tickets that 
-            have no previous or next tickets. Specifying head will return tickets 
-            that do not have a previous ticket but that do have a next ticket. 
-            Specifying tail will cause list_tickets to return tickets that have a 
-            previous ticket but do not have a next ticket. 
-        """
-        params = { 'apiKey':self._api_key, 'ticketType':ticket_type }
-        request = self._generate_request(_LIST_TICKETS_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_result(response)
+        params = { 'apiKey':self._api_key, 'n':n, 'min':min, 'max':max, 
+                  'replacement':replacement, 'base':base, 
+                  'pregeneratedRandomization':pregenerated_randomization, 
+                  'licenseData':license_data, 'userData':user_data, 
+                  'ticketId':ticket_id }
+        return self._invoke(_SIGNED_INTEGER_METHOD, params,
+                            self._extract_signed_response, self._extract_ints,
+                            base == 10)
     
-    def get_ticket(self, ticket_id):
+    def generate_signed_integer_sequences(self, n, length, min, max, 
+                                          replacement=True, base=10, 
+                                          pregenerated_randomization=None, 
+                                          license_data=None, user_data=None, 
+                                          ticket_id=None):
         """
-        Obtain information about a single ticket. 
+        Generate digitally signed sequences of random integers.
         
-        This method obtains information about a single ticket. If
-        the ticket has showResult set to true and has been used, 
-        get ticket will return the values generated. See:
-        https://api.random.org/json-rpc/4/signed#getTicket
+        Request a list (size n) of sequences of true random integers within 
+        a user-defined range from the server. Returns a dictionary object 
+        with the parsed integer list mapped to 'data', the original 
+        response mapped to 'random', and the response's signature 
+        mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedIntegerSequences
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -2122,7 +3823,7 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyNonExistentError if this API key does not 
         exist.
         
-        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
         
         Raises a RandomOrgInsufficientRequestsError if this API key's 
         server requests allowance has been exceeded and the instance is
@@ -2139,6 +3840,15 @@ class RandomOrgClient(object):
         
         Raises a RandomOrgTicketNonExistentError if the ticket used 
         does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
         
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
@@ -2151,28 +3861,189 @@ class RandomOrgClient(object):
         
         Keyword arguments:
         
-        ticket_id -- A string containing a ticket identifier returned by a prior 
-        call to the create_tickets method.
+        n -- How many integer sequences you need. Must be within the 
+            [1,1e3] range.
+        length -- Lengths of the sequences requested. Uniform: Must be 
+            an integer within the [1,1e4] range. Multiform: an array of 
+            length n where each value is within the [1,1e4] range and 
+            the sum of all n values is within the [1,1e4] range.  
+        min -- The lower boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        max -- The upper boundary for the range from which the random 
+            numbers will be picked. Must be within the [-1e9,1e9] range.
+        replacement -- Specifies whether the random numbers should be 
+            picked with replacement. If True the resulting numbers may 
+            contain duplicate values, otherwise the numbers will all be
+            unique (default True). For multiform sequences this can be
+            an array of n boolean values, each specifying whether the 
+            sequence identified by its index will be created with (true) 
+            or without (false) replacement.
+        base -- The base used to display the numbers in the sequences.
+            Must be an integer with the value 2, 8, 10 or 16. For multiform
+            sequences the values may be an array of length n with values 
+            taken from the same set.
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
         """
         
-        params = { 'ticketId':ticket_id }
-        request = self._generate_request(_GET_TICKET_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_result(response)
-    
+        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 'min':min,
+                  'max':max, 'replacement':replacement, 'base':base, 
+                  'pregeneratedRandomization':pregenerated_randomization, 
+                  'licenseData':license_data, 'userData':user_data, 
+                  'ticketId':ticket_id }
+        return self._invoke(_SIGNED_INTEGER_SEQUENCES_METHOD, params,
+                            self._extract_signed_response,
+                            self._extract_int_sequences, base == 10)
     
-    # Signature verification for signed methods, see:
-    # https://api.random.org/json-rpc/4/signed
+    def generate_signed_decimal_fractions(self, n, decimal_places, 
+                                          replacement=True, 
+                                          pregenerated_randomization=None, 
+                                          license_data=None, user_data=None, 
+                                          ticket_id=None):
+        """
+        Generate digitally signed random decimal fractions.
+        
+        Request a list (size n) of true random decimal fractions, from
+        a uniform distribution across the [0,1] interval with a 
+        user-defined number of decimal places from the server. Returns 
+        a dictionary object with the parsed decimal fraction list 
+        mapped to 'data', the original response mapped to 'random', and
+        the response's signature mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedDecimalFractions
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- How many random decimal fractions you need. Must be within
+            the [1,1e4] range.
+        decimal_places -- The number of decimal places to use. Must be 
+            within the [1,20] range.
+        replacement -- Specifies whether the random numbers should be 
+            picked with replacement. If True the resulting numbers may 
+            contain duplicate values, otherwise the numbers will all be
+            unique (default True).
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 
+                   'decimalPlaces':decimal_places, 'replacement':replacement,
+                   'pregeneratedRandomization':pregenerated_randomization, 
+                   'licenseData':license_data, 'userData':user_data, 
+                   'ticketId':ticket_id }
+        return self._invoke(_SIGNED_DECIMAL_FRACTION_METHOD, params,
+                            self._extract_signed_response,
+                            self._extract_doubles)
     
-    def verify_signature(self, random, signature):
+    def generate_signed_gaussians(self, n, mean, standard_deviation, 
+                                  significant_digits, 
+                                  pregenerated_randomization=None, 
+                                  license_data=None, user_data=None, 
+                                  ticket_id=None):
         """
-        Verify the signature of a previously received response.
+        Generate digitally signed random numbers.
         
-        Verify the signature of a response previously received from one
-        of the methods in the Signed API with the server. This is used
-        to examine the authenticity of numbers. Return True on 
-        verification success. See:
-        https://api.random.org/json-rpc/4/signed#verifySignature
+        Request a list (size n) of true random numbers from a Gaussian 
+        distribution (also known as a normal distribution). The form 
+        uses a Box-Muller Transform to generate the Gaussian 
+        distribution from uniformly distributed numbers. Returns a 
+        dictionary object with the parsed random number list mapped to
+        'data', the original response mapped to 'random', and the 
+        response's signature mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedGaussians
         
         Raises a RandomOrgSendTimeoutError if time spent waiting before
         request is sent exceeds this instance's blocking_timeout.
@@ -2195,118 +4066,1743 @@ class RandomOrgClient(object):
         Raises a RandomOrgKeyInvalidVersionError if this API key is not 
         valid for the version of the API invoked.
         
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
+        
         Raises a ValueError on RANDOM.ORG Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
         Raises a RuntimeError on JSON-RPC Errors, error descriptions:
         https://api.random.org/json-rpc/4/error-codes
         
-        Can also raise connection errors as described here:
-        https://requests.readthedocs.io/en/latest/api/#exceptions
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- How many random numbers you need. Must be within the 
+            [1,1e4] range.
+        mean -- The distribution's mean. Must be within the [-1e6,1e6] 
+            range.
+        standard_deviation -- The distribution's standard deviation. 
+            Must be within the [-1e6,1e6] range.
+        significant_digits -- The number of significant digits to use. 
+            Must be within the [2,20] range.
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 'mean':mean,
+                   'standardDeviation':standard_deviation, 
+                   'significantDigits':significant_digits, 
+                   'pregeneratedRandomization':pregenerated_randomization, 
+                   'licenseData':license_data, 'userData':user_data, 
+                   'ticketId':ticket_id }
+        return self._invoke(_SIGNED_GAUSSIAN_METHOD, params,
+                            self._extract_signed_response,
+                            self._extract_doubles)
+    
+    def generate_signed_strings(self, n, length, characters, 
+                                replacement=True, 
+                                pregenerated_randomization=None, 
+                                license_data=None, user_data=None, 
+                                ticket_id=None):
+        """
+        Generate digitally signed random strings.
+        
+        Request a list (size n) of true random strings from the server.
+        Returns a dictionary object with the parsed random string list 
+        mapped to 'data', the original response mapped to 'random', and
+        the response's signature mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedStrings
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- How many random strings you need. Must be within the 
+            [1,1e4] range.
+        length -- The length of each string. Must be within the [1,20] 
+            range. All strings will be of the same length.
+        characters -- A string that contains the set of characters that
+            are allowed to occur in the random strings. The maximum 
+            number of characters is 80.
+        replacement -- Specifies whether the random strings should be 
+            picked with replacement. If True the resulting list of 
+            strings may contain duplicates, otherwise the strings will 
+            all be unique (default True).
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 'length':length, 
+                   'characters':characters, 'replacement':replacement, 
+                   'pregeneratedRandomization':pregenerated_randomization, 
+                   'licenseData':license_data, 'userData':user_data, 
+                   'ticketId':ticket_id }
+        return self._invoke(_SIGNED_STRING_METHOD, params,
+                            self._extract_signed_response,
+                            self._extract_strings)
+    
+    def generate_signed_UUIDs(self, n, pregenerated_randomization=None, 
+                              license_data=None, user_data=None, 
+                              ticket_id=None):
+        """
+        Generate digitally signed random UUIDs.
+        
+        Request a list (size n) of version 4 true random Universally 
+        Unique IDentifiers (UUIDs) in accordance with section 4.4 of 
+        RFC 4122, from the server. Returns a dictionary object with the
+        parsed random UUID list mapped to 'data', the original response
+        mapped to 'random', and the response's signature mapped to 
+        'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedUUIDs
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- How many random UUIDs you need. Must be within the [1,1e3]
+            range.
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 
+                  'pregeneratedRandomization':pregenerated_randomization, 
+                  'licenseData':license_data, 'userData':user_data, 
+                  'ticketId':ticket_id }
+        return self._invoke(_SIGNED_UUID_METHOD, params,
+                            self._extract_signed_response, self._extract_UUIDs)
+    
+    def generate_signed_blobs(self, n, size, format=_BLOB_FORMAT_BASE64, 
+                              pregenerated_randomization=None, 
+                              license_data=None, user_data=None, 
+                              ticket_id=None):
+        """
+        Generate digitally signed random BLOBs.
+        
+        Request a list (size n) of Binary Large OBjects (BLOBs) 
+        containing true random data from the server. Returns a 
+        dictionary object with the parsed random BLOB list mapped to 
+        'data', the original response mapped to 'random', and the 
+        response's signature mapped to 'signature'. See:
+        https://api.random.org/json-rpc/4/signed#generateSignedBlobs
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+
+        Raises a RandomOrgTicketAPIKeyMismatchError if the ticket used 
+        exists but is not associated with the API key specified.
+
+        Raises a RandomOrgTicketAlreadyUsedError if a ticket has already 
+        been used.
+        
+        Raises a RandomOrgTooManySingletonTicketsError when the maximum 
+        number of singleton tickets for this API key has been reached.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- How many random blobs you need. Must be within the [1,100]
+            range.
+        size -- The size of each blob, measured in bits. Must be within
+            the [1,1048576] range and must be divisible by 8.
+        format -- Specifies the format in which the blobs will be 
+            returned. Values allowed are _BLOB_FORMAT_BASE64 and 
+            _BLOB_FORMAT_HEX (default _BLOB_FORMAT_BASE64).
+        pregenerated_randomization -- Allows the client to specify that 
+            the random values should be generated from a pregenerated, 
+            historical randomization instead of a one-time on-the-fly 
+            randomization. There are three possible cases:
+            - null: the standard way of calling for random values, i.e.
+              true randomness is generated and discarded afterwards
+            - date: RANDOM.ORG uses historical true randomness generated 
+              on the corresponding date (past or present, format: 
+              { "date": "YYYY-MM-DD" })
+            - id: RANDOM.ORG uses historical true randomness derived 
+              from the corresponding identifier in a deterministic 
+              manner. Format: { "id": "PERSISTENT-IDENTIFIER" } where
+              "PERSISTENT-IDENTIFIER" is a string with length in the 
+              [1,64] range
+        license_data -- Allows the caller to include data of relevance to 
+            the license that is associated with the API Key.This is mandatory
+            for API Keys with the license type "Flexible Gambling" and follows
+            the format { "maxPayout": { "currency": "XTS", "amount": 0.0 } }. 
+            This information is used in licensing requested random values and 
+            in billing. The currently supported currencies are: "USD".
+        user_data -- Contains an optional object that will be included 
+            in unmodified form in the signed response along with the 
+            random data. If an object is present, its maximum size in 
+            encoded (string) form is 1,000 characters.
+        ticket_id -- A string with ticket identifier obtained via the 
+            create_tickets method. Specifying a value for ticket_id will 
+            cause RANDOM.ORG to record that the ticket was used to generate 
+            the requested random values. Each ticket can only be used once.
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 'size':size, 
+                  'format':format, 
+                  'pregeneratedRandomization':pregenerated_randomization, 
+                  'licenseData':license_data, 'userData':user_data, 
+                  'ticketId':ticket_id }
+        return self._invoke(_SIGNED_BLOB_METHOD, params,
+                            self._extract_signed_response, self._extract_blobs)
+    
+    def get_result(self, serial_number):
+        """
+        Retrieve previously generated results. 
+        
+        Retrieve results generated using signed methods within the last 
+        24 hours using its serialNumber. See:
+        https://api.random.org/json-rpc/4/signed#getResult  
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        serial_number -- An integer containing the serial number 
+            associated with the response you wish to retrieve.
+        
+        """
+        if self._ledger is not None:
+            result = self._ledger.get(serial_number)
+            if result is not None:
+                return self._local_result(result)
+        
+        params = { 'apiKey':self._api_key, 'serialNumber':serial_number}
+        return self._invoke(_GET_RESULT_METHOD, params,
+                            self._extract_signed_result,
+                            self._extract_response)
+    
+    def create_tickets(self, n, show_result):
+        """
+        Create tickets to be used in signed value-generating methods. 
+        
+        This method creates a number of tickets. The tickets can be 
+        used in one of the methods that generate random values. See:
+        https://api.random.org/json-rpc/4/signed#createTickets
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        n -- The number of tickets requested. This must be a number 
+            in the [1, 50] range.
+        showResult -- A boolean value that determines how much information 
+            calls to get_ticket will return. If show_result is false, getTicket 
+            will return only the basic ticket information. If show_result is 
+            true, the full random and signature objects from the response that 
+            was used to satisfy the ticket is returned.        
+        """
+        
+        params = { 'apiKey':self._api_key, 'n':n, 'showResult':show_result }
+        return self._invoke(_CREATE_TICKETS_METHOD, params,
+                            self._extract_result)
+    
+    def reveal_tickets(self, ticket_id):
+        """
+        Change the show_result value of a ticket and its predecessors to
+        "True".
+        
+        This method marks a specific ticket and all its predecessors in its
+        chain as being revealed, meaning that subsequent calls to get_ticket
+        will return the full details of the tickets, including the random
+        values produced when the tickets were used. Using reveal_tickets
+        effectively changes the value of show_result (which was specified
+        when the first ticket in the chain was created using create_tickets)
+        from "False" to "True". The reason that not only the ticket specified
+        (but also its predecessors in its chain) are revealed is to ensure
+        maximum transparency. The method does not affect any successors to
+        the ticket in the chain. Returns a number value that specifies how
+        many tickets were revealed. This will include the ticket specified
+        as well as all its predecessors. If this method is invoked on a ticket
+        that is already revealed (or which was created with show_result set
+        to True), then the value returned will be zero. See:
+        https://api.random.org/json-rpc/4/signed#revealTickets
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+        
+        Raises a RandomOrgTicketNotYetUsedError if the ticket specified
+        has not yet been used.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        ticket_id -- A string value that uniquely identifies the ticket.
+        """
+        params = { 'apiKey':self._api_key, 'ticketId':ticket_id }
+        return self._invoke(_REVEAL_TICKETS_METHOD, params,
+                            self._extract_result)
+    
+    def list_tickets(self, ticket_type):
+        """
+        Obtain information about tickets linked with your API key.
+        
+        This method obtains information about tickets that exist 
+        for a given API key. See:
+        https://api.random.org/json-rpc/4/signed#listTickets
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        ticket_type -- A string describing the type of tickets you want to obtain 
+            information about. Possible values are singleton, head and tail. 
+            Specifying singleton will cause list_tickets to return tickets that 
+            have no previous or next tickets. Specifying head will return tickets 
+            that do not have a previous ticket but that do have a next ticket. 
+            Specifying tail will cause list_tickets to return tickets that have a 
+            previous ticket but do not have a next ticket. 
+        """
+        params = { 'apiKey':self._api_key, 'ticketType':ticket_type }
+        return self._invoke(_LIST_TICKETS_METHOD, params, self._extract_result)
+    
+    def get_ticket(self, ticket_id):
+        """
+        Obtain information about a single ticket. 
+        
+        This method obtains information about a single ticket. If
+        the ticket has showResult set to true and has been used, 
+        get ticket will return the values generated. See:
+        https://api.random.org/json-rpc/4/signed#getTicket
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped. 
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a RandomOrgTicketNonExistentError if the ticket used 
+        does not exist.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        ticket_id -- A string containing a ticket identifier returned by a prior 
+        call to the create_tickets method.
+        """
+        
+        params = { 'ticketId':ticket_id }
+        return self._invoke(_GET_TICKET_METHOD, params, self._extract_result)
+    
+    
+    # Signature verification for signed methods, see:
+    # https://api.random.org/json-rpc/4/signed
+    
+    def verify_signature(self, random, signature, fallback=False):
+        """
+        Verify the signature of a previously received response.
+        
+        Verify the signature of a response previously received from one
+        of the methods in the Signed API with the server. This is used
+        to examine the authenticity of numbers. Return True on 
+        verification success. See:
+        https://api.random.org/json-rpc/4/signed#verifySignature
+        
+        If the instance was created with a public_key the signature is
+        verified locally, costing neither time waiting for the server 
+        nor any request allowance. If it was created with a 
+        verification_cache_size or verification_cache_path, the 
+        outcome of a verification with the server is remembered and 
+        returned for the same random field and signature again.
+        
+        Raises a RandomOrgSendTimeoutError if time spent waiting before
+        request is sent exceeds this instance's blocking_timeout.
+        
+        Raises a RandomOrgKeyNonExistentError if this API key does not 
+        exist.
+        
+        Raises a RandomOrgKeyNotRunningError if this API key is stopped.
+        
+        Raises a RandomOrgInsufficientRequestsError if this API key's 
+        server requests allowance has been exceeded and the instance is
+        backing off until midnight UTC.
+        
+        Raises a RandomOrgInsufficientBitsError if this API key's 
+        server bits allowance has been exceeded.
+        
+        Raises a RandomOrgKeyInvalidAccessError if this API key is not 
+        valid for this method.
+        
+        Raises a RandomOrgKeyInvalidVersionError if this API key is not 
+        valid for the version of the API invoked.
+        
+        Raises a ValueError on RANDOM.ORG Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Raises a RuntimeError on JSON-RPC Errors, error descriptions:
+        https://api.random.org/json-rpc/4/error-codes
+        
+        Can also raise connection errors as described here:
+        https://requests.readthedocs.io/en/latest/api/#exceptions
+        
+        Keyword arguments:
+        
+        random -- The random field from a response returned by 
+        RANDOM.ORG through one of the Signed API methods.
+        signature -- The signature field from the same response that 
+        the random field originates from.
+        fallback -- Specifies whether a signature which can't be 
+            verified locally is verified with the server, e.g., if the
+            random field has been reordered (default False).
+        """
+        
+        if self._public_key is not None:
+            authentic = self._public_key.verify(random, signature)
+            if authentic or not fallback:
+                return self._local_result(authentic)
+        
+        # Repeat verifications with the server are free if remembered.
+        digest = self._verification_digest(random, signature)
+        authentic = self._remembered_verification(digest)
+        if authentic is not None:
+            return self._local_result(authentic)
+        
+        params = { 'random':random, 'signature':signature }
+        return self._invoke(_VERIFY_SIGNATURE_METHOD, params,
+                            self._extract_verification_response, digest)
+        
+    def create_url(self, random, signature):
+        """
+        Create the URL for the signature verification page of a signed
+        response.
+        
+        Create the URL for the signature verification page of a response
+        previously received from one of the methods in the Signed API with
+        the server. The web-page accessible from this URL will contain the
+        details of the response used in this method, provided that the
+        signature can be verified. This URL is also shown under "Show
+        Technical Details" when the online Signature Verification Form is
+        used to validate a signature. See:
+        https://api.random.org/signatures/form
+        
+        Please note that, when using Python 2.7, the URL generated by this
+        method may differ from that shown when using the online Signature
+        Verification Form. This is because dictionaries in Python 2.7 are
+        not ordered and the encoded string will reflect this. The URL will
+        still work as expected.
+        
+        Raises a ValueError when the length of the generated URL exceeds
+        the maximum length allowed (2,046 characters). The random object
+        may be too large, i.e., too many random values were requested.
+        
+        Keyword arguments:
+        
+        random -- The random field from a response returned by 
+        RANDOM.ORG through one of the Signed API methods.
+        signature -- The signature field from the same response that 
+        the random field originates from.
+        """
+        # ensure that input is formatted correctly and is url-safe
+        random = self._url_formatting(random)
+        signature = self._url_formatting(signature)
+    
+        # create full url
+        url = 'https://api.random.org/signatures/form?format=json'   
+        url += '&random=' + random
+        url += '&signature=' + signature
+    
+        # throw an error is the maximum length allowed (2,046 characters)
+        # is exceeded
+        if len(url) > 2046:
+            raise ValueError('Error: URL exceeds maximum length (2,046 characters).')
+        
+        return url
+    
+    def create_html(self, random, signature):
+        """
+        Create the HTML form for the signature verification page of a signed
+        response.
+        
+        Create the HTML form for the signature verification page of a response
+        previously received from one of the methods in the Signed API with
+        the server. The web-page accessible from the "Validate" button created
+        will contain the details of the response used in this method, provided
+        that the signature can be verified. The same HTML form is also shown
+        under "Show Technical Details" when the online Signature Verification
+        Form is used to validate a signature. See:
+        https://api.random.org/signatures/form
+        
+        Please note that, when using Python 2.7, the HTML form generated by
+        this method may differ from that shown when using the online Signature
+        Verification Form. This is because dictionaries in Python 2.7 are
+        not ordered and the "random" input field will reflect this. The form
+        will still work as expected.
+        
+        Keyword arguments:
+        
+        random -- The random field from a response returned by 
+        RANDOM.ORG through one of the Signed API methods.
+        signature -- The signature field from the same response that 
+        the random field originates from.
+        """
+        # if necessary, turn the random object (dict) into a string
+        if isinstance(random, dict):
+            random = json.dumps(random)
+    
+        s = '<form action=\'https://api.random.org/signatures/form\' method=\'post\'>\n'
+        s += '  ' + self._input_html('hidden', 'format', 'json') + '\n'
+        s += '  ' + self._input_html('hidden', 'random', str(random)) + '\n'
+        s += '  ' + self._input_html('hidden', 'signature', signature) + '\n'
+        s += '  <input type=\'submit\' value=\'Validate\' />\n</form>'
+    
+        return s
+    
+    # Private methods shared by all clients.
+    
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Issue a request for method with params and return the 
+        # result of extract_function applied to the response. 
+        # Implemented by subclasses.
+        raise NotImplementedError
+    
+    def _local_result(self, result):
+        # Return a result obtained without a request in the same way 
+        # as _invoke returns results. Overridden by subclasses 
+        # returning Futures or coroutines.
+        return result
+    
+    def _verify_locally(self, pairs, processes):
+        # Verify pairs with the public key, yielding each pair and its
+        # authenticity. A pool of processes verifies chunks of pairs 
+        # unless there are too few to make up for starting it.
+        if processes == 1 or len(pairs) <= _VERIFY_CHUNK_SIZE:
+            for pair in pairs:
+                yield pair, self._public_key.verify(*pair)
+            return
+        
+        executor = ProcessPoolExecutor(processes)
+        try:
+            chunks = {}
+            for i in range(0, len(pairs), _VERIFY_CHUNK_SIZE):
+                chunk = pairs[i:i+_VERIFY_CHUNK_SIZE]
+                chunks[executor.submit(_verify_chunk, self._public_key, 
+                                       chunk)] = chunk
+            
+            for future in as_completed(chunks):
+                for pair, authentic in zip(chunks[future], future.result()):
+                    yield pair, authentic
+        finally:
+            executor.shutdown()
+    
+    def _load_public_key(self, key):
+        # Key verifying signatures locally, or None.
+        if key is None:
+            return None
+        return _RandomOrgPublicKey(key)
+    
+    def _load_verifications(self, size, path):
+        # Cache of verification outcomes, or None if not requested.
+        if size <= 0 and path is None:
+            return None
+        return _RandomOrgVerificationCache(size, path)
+    
+    def _verification_digest(self, random, signature):
+        # Key of the outcome of a verification, or None if outcomes 
+        # aren't remembered.
+        if self._verifications is None:
+            return None
+        return hashlib.sha256(_canonical_json(random) + b'\n' 
+                              + signature.encode('ascii')).hexdigest()
+    
+    def _remembered_verification(self, digest):
+        # Remembered outcome of the verification with digest, or None.
+        if digest is None:
+            return None
+        return self._verifications.get(digest)
+    
+    def _init_request_state(self, api_key, coordination_dir=None):
+        # maintain info to obey server advisory delay and backoff until
+        # midnight UTC when API key is detected as not running - 
+        # probably because key has exceeded its daily usage limit, 
+        # shared with other processes through a file named after a hash
+        # of the API key if requested
+        if coordination_dir is None:
+            self._scheduler = _RandomOrgScheduler()
+        else:
+            key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+            path = os.path.join(coordination_dir, key_hash + '.schedule')
+            self._scheduler = _RandomOrgSharedScheduler(path)
+        
+        # maintain usage statistics from server
+        self._requests_left = None
+        self._bits_left = None
+    
+    # Advisory delay and backoff state, kept by the scheduler.
+    
+    @property
+    def _advisory_delay(self):
+        return self._scheduler.advisory_delay
+    
+    @_advisory_delay.setter
+    def _advisory_delay(self, value):
+        self._scheduler.advisory_delay = value
+    
+    @property
+    def _backoff(self):
+        return self._scheduler.backoff
+    
+    @_backoff.setter
+    def _backoff(self, value):
+        self._scheduler.backoff = value
+    
+    @property
+    def _backoff_error(self):
+        return self._scheduler.backoff_error
+    
+    @_backoff_error.setter
+    def _backoff_error(self, value):
+        self._scheduler.backoff_error = value
+    
+    def _usage_outdated(self, value):
+        # Determine whether a usage statistic has to be (re)fetched 
+        # from the server.
+        return value is None or \
+            _monotonic() > (self._scheduler.last_response_time 
+                            + _ALLOWANCE_STATE_REFRESH_SECONDS)
+    
+    def _send_deadline(self):
+        # Monotonic time after which a request about to be sent may no
+        # longer wait for its slot, or None to wait forever.
+        if self._blocking_timeout == -1:
+            return None
+        return _monotonic() + self._blocking_timeout
+    
+    def _process_response(self, data):
+        # Translate a response into either its result or the 
+        # appropriate exception, updating usage statistics, backoff 
+        # and advisory delay as a side effect.
+        if 'error' in data:
+            code = int(data['error']['code'])
+            message = data['error']['message']
+            
+            # RuntimeError, error codes listed under JSON-RPC Errors:
+            # https://api.random.org/json-rpc/4/error-codes
+            if code in ([-32700] + list(range(-32603,-32600)) 
+                        + list(range(-32099,-32000))):                
+                return { 'exception': RuntimeError('Error ' + str(code) 
+                                                   + ': ' + message) }
+            
+            # RandomOrgKeyNonExistentError, API key does not exist, from 
+            # RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
+            elif code == 400:
+                return { 'exception': 
+                        RandomOrgKeyNonExistentError('Error ' + str(code) 
+                                                    + ': ' + message) }
+            
+            # RandomOrgKeyNotRunningError, API key not running, from 
+            # RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
+            elif code == 401:
+                return { 'exception': 
+                        RandomOrgKeyNotRunningError('Error ' + str(code) 
+                                                    + ': ' + message) }
+                
+            # RandomOrgInsufficientRequestsError, requests allowance 
+            # exceeded, backoff until midnight UTC, from RANDOM.ORG 
+            # Errors: https://api.random.org/json-rpc/4/error-codes
+            elif code == 402:
+                error = 'Error ' + str(code) + ': ' + message
+                self._scheduler.set_backoff(error)
+                return { 'exception': 
+                        RandomOrgInsufficientRequestsError(error) }
+            
+            # RandomOrgInsufficientBitsError, bits allowance exceeded,
+            # from RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
+            elif code == 403:
+                return { 'exception': 
+                        RandomOrgInsufficientBitsError('Error ' + str(code) 
+                                                       + ': ' + message) }
+            
+            # RandomOrgKeyInvalidAccessError, key is not valid for method 
+            # requested, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 404:
+                return { 'exception':
+                        RandomOrgKeyInvalidAccessError('Error ' + str(code) 
+                                                       + ': ' + message) }
+            
+            # RandomOrgKeyInvalidVersionError, key is not valid for the 
+            # version of the API you are invoking, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 405:
+                return { 'exception':
+                        RandomOrgKeyInvalidVersionError('Error ' + str(code) 
+                                                        + ': ' + message)}
+            
+            # RandomOrgTicketNonExistentError, the ticket specified does
+            # not exist, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes 
+            elif code == 420:
+                return { 'exception':
+                        RandomOrgTicketNonExistentError('Error ' + str(code) 
+                                                        + ': ' + message)}
+            
+            # RandomOrgTicketAPIKeyMismatchError, the ticket specified 
+            # exists but is not for the API key you specified, 
+            # from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 421:
+                return { 'exception':
+                        RandomOrgTicketAPIKeyMismatchError('Error ' + str(code) 
+                                                           + ': ' + message)}
+            
+            # RandomOrgTicketAlreadyUsedError, the ticket specified has 
+            # already been used, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 422:
+                return { 'exception':
+                        RandomOrgTicketAlreadyUsedError('Error ' + str(code) 
+                                                        + ': ' + message)}
+            
+            # RandomOrgTooManySingletonTicketsError, the maximum number 
+            # of singleton tickets available for your API key has been 
+            # reached, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 423:
+                return { 'exception':
+                        RandomOrgTooManySingletonTicketsError('Error ' 
+                                                              + str(code) 
+                                                              + ': '
+                                                              + message)}
+    
+            # RandomOrgLicenseDataRequiredError, your API key requires the 
+            # license_data parameter be used, from RANDOM.ORG Errors:
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 424:
+                return { 'exception':
+                        RandomOrgLicenseDataRequiredError('Error ' 
+                                                          + str(code) 
+                                                          + ': ' + message)}
+            
+            # RandomOrgLicenseDataNotAllowedError, your API key does not 
+            # support the use of the license_data parameter, 
+            # from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 425:
+                return { 'exception':
+                        RandomOrgLicenseDataNotAllowedError('Error ' 
+                                                            + str(code) 
+                                                            + ': ' 
+                                                            + message)}
+                
+            # RandomOrgTicketNotYetUsedError, the ticket you specified has
+            # not yet been used, from RANDOM.ORG Errors: 
+            # https://api.random.org/json-rpc/4/error-codes
+            elif code == 426:
+                return { 'exception':
+                        RandomOrgTicketNotYetUsedError('Error ' 
+                                                            + str(code) 
+                                                            + ': ' 
+                                                            + message)}
+             
+            # ValueError, error codes listed under RANDOM.ORG Errors:
+            # https://api.random.org/json-rpc/4/error-codes
+            else:
+                return { 'exception': ValueError('Error ' + str(code) 
+                                                 + ': ' + message) }
+        
+        # Update usage stats
+        if 'requestsLeft' in data['result']:
+            self._requests_left = int(data['result']['requestsLeft'])
+            self._bits_left = int(data['result']['bitsLeft'])
+        
+        # Set new server advisory delay
+        if 'advisoryDelay' in data['result']:
+            # Convert millis to decimal seconds.
+            if sys.version_info[0] < 3.0:
+                # Python 2.7
+                advisory_delay = long(data['result']['advisoryDelay']) / 1000.0
+            else:
+                # Python 3+
+                advisory_delay = int(data['result']['advisoryDelay']) / 1000.0
+        else:
+            # Use default if none from server.
+            advisory_delay = _DEFAULT_DELAY
+        
+        self._scheduler.response_received(advisory_delay)
+        
+        return { 'response': data }
+    
+    def _process_batch_response(self, data, requests):
+        # Translate the response to a batch of requests into a list of
+        # results or exceptions, one per request in request order.
+        
+        # The batch as a whole was rejected, e.g., invalid JSON.
+        if not isinstance(data, list):
+            return self._process_response(data)
+        
+        responses = dict((response.get('id'), response) for response in data)
+        
+        results = []
+        for request in requests:
+            if request['id'] in responses:
+                results.append(self._process_response(responses[request['id']]))
+            else:
+                results.append({ 'exception': 
+                                RuntimeError('No response to batched request ' 
+                                             + request['id']) })
+        
+        return { 'response': results }
+    
+    def _generate_request(self, method, params):
+        # Base json request.
+        return { 'jsonrpc':'2.0', 'method':method, 'params':params, 
+                'id':uuid.uuid4().hex }
+    
+    def _extract_response(self, response):
+        # Gets random data.
+        return response['result']['random']['data']
+    
+    def _extract_signed_response(self, response, extract_function, 
+                                 decimal=True):
+        # Gets all random data and signature of a new signed result, 
+        # tracked by the serial monitor if any.
+        if self._serial_monitor is not None:
+            self._serial_monitor.record(response['result']['random'])
+        
+        return self._extract_signed_result(response, extract_function, 
+                                           decimal)
+    
+    def _extract_signed_result(self, response, extract_function, 
+                               decimal=True):
+        # Gets all random data and signature, recorded in the ledger 
+        # if any.
+        if self._ledger is not None:
+            self._ledger.record(response['result']['random'], 
+                                response['result']['signature'])
+        
+        if decimal:
+            return { 'data':extract_function(response), 
+                    'random':response['result']['random'], 
+                    'signature':response['result']['signature'] }
+        else: 
+            return { 'data':extract_function(response, decimal),
+                    'random':response['result']['random'], 
+                    'signature':response['result']['signature']}
+        
+    def _extract_verification_response(self, response, digest=None):
+        # Gets verification boolean, remembered under digest if not 
+        # None.
+        authentic = bool(response['result']['authenticity'])
+        if digest is not None:
+            self._verifications.put(digest, authentic)
+        return authentic
+    
+    def _extract_result(self, response):
+        # Gets 'result' property of a return object. Primarily used
+        # for ticket-related methods.
+        return response['result']
+    
+    def _extract_ticket_ids(self, response):
+        # Gets the IDs of the tickets created.
+        return [ticket['ticketId'] for ticket in response['result']]
+    
+    def _extract_ints(self, response, decimal=True, output=_OUTPUT_LIST, 
+                      base=None):
+        # json to integer list or NumPy array, decoding strings of 
+        # numbers in base if not None.
+        data = self._extract_response(response)
+        if base is not None:
+            data = self._decode_ints(data, base)
+        
+        if output == _OUTPUT_NUMPY:
+            return numpy.array(data, dtype=numpy.int64)
+        elif decimal:
+            return list(map(int, data))
+        else:
+            return data
+    
+    def _extract_int_sequences(self, response, decimal=True, 
+                               output=_OUTPUT_LIST, base=None):
+        # json to integer sequences list, 2-D NumPy array if all 
+        # sequences have the same length or list of NumPy arrays, 
+        # decoding strings of numbers in base if not None.
+        data = self._extract_response(response)
+        if base is not None:
+            data = [self._decode_ints(rest, base) for rest in data]
+        
+        if output == _OUTPUT_NUMPY:
+            if len(set(map(len, data))) <= 1:
+                return numpy.array(data, dtype=numpy.int64)
+            return [numpy.array(rest, dtype=numpy.int64) for rest in data]
+        elif decimal:
+            return [list(map(int, rest)) for rest in data]
+        else: 
+            return [list(rest) for rest in data]
+        
+    def _extract_doubles(self, response, output=_OUTPUT_LIST):
+        # json to double list or NumPy array.
+        if output == _OUTPUT_NUMPY:
+            return numpy.array(self._extract_response(response), 
+                               dtype=numpy.float64)
+        return list(map(float, self._extract_response(response)))
+    
+    def _extract_strings(self, response):
+        # json to string list (no change).
+        return self._extract_response(response)
+    
+    def _extract_UUIDs(self, response):
+        # json to UUID list.
+        return list(map(uuid.UUID, self._extract_response(response)))
+    
+    def _extract_blobs(self, response, format=_BLOB_FORMAT_BASE64, 
+                       output=_OUTPUT_LIST):
+        # json to blob list, decoded to bytes or memoryview slices of 
+        # the decoded response if requested.
+        data = self._extract_response(response)
+        
+        if output == _OUTPUT_BYTES:
+            decode = self._blob_decoder(format)
+            return [decode(blob) for blob in data]
+        elif output == _OUTPUT_MEMORYVIEW:
+            return self._decode_blobs(data, format)
+        else:
+            return data
+    
+    def _blob_decoder(self, format):
+        # Function decoding a blob string in format to bytes.
+        if format == _BLOB_FORMAT_HEX:
+            return binascii.a2b_hex
+        return binascii.a2b_base64
+    
+    def _decode_blobs(self, data, format):
+        # Decode blobs of equal size into one bytes object and return a
+        # memoryview slice of it for each blob. Concatenated strings are
+        # decoded in a single pass, unless base64 blobs are padded.
+        if not data:
+            return []
+        
+        decode = self._blob_decoder(format)
+        if format == _BLOB_FORMAT_HEX or not data[0].endswith('='):
+            buffer = decode(''.join(data))
+        else:
+            buffer = b''.join(map(decode, data))
+        
+        view = memoryview(buffer)
+        size = len(buffer) // len(data)
+        return [view[i*size:(i+1)*size] for i in range(len(data))]
+    
+    def _check_output(self, output, allowed=_NUMBER_OUTPUTS):
+        # Raise an exception if values can't be returned as output.
+        if output not in allowed:
+            raise ValueError('Unknown output type: ' + str(output))
+        
+        if output == _OUTPUT_NUMPY and numpy is None:
+            raise ImportError('NumPy output requires the numpy library, '
+                              'see: https://numpy.org')
+    
+    def _decode_base(self, base, output, decode):
+        # Base in which to decode integers, or None to leave them as 
+        # returned by the server.
+        if base != 10 and (decode or output == _OUTPUT_NUMPY):
+            return base
+        return None
+    
+    def _decode_ints(self, data, base):
+        # Decode a list of strings of integers in base. int() parses 
+        # each in C, which is faster for responses of any size than 
+        # vectorized parsing with NumPy or requesting another base.
+        return [int(value, base) for value in data]
+    
+    def _url_formatting(self, s):
+        # adjust the formatting of elements used in url
+        if isinstance(s, dict):
+           s = json.dumps(s, separators=(',', ':'))
+        
+        # check if the string is base64 encoded
+        b64_pattern = '^([A-Za-z0-9+/]{4})*([A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{2}==)?$'
+        is_b64 = re.search(b64_pattern, s)
+        
+        if not is_b64:
+           s = s.encode()
+           s = base64.b64encode(s)
+           s = s.decode()
+    
+        # replace certain characters to make them url-safe
+        # (Percent-Encoding as described in RFC 3986 for PHP)
+        s = s.replace('=', '%3D')
+        s = s.replace('+', '%2B')
+        s = s.replace('/', '%2F')
+    
+        # return formatted string
+        return s
+    
+    def _input_html(self, type, name, value):
+        # helper function to create html code with input tags
+        return ('<input type=\'' + str(type) + '\' name=\'' + str(name)
+                + '\' value=\'' + str(value) + '\' />')
+
+class RandomOrgClient(_RandomOrgClientBase):
+    """
+    RandomOrgClient main class through which API functions are accessed.
+    
+    This class provides either serialized or unserialized (determined 
+    on class creation) access to both the signed and unsigned methods 
+    of the RANDOM.ORG API. These are threadsafe and implemented as 
+    blocking remote procedure calls.
+    
+    If requests are to be issued serially a background Thread will 
+    maintain a Queue of requests to process in sequence, highest 
+    priority first. Requests issued by caches give way to all others.
+    Optionally, concurrent compatible requests are merged into one to 
+    share a single advisory delay, see coalesce_window.
+    
+    The class also provides access to creation of a convenience class,
+    RandomOrgCache, for precaching API responses when the request is 
+    known in advance.
+    
+    This class will only allow the creation of one instance per API 
+    key. If an instance of this class already exists for a given key, 
+    that instance will be returned on init instead of a new instance.
+    
+    This class obeys most of the guidelines set forth in 
+    https://api.random.org/json-rpc/4
+    All requests respect the server's advisoryDelay returned in any 
+    responses, or use _DEFAULT_DELAY if no advisoryDelay is returned. If
+    the supplied API key is has exceeded its daily request allowance, 
+    this implementation will back off until midnight UTC. Waits are 
+    measured on a monotonic clock, and requests waiting for the advisory
+    delay are sent as soon as it has passed.
+    
+    Public methods:
+    
+    Basic methods for generating randomness, see:
+        https://api.random.org/json-rpc/4/basic
+    
+    generate_integers -- get a list of random integers.
+    generate_integer_sequences -- get sequences of random integers.
+    generate_decimal_fractions -- get a list of random doubles.
+    generate_gaussians -- get a list of random numbers.
+    generate_strings -- get a list of random strings.
+    generate_UUIDs -- get a list of random UUIDs.
+    generate_blobs -- get a list of random blobs.
+    
+    Signed methods for generating randomness, see:
+        https://api.random.org/json-rpc/4/signed
+    
+    generate_signed_integers -- get a signed response containing a list
+        of random integers and a signature.
+    generate_signed_integer_sequences -- get a signed response 
+        containing sequences of random integers and a signature.    
+    generate_signed_decimal_fractions -- get a signed response
+        containing a list of random doubles and a signature.
+    generate_signed_gaussians -- get a signed response containing a
+        list of random numbers and a signature.
+    generate_signed_strings -- get a signed response containing a list
+        of random strings and a signature.
+    generate_signed_UUIDs -- get a signed response containing a list of
+        random UUIDs and a signature.
+    generate_signed_blobs -- get a signed response containing a list of
+        random blobs and a signature.
+        
+    Retrieving previously generated signed results (within 24h), see:
+        https://api.random.org/json-rpc/4/signed#getResult
+    
+    get_result -- retrieve previously generated signed results using
+       a serial number (restricted to within 24 hours after generation)
+    
+    Tickets for use in methods which generate signed random values, see:
+       https://api.random.org/json-rpc/4/signed
+    
+    create_tickets -- create tickets for use in methods that generate
+       random values with signatures
+    list_tickets -- obtain a list of tickets of a certain type (singleton,
+      head or tail)
+    get_ticket -- obtain information on a single ticket
+    
+    Signature verification for signed methods, see:
+        https://api.random.org/json-rpc/4/signed
+    
+    verify_signature -- verify a response against its signature.
+    
+    # Methods for sending several requests in one round trip.
+    
+    batch -- get a RandomOrgBatch collecting requests to send together.
+    
+    # Methods for sending requests without waiting for the response.
+    
+    submit -- issue a request and get a Future holding its result.
+    
+    # Methods used to create a cache for any given randomness request.
+    
+    create_integer_cache -- get a RandomOrgCache from which to obtain a 
+        list of random integers.
+    create_integer_sequences_cache - get a RandomCache from which to 
+        obtain sequences of random integers.
+    create_decimal_fraction_cache -- get a RandomOrgCache from which to
+        obtain a list of random doubles.
+    create_gaussian_cache -- get a RandomOrgCache from which to obtain
+        a list of random numbers.
+    create_string_cache -- get a RandomOrgCache from which to obtain a
+        list of random strings.
+    create_UUID_cache -- get a RandomOrgCache from which to obtain a
+        list of random UUIDs.
+    create_blob_cache -- get a RandomOrgCache from which to obtain a
+        list of random blobs.
+    create_entropy_reservoir -- get a RandomOrgEntropyReservoir from 
+        which to draw random values of any type.
+    
+    # Methods for accessing server usage statistics
+    
+    get_requests_left -- get estimated number of remaining API requests.
+    get_bits_left -- get estimated number of bits left.    
+    get_next_slot_time -- get earliest time the next request may be sent.
+    
+    # Methods for accessing connection statistics
+    
+    get_connection_stats -- get HTTP connection reuse counters.
+    """
+    
+    # Maintain a dictionary of API keys and their instances.
+    __key_indexed_instances = {}
+    
+    def __new__(cls, *args, **kwds):
+        """
+        Instance creation.
+        
+        Ensure only one instance of RandomOrgClient exists per API key.
+        Create a new instance if the supplied key isn't already known, 
+        otherwise return the previously instantiated one.
+        """
+        instance = RandomOrgClient.__key_indexed_instances.get(args[0], 
+                                                               None)
+        
+        if instance is None:
+            instance = object.__new__(cls)
+            RandomOrgClient.__key_indexed_instances[args[0]] = instance
+        
+        return instance
+    
+    def __init__(self, api_key, 
+                 blocking_timeout=24.0*60.0*60.0, http_timeout=120.0, 
+                 serialized=True, http_pool_size=_DEFAULT_HTTP_POOL_SIZE, 
+                 http_idle_timeout=_DEFAULT_HTTP_IDLE_TIMEOUT, 
+                 coalesce_window=0, coordination_dir=None, 
+                 public_key=None, verification_cache_size=0, 
+                 verification_cache_path=None, ledger=None, 
+                 serial_monitor=None):
+        """
+        Constructor.
+        
+        Initialize class and start serialized request sending Thread 
+        running as a daemon if applicable.
+        
+        Keyword arguments:
+        
+        api_key -- API key obtained from the RANDOM.ORG website, see: 
+            https://api.random.org/api-keys
+        blocking_timeout -- maximum time in seconds and fractions of 
+            seconds to wait before being allowed to send a request. 
+            Note this is a hint not a guarantee. Be advised advisory 
+            delay from server must always be obeyed. Supply a value 
+            of -1 to allow blocking forever. (default 24.0*60.0*60.0,
+            i.e., 1 day)
+        http_timeout -- maximum time in seconds and fractions of 
+            seconds to wait for the server response to a request.
+            (default 120.0).
+        serialized -- determines whether or not requests from this 
+            instance will be added to a Queue and issued serially or 
+            sent when received, obeying any advisory delay (default 
+            True).
+        http_pool_size -- maximum number of keep-alive connections to 
+            the server held open by this instance. The pool is shared 
+            by all requests, serialized or not, and by all caches 
+            created by this instance (default 10).
+        http_idle_timeout -- time in seconds after which an unused 
+            connection pool is discarded and new connections are opened 
+            for the next request. Supply a value of -1 to never discard 
+            idle connections (default 60.0).
+        coalesce_window -- time in seconds during which concurrent 
+            requests of the unsigned methods for the same parameters, 
+            other than n, are merged into a single request for the sum
+            of their n, up to the API's maximum n. Each caller receives
+            its share of the values. A request is sent as soon as no 
+            more can join, or at once if the previous one had nothing 
+            to merge with and no other caller is waiting. Only applies 
+            to draws with replacement and without pregenerated 
+            randomization. Supply 0 to send every request separately 
+            (default 0).
+        coordination_dir -- directory in which to share the advisory 
+            delay and any backoff of the API key with the instances of 
+            other processes on this host using the same directory, so 
+            that together they obey the server's rules. Requires flock 
+            (default None, i.e., not shared).
+        public_key -- RSA public key with which verify_signature 
+            verifies signatures locally instead of with the server: a 
+            PEM encoded certificate or public key, e.g., RANDOM.ORG's 
+            certificate published on its website or a key pair's for 
+            testing, or a tuple of the integers modulus and public 
+            exponent (default None, i.e., verify with the server).
+        verification_cache_size -- number of outcomes of signature 
+            verifications with the server to remember, least recently 
+            used first forgotten (default 0).
+        verification_cache_path -- path of a dbm database in which to 
+            remember all outcomes of signature verifications with the 
+            server across restarts, used by one instance at a time 
+            (default None).
+        ledger -- RandomOrgLedger recording every signed result 
+            received, from which get_result answers first 
+            (default None).
+        serial_monitor -- RandomOrgSerialMonitor tracking the serial 
+            numbers of the new signed results received (default None).
+        """
+        
+        # __init__ will always be called after __new__, but if an 
+        # instance already exists for the API key we want to bail 
+        # before actually doing anything in init.
+        if not hasattr(self, '_api_key'):
+            
+            # verify signatures locally if a public key is supplied, 
+            # and remember verifications with the server if requested
+            self._public_key = self._load_public_key(public_key)
+            self._verifications = self._load_verifications(verification_cache_size, 
+                                                           verification_cache_path)
+            
+            # keep signed results locally and track their serial 
+            # numbers if requested
+            self._ledger = ledger
+            self._serial_monitor = serial_monitor
+            
+            # maintain advisory delay, usage statistics and backoff info
+            self._init_request_state(api_key, coordination_dir)
+            
+            if serialized:
+                # set submit function
+                self._submit_request = self._submit_serialized_request
+            
+                # set up the serialized request Queue and Thread
+                self._serialized_queue = _RandomOrgRequestQueue(self._scheduler)
+            
+                self._serialized_thread = threading.Thread(target=self._threaded_request_sending)
+                self._serialized_thread.daemon = True
+                self._serialized_thread.start()
+            else:
+                # set submit function
+                self._submit_request = self._submit_unserialized_request
+        
+            self._api_key = api_key
+            self._blocking_timeout = blocking_timeout
+            self._http_timeout = http_timeout
+            
+            # persistent HTTP session with a keep-alive connection pool, 
+            # created on first use and discarded when idle for longer 
+            # than http_idle_timeout, i.e., when no request has been in 
+            # flight for that long
+            self._http_pool_size = http_pool_size
+            self._http_idle_timeout = http_idle_timeout
+            self._http_lock = threading.Lock()
+            self._http_session = None
+            self._http_last_used = 0
+            self._http_in_flight = 0
+            
+            # connection statistics of discarded sessions
+            self._http_stats = {'requests': 0, 'connections': 0, 
+                                'sessions': 0, 'expired': 0}
+            
+            # single Thread populating all caches of this instance
+            self._cache_manager = _RandomOrgCacheManager()
+            
+            # merge concurrent compatible requests if requested
+            if coalesce_window > 0:
+                self._coalescer = _RandomOrgCoalescer(self, coalesce_window)
+            else:
+                self._coalescer = None
+        
+        else:
+            logging.info("Using RandomOrgClient instance already created for key \"" 
+                         + api_key + "\"")
+    
+    
+    # Methods for sending requests without waiting for the response.
+    
+    def submit(self, method, *args, **kwargs):
+        """
+        Submit a request without waiting for its response.
+        
+        Issue the request of the request method named method, e.g., 
+        'generate_integers', with the given arguments and return a 
+        Future holding its result, or the exception the method would 
+        have raised. This allows a single thread to queue several 
+        requests and collect their results later, e.g.:
+        
+            >>> futures = [r.submit('generate_integers', 5, 0, 10) 
+            ...            for i in range(3)]
+            >>> [f.result() for f in futures]
+            [[3, 9, 0, 4, 4], [1, 7, 2, 2, 8], [5, 0, 6, 9, 3]]
+        
+        For a serialized instance the request is added to the Queue and
+        the Future completes once it has been sent. Cancelling the 
+        Future before then removes the request from the Queue. Queued 
+        requests are sent highest priority first, and a request which 
+        can't be sent by its deadline fails with a 
+        RandomOrgSendTimeoutError as soon as this is known. Note that 
+        blocking_timeout does not apply to Futures, use deadline or the
+        timeout of Future.result instead. For an unserialized instance 
+        the request is sent before returning and priority is ignored.
+        
+        Raises a ValueError if method does not name a request method.
         
         Keyword arguments:
         
-        random -- The random field from a response returned by 
-        RANDOM.ORG through one of the Signed API methods.
-        signature -- The signature field from the same response that 
-        the random field originates from.
+        method -- name of any of the methods generating randomness, 
+            retrieving signed results, managing tickets or verifying 
+            signatures, e.g., 'generate_signed_blobs'.
+        *args, **kwargs -- arguments of the method.
+        priority -- requests with a higher priority are sent before 
+            those with a lower one. Requests issued by the blocking 
+            methods have priority 0, those issued by caches -1 
+            (default 0).
+        deadline -- time on the clock of get_next_slot_time after 
+            which the request may no longer be sent, or None to wait 
+            indefinitely (default None).
         """
         
-        params = { 'random':random, 'signature':signature }
-        request = self._generate_request(_VERIFY_SIGNATURE_METHOD, params)
-        response = self._send_request(request)
-        return self._extract_verification_response(response)
-        
-    def create_url(self, random, signature):
-        """
-        Create the URL for the signature verification page of a signed
-        response.
+        priority = kwargs.pop('priority', 0)
+        deadline = kwargs.pop('deadline', None)
         
-        Create the URL for the signature verification page of a response
-        previously received from one of the methods in the Signed API with
-        the server. The web-page accessible from this URL will contain the
-        details of the response used in this method, provided that the
-        signature can be verified. This URL is also shown under "Show
-        Technical Details" when the online Signature Verification Form is
-        used to validate a signature. See:
-        https://api.random.org/signatures/form
+        if (method.startswith('_') or method in ('create_url', 'create_html')
+                or not callable(getattr(_RandomOrgClientBase, method, None))):
+            raise ValueError('\'' + str(method) + '\' is not a request method.')
         
-        Please note that, when using Python 2.7, the URL generated by this
-        method may differ from that shown when using the online Signature
-        Verification Form. This is because dictionaries in Python 2.7 are
-        not ordered and the encoded string will reflect this. The URL will
-        still work as expected.
+        submitter = _RandomOrgSubmitter(self, priority, deadline)
+        return getattr(submitter, method)(*args, **kwargs)
+    
+    
+    # Methods for sending several requests in one round trip.
+    
+    def batch(self):
+        """
+        Get a RandomOrgBatch to send several requests at once.
         
-        Raises a ValueError when the length of the generated URL exceeds
-        the maximum length allowed (2,046 characters). The random object
-        may be too large, i.e., too many random values were requested.
+        Requests made through the RandomOrgBatch are collected and 
+        sent to the server as a single JSON-RPC batch, costing one 
+        network round trip and one advisory delay instead of one each.
+        Each request returns a Future holding its result, e.g.:
         
-        Keyword arguments:
+            >>> with r.batch() as b:
+            ...     ints = b.generate_integers(5, 0, 10)
+            ...     uuids = b.generate_UUIDs(2)
+            ...
+            >>> ints.result()
+            [3, 9, 0, 4, 4]
         
-        random -- The random field from a response returned by 
-        RANDOM.ORG through one of the Signed API methods.
-        signature -- The signature field from the same response that 
-        the random field originates from.
+        See RandomOrgBatch.
         """
-        # ensure that input is formatted correctly and is url-safe
-        random = self._url_formatting(random)
-        signature = self._url_formatting(signature)
-    
-        # create full url
-        url = 'https://api.random.org/signatures/form?format=json'   
-        url += '&random=' + random
-        url += '&signature=' + signature
-    
-        # throw an error is the maximum length allowed (2,046 characters)
-        # is exceeded
-        if len(url) > 2046:
-            raise ValueError('Error: URL exceeds maximum length (2,046 characters).')
         
-        return url
+        return RandomOrgBatch(self)
     
-    def create_html(self, random, signature):
+    def verify_signatures(self, signed, fallback=False, processes=None):
         """
-        Create the HTML form for the signature verification page of a signed
-        response.
+        Verify the signatures of many previously received responses.
         
-        Create the HTML form for the signature verification page of a response
-        previously received from one of the methods in the Signed API with
-        the server. The web-page accessible from the "Validate" button created
-        will contain the details of the response used in this method, provided
-        that the signature can be verified. The same HTML form is also shown
-        under "Show Technical Details" when the online Signature Verification
-        Form is used to validate a signature. See:
-        https://api.random.org/signatures/form
+        Return an iterator of (serialNumber, authenticity) tuples, one
+        for each response in signed, in the order in which their 
+        verification completes rather than the order of signed.
         
-        Please note that, when using Python 2.7, the HTML form generated by
-        this method may differ from that shown when using the online Signature
-        Verification Form. This is because dictionaries in Python 2.7 are
-        not ordered and the "random" input field will reflect this. The form
-        will still work as expected.
+        If the instance was created with a public_key the signatures 
+        are verified locally, in chunks spread over a pool of 
+        processes. Otherwise, and for signatures failing local 
+        verification if fallback is True, they are verified with the 
+        server in JSON-RPC batches of up to 100 requests, each costing
+        a single network round trip and advisory delay, unless their 
+        outcome is remembered, see verify_signature.
+        
+        Raises the exceptions of verify_signature while iterating.
         
         Keyword arguments:
         
-        random -- The random field from a response returned by 
-        RANDOM.ORG through one of the Signed API methods.
-        signature -- The signature field from the same response that 
-        the random field originates from.
+        signed -- iterable of the responses returned by RANDOM.ORG 
+            through the Signed API methods, or of (random, signature) 
+            tuples of their random and signature fields.
+        fallback -- Specifies whether signatures which can't be 
+            verified locally are verified with the server 
+            (default False).
+        processes -- Number of processes verifying signatures locally.
+            Supply 1 to verify them in the calling thread (default 
+            None, i.e., the number of CPUs).
         """
-        # if necessary, turn the random object (dict) into a string
-        if isinstance(random, dict):
-            random = json.dumps(random)
-    
-        s = '<form action=\'https://api.random.org/signatures/form\' method=\'post\'>\n'
-        s += '  ' + self._input_html('hidden', 'format', 'json') + '\n'
-        s += '  ' + self._input_html('hidden', 'random', str(random)) + '\n'
-        s += '  ' + self._input_html('hidden', 'signature', signature) + '\n'
-        s += '  <input type=\'submit\' value=\'Validate\' />\n</form>'
+        
+        pairs = [(item['random'], item['signature']) 
+                 if isinstance(item, dict) else tuple(item) 
+                 for item in signed]
+        
+        if self._public_key is None:
+            unverified = pairs
+        else:
+            unverified = []
+            for pair, authentic in self._verify_locally(pairs, processes):
+                if authentic or not fallback:
+                    yield (pair[0]['serialNumber'], authentic)
+                else:
+                    unverified.append(pair)
+        
+        # Verify the rest with the server unless remembered.
+        pending = []
+        for random, signature in unverified:
+            digest = self._verification_digest(random, signature)
+            authentic = self._remembered_verification(digest)
+            if authentic is None:
+                pending.append((random, signature, digest))
+            else:
+                yield (random['serialNumber'], authentic)
+        
+        for i in range(0, len(pending), _VERIFY_BATCH_SIZE):
+            verifications = pending[i:i+_VERIFY_BATCH_SIZE]
+            
+            # Verify with the server, whatever the key of the batch.
+            batch = RandomOrgBatch(self)
+            futures = [batch._invoke(_VERIFY_SIGNATURE_METHOD, 
+                                     { 'random':random, 
+                                      'signature':signature }, 
+                                     self._extract_verification_response, 
+                                     digest) 
+                       for random, signature, digest in verifications]
+            batch.send()
+            
+            for verification, future in zip(verifications, futures):
+                yield (verification[0]['serialNumber'], future.result())
     
-        return s
     
     # Methods used to create a cache for any given randomness request.
     
     def create_integer_cache(self, n, min, max, replacement=True, 
-                             base=10, cache_size=20):
+                             base=10, cache_size=20, low_watermark=None, 
+                             high_watermark=None, ring_buffer=False, 
+                             path=None, shared=False, output=_OUTPUT_LIST, 
+                             decode=False):
         """
         Get a RandomOrgCache to obtain random integers.
         
@@ -2331,14 +5827,46 @@ class RandomOrgClient(object):
             Must be an integer with the value 2, 8, 10 or 16.
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 20, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        ring_buffer -- Keep results in a preallocated ring buffer 
+            which any number of threads take them from without locking,
+            returning each result as an array.array('l') instead of a 
+            list. Ignored unless base is 10 or decode is True 
+            (default False).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
+        output -- The type in which each result is returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy. Numbers in a base other than 10 are decoded
+            for a NumPy array (default 'list').
+        decode -- Specifies whether numbers in a base other than 10 are
+            decoded and returned as integers rather than strings 
+            (default False).
         """
         
+        self._check_output(output)
+        
         if cache_size < 2:
             cache_size = 2
             
         # if possible, make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         if replacement:
             bulk_n = cache_size//2 if 5 >= cache_size else 5
             params = { 'apiKey':self._api_key, 'n':bulk_n*n, 
@@ -2355,12 +5883,24 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_INTEGER_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_ints, 
-                              request, cache_size, bulk_n, n)
+        decode_base = self._decode_base(base, output, decode)
+        
+        return RandomOrgCache(self._send_cache_request, 
+                              functools.partial(self._extract_ints, 
+                                                output=output, 
+                                                base=decode_base), 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, 
+                              ring_buffer and (base == 10 or decode), 
+                              path, shared, output)
     
     def create_integer_sequences_cache(self, n, length, min, max, 
                                        replacement=True, base=10, 
-                                       cache_size=20):
+                                       cache_size=20, low_watermark=None, 
+                                       high_watermark=None, path=None, 
+                                       shared=False, output=_OUTPUT_LIST, 
+                                       decode=False):
         """
         Get a RandomOrgCache to obtain random integer sequences.
         
@@ -2389,14 +5929,41 @@ class RandomOrgClient(object):
             Must be an integer with the value 2, 8, 10 or 16.
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 20, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
+        output -- The type in which each result is returned. Values 
+            allowed are 'list' and 'numpy' for a 2-D NumPy array, which
+            requires numpy. Numbers in a base other than 10 are decoded
+            for a NumPy array (default 'list').
+        decode -- Specifies whether numbers in a base other than 10 are
+            decoded and returned as integers rather than strings 
+            (default False).
         """
         
+        self._check_output(output)
+        
         if cache_size < 2:
             cache_size = 2
             
         # if possible, make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         if replacement:
             bulk_n = cache_size//2 if 5 >= cache_size else 5
             params = { 'apiKey':self._api_key, 'n':bulk_n*n, 
@@ -2413,12 +5980,21 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_INTEGER_SEQUENCES_METHOD, params)
         
-        return RandomOrgCache(self._send_request, 
-                              self._extract_int_sequences, 
-                              request, cache_size, bulk_n, n)
+        decode_base = self._decode_base(base, output, decode)
+        
+        return RandomOrgCache(self._send_cache_request, 
+                              functools.partial(self._extract_int_sequences, 
+                                                output=output, 
+                                                base=decode_base), 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared, 
+                              output=output)
     
     def create_decimal_fraction_cache(self, n, decimal_places, replacement=True, 
-                                       cache_size=20):
+                                       cache_size=20, low_watermark=None, 
+                                       high_watermark=None, path=None, 
+                                       shared=False, output=_OUTPUT_LIST):
         """
         Get a RandomOrgCache to obtain random decimal fractions.
         
@@ -2439,14 +6015,37 @@ class RandomOrgClient(object):
             unique (default True).
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 20, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
+        output -- The type in which each result is returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy (default 'list').
         """
         
+        self._check_output(output)
+        
         if cache_size < 2:
             cache_size = 2
        
         # if possible, make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         if replacement:
             bulk_n = cache_size//2 if 5 >= cache_size else 5
             params = { 'apiKey':self._api_key, 'n':bulk_n*n, 
@@ -2463,11 +6062,18 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_DECIMAL_FRACTION_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_doubles, 
-                              request, cache_size, bulk_n, n)
+        return RandomOrgCache(self._send_cache_request, 
+                              functools.partial(self._extract_doubles, 
+                                                output=output), 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared, 
+                              output=output)
     
     def create_gaussian_cache(self, n, mean, standard_deviation, 
-                              significant_digits, cache_size=20):
+                              significant_digits, cache_size=20, 
+                              low_watermark=None, high_watermark=None, 
+                              path=None, shared=False, output=_OUTPUT_LIST):
         """
         Get a RandomOrgCache to obtain random numbers.
         
@@ -2488,8 +6094,30 @@ class RandomOrgClient(object):
             Must be within the [2,20] range.
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 20, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
+        output -- The type in which each result is returned. Values 
+            allowed are 'list' and 'numpy' for a NumPy array, which 
+            requires numpy (default 'list').
         """
         
+        self._check_output(output)
+        
         if cache_size < 2:
             cache_size = 2
         
@@ -2504,11 +6132,18 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_GAUSSIAN_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_doubles,
-                              request, cache_size, bulk_n, n)
+        return RandomOrgCache(self._send_cache_request, 
+                              functools.partial(self._extract_doubles, 
+                                                output=output), 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared, 
+                              output=output)
     
     def create_string_cache(self, n, length, characters, replacement=True, 
-                            cache_size=20):
+                            cache_size=20, low_watermark=None, 
+                            high_watermark=None, path=None, 
+                            shared=False):
         """
         Get a RandomOrgCache to obtain random strings.
         
@@ -2532,6 +6167,23 @@ class RandomOrgClient(object):
             all be unique (default True).
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 20, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
         """
         
         if cache_size < 2:
@@ -2540,6 +6192,7 @@ class RandomOrgClient(object):
         # if possible, make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         if replacement:
             bulk_n = cache_size//2 if 5 >= cache_size else 5
             params = { 'apiKey':self._api_key, 'n':bulk_n*n, 'length':length, 
@@ -2554,10 +6207,14 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_STRING_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_strings, 
-                              request, cache_size, bulk_n, n)
+        return RandomOrgCache(self._send_cache_request, self._extract_strings, 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared)
     
-    def create_UUID_cache(self, n, cache_size=10):
+    def create_UUID_cache(self, n, cache_size=10, low_watermark=None, 
+                          high_watermark=None, path=None, 
+                          shared=False):
         """
         Get a RandomOrgCache to obtain random UUIDs.
         
@@ -2572,6 +6229,23 @@ class RandomOrgClient(object):
             range.
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 10, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
         """
         
         if cache_size < 2:
@@ -2580,17 +6254,22 @@ class RandomOrgClient(object):
         # make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         bulk_n = cache_size//2 if 5 >= cache_size else 5
         params = { 'apiKey':self._api_key, 'n':bulk_n*n }
                 
         # get the request object for use in all requests from this cache
         request = self._generate_request(_UUID_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_UUIDs, 
-                              request, cache_size, bulk_n, n)
+        return RandomOrgCache(self._send_cache_request, self._extract_UUIDs, 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared)
     
     def create_blob_cache(self, n, size, format=_BLOB_FORMAT_BASE64, 
-                          cache_size=10):
+                          cache_size=10, low_watermark=None, 
+                          high_watermark=None, path=None, 
+                          shared=False, output=_OUTPUT_LIST):
         """
         Get a RandomOrgCache to obtain random blobs.
         
@@ -2610,14 +6289,40 @@ class RandomOrgClient(object):
             _BLOB_FORMAT_HEX (default _BLOB_FORMAT_BASE64).
         cache_size -- Number of result-sets for the cache to try to 
             maintain at any given time (default 10, minimum 2).
+        low_watermark -- Number of result-sets at or below which the 
+            cache is refilled if results are requested in bulk. Raised 
+            automatically while the cache is consumed faster than it 
+            can be refilled (default cache_size//2).
+        high_watermark -- Number of result-sets up to which the cache 
+            is refilled if results are requested in bulk, at most 
+            cache_size (default cache_size).
+        path -- Path of a file in which to keep results across 
+            restarts. Results left over by a previous cache with the 
+            same path and parameters are returned first, and no result 
+            is returned twice even after a crash (default None, i.e., 
+            results are kept in memory only).
+        shared -- Share the results kept in the file at path with the 
+            caches of other processes on this host using the same path
+            and parameters, only one of which issues requests. Requires
+            flock, path is ideally on a memory backed file system such 
+            as /dev/shm (default False).
+        output -- The type in which the blobs of each result are 
+            returned. Values allowed are 'list' for strings in format,
+            'bytes' for decoded bytes and 'memoryview' for read-only 
+            memoryview slices of a single bytes object, into which all
+            blobs of a bulk response are decoded together 
+            (default 'list').
         """
         
         if cache_size < 2:
             cache_size = 2
         
+        self._check_output(output, _BLOB_OUTPUTS)
+        
         # make requests more efficient by bulk-ordering 
         # from the server. Either 5 sets of items at a time, or 
         # cache_size/2 if 5 >= cache_size.
+        # The cache adapts the number of sets to its consumption.
         bulk_n = cache_size//2 if 5 >= cache_size else 5
         params = { 'apiKey':self._api_key, 'n':bulk_n*n, 'size':size, 
                   'format':format }
@@ -2625,8 +6330,108 @@ class RandomOrgClient(object):
         # get the request object for use in all requests from this cache
         request = self._generate_request(_BLOB_METHOD, params)
         
-        return RandomOrgCache(self._send_request, self._extract_blobs, 
-                              request, cache_size, bulk_n, n)
+        return RandomOrgCache(self._send_cache_request, 
+                              functools.partial(self._extract_blobs, 
+                                                format=format, 
+                                                output=output), 
+                              request, cache_size, bulk_n, n, 
+                              self._cache_manager, low_watermark, 
+                              high_watermark, path=path, shared=shared, 
+                              output=output)
+    
+    def create_entropy_reservoir(self, blob_size=_ENTROPY_BLOB_SIZE, 
+                                 cache_size=10, low_watermark=None, 
+                                 high_watermark=None, path=None, 
+                                 shared=False):
+        """
+        Get a RandomOrgEntropyReservoir to draw random values from.
+        
+        The RandomOrgEntropyReservoir is fed by a RandomOrgCache of 
+        blobs and derives integers, decimal fractions, UUIDs and 
+        strings from their bits locally, see RandomOrgEntropyReservoir.
+        
+        Keyword arguments:
+        
+        blob_size -- The size of each blob obtained, measured in bits. 
+            Must be within the [8,1048576] range and must be divisible
+            by 8 (default 131072).
+        cache_size -- Number of blobs for the cache to try to maintain 
+            at any given time (default 10, minimum 2).
+        low_watermark -- Number of blobs at or below which the cache is
+            refilled. Raised automatically while the cache is consumed 
+            faster than it can be refilled (default cache_size//2).
+        high_watermark -- Number of blobs up to which the cache is 
+            refilled, at most cache_size (default cache_size).
+        path -- Path of a file in which to keep blobs across restarts, 
+            see create_blob_cache (default None).
+        shared -- Share the blobs kept in the file at path with other 
+            processes, see create_blob_cache (default False).
+        """
+        
+        cache = self.create_blob_cache(1, blob_size, _BLOB_FORMAT_BASE64, 
+                                       cache_size, low_watermark, 
+                                       high_watermark, path, shared)
+        
+        return RandomOrgEntropyReservoir(cache)
+    
+    def create_ticket_pool(self, pool_size=10, show_result=True, 
+                           chained=False, low_watermark=None, 
+                           high_watermark=None, adopt=False):
+        """
+        Get a RandomOrgTicketPool to obtain unused tickets from.
+        
+        The RandomOrgTicketPool is fed by a RandomOrgCache of tickets 
+        created in advance with createTickets requests, see 
+        RandomOrgTicketPool.
+        
+        Keyword arguments:
+        
+        pool_size -- Number of unused tickets for the cache to try to 
+            maintain at any given time (default 10, minimum 2).
+        show_result -- A boolean value that determines how much 
+            information calls to get_ticket will return for the 
+            tickets created (default True).
+        chained -- Put the successor of each ticket used by the pool's
+            generate method back into the pool, continuing its chain 
+            (default False).
+        low_watermark -- Number of tickets at or below which the cache 
+            is refilled. Raised automatically while the cache is 
+            consumed faster than it can be refilled 
+            (default pool_size//2).
+        high_watermark -- Number of tickets up to which the cache is 
+            refilled, at most pool_size (default pool_size).
+        adopt -- Hand out the unused tickets of this API key with the 
+            same show_result first, the tails of ticket chains for a 
+            chained pool and singleton tickets otherwise, found with a 
+            listTickets request. Only suitable if no other code uses 
+            these tickets (default False).
+        """
+        
+        if pool_size < 2:
+            pool_size = 2
+        
+        # create up to a full pool of tickets at a time, within the 
+        # API's limit
+        bulk_n = min(pool_size, _MAX_TICKETS)
+        params = { 'apiKey':self._api_key, 'n':bulk_n, 
+                  'showResult':show_result }
+        
+        # get the request object for use in all requests from this cache
+        request = self._generate_request(_CREATE_TICKETS_METHOD, params)
+        
+        ticket_ids = []
+        if adopt:
+            tickets = self.list_tickets('tail' if chained else 'singleton')
+            ticket_ids = [ticket['ticketId'] for ticket in tickets or [] 
+                          if ticket['usedTime'] is None 
+                          and ticket['showResult'] == show_result]
+        
+        cache = RandomOrgCache(self._send_cache_request, 
+                               self._extract_ticket_ids, request, pool_size,
+                               bulk_n, 1, self._cache_manager, 
+                               low_watermark, high_watermark)
+        
+        return RandomOrgTicketPool(self, cache, chained, ticket_ids)
     
     
     # Methods for accessing server usage statistics
@@ -2665,18 +6470,8 @@ class RandomOrgClient(object):
         Can also raise connection errors as described here:
         https://requests.readthedocs.io/en/latest/api/#exceptions
         """
-        try:
-            # Python 2.7
-            if self._requests_left is None or \
-               time.clock() > (self._last_response_received_time 
-                               + _ALLOWANCE_STATE_REFRESH_SECONDS):
-                self._get_usage()
-        except AttributeError:
-            # Python 3.3+
-            if self._requests_left is None or \
-               time.process_time() > (self._last_response_received_time 
-                                      + _ALLOWANCE_STATE_REFRESH_SECONDS):
-                self._get_usage()
+        if self._usage_outdated(self._requests_left):
+            self._get_usage()
         return self._requests_left
     
     def get_bits_left(self):
@@ -2713,393 +6508,671 @@ class RandomOrgClient(object):
         Can also raise connection errors as described here:
         https://requests.readthedocs.io/en/latest/api/#exceptions
         """
-        try:
-            # Python 2.7
-            if self._bits_left is None or \
-            time.clock() > (self._last_response_received_time 
-                                   + _ALLOWANCE_STATE_REFRESH_SECONDS):
-                self._get_usage()
-        except AttributeError:
-            # Python 3.3+
-            if self._bits_left is None or \
-            time.process_time() > (self._last_response_received_time 
-                                   + _ALLOWANCE_STATE_REFRESH_SECONDS):
-                self._get_usage()            
+        if self._usage_outdated(self._bits_left):
+            self._get_usage()
         return self._bits_left
     
-    
-    # Private methods for class operation.
-    
-    def _send_unserialized_request(self, request):
-        # Send request immediately.
-        data = self._send_request_core(request)
-        
-        # Raise any thrown exceptions.
-        if 'exception' in data:
-            raise data['exception']
+    def get_next_slot_time(self):
+        """
+        Get time of next request slot.
+        
+        Return the earliest time at which this instance may send its 
+        next request, in seconds on the clock of time.monotonic() 
+        (time.time() on Python 2.7). This is the time the last response
+        was received plus the server's advisoryDelay, or the end of the
+        backoff if this API key's server requests allowance has been 
+        exceeded. A value in the past means a request may be sent 
+        immediately. E.g., the wait before the next slot is:
+        
+            >>> max(0, r.get_next_slot_time() - time.monotonic())
+            0.84
+        """
         
-        # Return response.
-        return data['response']
+        return self._scheduler.next_slot_time()
     
-    def _send_serialized_request(self, request):
-        # Add request to the queue with it's own Condition lock.
-        lock = threading.Condition()
-        lock.acquire()
-        
-        data = {'lock': lock, 'request': request, 'response': None, 
-                'exception': None}
-        self._serialized_queue.put(data)
-        
-        # Wait on the Condition for the specified blocking timeout.
-        lock.wait(timeout=None if self._blocking_timeout == -1 
-                  else self._blocking_timeout)
-        
-        # Lock has now either been notified or timed out.
-        # Examine data to determine which and react accordingly.
-        
-        # Request wasn't sent in time, cancel and raise exception.
-        if data['response'] is None and data['exception'] is None:
-            data['request'] = None
-            lock.release()
-            raise RandomOrgSendTimeoutError('The defined maximum \
-                                            allowed blocking time of ' 
-                                            + str(self._blocking_timeout) 
-                                            + 's has been exceeded while \
-                                            waiting for a synchronous \
-                                            request to send.')
-        
-        # Exception on sending request.
-        if data['exception'] is not None:
-            lock.release()
-            raise data['exception']
-        
-        # Request was successful.
-        lock.release()
-        return data['response']
     
-    def _threaded_request_sending(self):
-        # Thread to execute queued requests.
-        while True:
-            # Block and wait for a request.
-            request = self._serialized_queue.get(block=True)
-            
-            # Get the request's lock to indicate request in progress.
-            lock = request['lock']
-            lock.acquire()
-            
-            # If request still exists it hasn't been cancelled.
-            if request['request'] is not None:
-                # Send request.
-                data = self._send_request_core(request['request'])
-                # Set result.
-                if 'exception' in data:
-                    request['exception'] = data['exception']
-                else:
-                    request['response'] = data['response']
-            
-            # Notify completion and return
-            lock.notify()
-            lock.release()
-    
-    def _send_request_core(self, request):
-        # If a backoff is set, no more requests can be issued until the
-        # required backoff time is up.
-        if self._backoff is not None:
-            # Time not yet up, throw exception.
-            if datetime.utcnow() < self._backoff:
-                return { 'exception': 
-                        RandomOrgInsufficientRequestsError(self._backoff_error) }
-            
-            # Time is up, clear backoff.
-            else:
-                self._backoff = None
-                self._backoff_error = None
+    # Methods for accessing connection statistics
+    
+    def get_connection_stats(self):
+        """
+        Get connection statistics.
+        
+        Return a dictionary of counters describing the use of this 
+        instance's keep-alive connection pool:
+        
+        requests -- number of HTTP requests sent to the server.
+        connections -- number of connections opened to the server.
+        reused -- number of requests sent on an already open 
+            connection.
+        sessions -- number of connection pools created.
+        expired -- number of connection pools discarded after being 
+            idle for longer than http_idle_timeout.
+        """
         
-        # Check server advisory delay.
-        self._advisory_delay_lock.acquire()
+        self._http_lock.acquire()
         try:
-            # Python 2.7
-            wait = self._advisory_delay - (time.clock() 
-                                           - self._last_response_received_time)
-        except AttributeError:
-            # Python 3.3+
-            wait = self._advisory_delay - (time.process_time() 
-                                           - self._last_response_received_time)
-        self._advisory_delay_lock.release()
-        
-        # Wait the specified delay if necessary and if wait time is not
-        # longer than the set blocking_timeout.
-        if wait > 0:
-            if (self._blocking_timeout != -1 and wait > self._blocking_timeout):
-                return { 'exception': 
-                        RandomOrgSendTimeoutError('The server advisory delay of ' 
-                                                  + str(wait) + 's is greater than \
-                                                  the defined maximum allowed \
-                                                  blocking time of ' 
-                                                  + str(self._blocking_timeout) + 's.') }
-            time.sleep(wait)
-        
-        # Send the request & parse the response.
-        response = requests.post('https://api.random.org/json-rpc/4/invoke',
-                                 data=json.dumps(request), 
-                                 headers={'content-type': 'application/json'},
-                                 timeout=self._http_timeout)
-        data = response.json()
-        
-        if 'error' in data:
-            code = int(data['error']['code'])
-            message = data['error']['message']
-            
-            # RuntimeError, error codes listed under JSON-RPC Errors:
-            # https://api.random.org/json-rpc/4/error-codes
-            if code in ([-32700] + list(range(-32603,-32600)) 
-                        + list(range(-32099,-32000))):                
-                return { 'exception': RuntimeError('Error ' + str(code) 
-                                                   + ': ' + message) }
-            
-            # RandomOrgKeyNonExistentError, API key does not exist, from 
-            # RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
-            elif code == 400:
-                return { 'exception': 
-                        RandomOrgKeyNonExistentError('Error ' + str(code) 
-                                                    + ': ' + message) }
-            
-            # RandomOrgKeyNotRunningError, API key not running, from 
-            # RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
-            elif code == 401:
-                return { 'exception': 
-                        RandomOrgKeyNotRunningError('Error ' + str(code) 
-                                                    + ': ' + message) }
-                
-            # RandomOrgInsufficientRequestsError, requests allowance 
-            # exceeded, backoff until midnight UTC, from RANDOM.ORG 
-            # Errors: https://api.random.org/json-rpc/4/error-codes
-            elif code == 402:
-                self._backoff = datetime.utcnow().replace(day=datetime.utcnow().day+1, hour=0, 
-                                                          minute=0, second=0, microsecond=0)
-                self._backoff_error = 'Error ' + str(code) + ': ' + message
-                return { 'exception': 
-                        RandomOrgInsufficientRequestsError(self._backoff_error) }
-            
-            # RandomOrgInsufficientBitsError, bits allowance exceeded,
-            # from RANDOM.ORG Errors: https://api.random.org/json-rpc/4/error-codes
-            elif code == 403:
-                return { 'exception': 
-                        RandomOrgInsufficientBitsError('Error ' + str(code) 
-                                                       + ': ' + message) }
-            
-            # RandomOrgKeyInvalidAccessError, key is not valid for method 
-            # requested, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 404:
-                return { 'exception':
-                        RandomOrgKeyInvalidAccessError('Error ' + str(code) 
-                                                       + ': ' + message) }
-            
-            # RandomOrgKeyInvalidVersionError, key is not valid for the 
-            # version of the API you are invoking, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 405:
-                return { 'exception':
-                        RandomOrgKeyInvalidVersionError('Error ' + str(code) 
-                                                        + ': ' + message)}
-            
-            # RandomOrgTicketNonExistentError, the ticket specified does
-            # not exist, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes 
-            elif code == 420:
-                return { 'exception':
-                        RandomOrgTicketNonExistentError('Error ' + str(code) 
-                                                        + ': ' + message)}
-            
-            # RandomOrgTicketAPIKeyMismatchError, the ticket specified 
-            # exists but is not for the API key you specified, 
-            # from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 421:
-                return { 'exception':
-                        RandomOrgTicketAPIKeyMismatchError('Error ' + str(code) 
-                                                           + ': ' + message)}
-            
-            # RandomOrgTicketAlreadyUsedError, the ticket specified has 
-            # already been used, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 422:
-                return { 'exception':
-                        RandomOrgTicketAlreadyUsedError('Error ' + str(code) 
-                                                        + ': ' + message)}
-            
-            # RandomOrgTooManySingletonTicketsError, the maximum number 
-            # of singleton tickets available for your API key has been 
-            # reached, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 423:
-                return { 'exception':
-                        RandomOrgTooManySingletonTicketsError('Error ' 
-                                                              + str(code) 
-                                                              + ': '
-                                                              + message)}
+            stats = dict(self._http_stats)
+            if self._http_session is not None:
+                for pool in self._http_connection_pools(self._http_session):
+                    stats['requests'] += pool.num_requests
+                    stats['connections'] += pool.num_connections
+        finally:
+            self._http_lock.release()
+        
+        stats['reused'] = max(0, stats['requests'] - stats['connections'])
+        return stats
+    
+    
+    # Private methods for class operation.
+    
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Send request, merged with concurrent compatible requests if 
+        # coalescing, and extract the result from the response.
+        if self._coalescer is not None and self._coalescer.accepts(method, params):
+            return extract_function(self._coalescer.send(method, params), 
+                                    *extract_args)
+        
+        request = self._generate_request(method, params)
+        return self._wait_for_result(self._submit_request(request, 
+                                                          extract_function, 
+                                                          extract_args, 
+                                                          deadline=self._send_deadline()))
     
-            # RandomOrgLicenseDataRequiredError, your API key requires the 
-            # license_data parameter be used, from RANDOM.ORG Errors:
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 424:
-                return { 'exception':
-                        RandomOrgLicenseDataRequiredError('Error ' 
-                                                          + str(code) 
-                                                          + ': ' + message)}
+    def _send_request(self, request, priority=0):
+        # Send request and return the response.
+        return self._wait_for_result(self._submit_request(request, 
+                                                          priority=priority, 
+                                                          deadline=self._send_deadline()))
+    
+    def _send_cache_request(self, request):
+        # Send request on behalf of a RandomOrgCache, giving way to all
+        # other requests.
+        return self._send_request(request, _CACHE_REQUEST_PRIORITY)
+    
+    def _wait_for_result(self, future):
+        # Wait on the Future for the specified blocking timeout. 
+        try:
+            return future.result(timeout=None if self._blocking_timeout == -1 
+                                 else self._blocking_timeout)
+        except _FutureTimeoutError:
+            # Request is being sent, wait for it to complete.
+            if not future.cancel():
+                return future.result()
             
-            # RandomOrgLicenseDataNotAllowedError, your API key does not 
-            # support the use of the license_data parameter, 
-            # from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 425:
-                return { 'exception':
-                        RandomOrgLicenseDataNotAllowedError('Error ' 
-                                                            + str(code) 
-                                                            + ': ' 
-                                                            + message)}
-                
-            # RandomOrgTicketNotYetUsedError, the ticket you specified has
-            # not yet been used, from RANDOM.ORG Errors: 
-            # https://api.random.org/json-rpc/4/error-codes
-            elif code == 426:
-                return { 'exception':
-                        RandomOrgTicketNotYetUsedError('Error ' 
-                                                            + str(code) 
-                                                            + ': ' 
-                                                            + message)}
-             
-            # ValueError, error codes listed under RANDOM.ORG Errors:
-            # https://api.random.org/json-rpc/4/error-codes
-            else:
-                return { 'exception': ValueError('Error ' + str(code) 
-                                                 + ': ' + message) }
+            # Request wasn't sent in time, it has been cancelled.
+            raise RandomOrgSendTimeoutError('The defined maximum allowed '
+                                            'blocking time of ' 
+                                            + str(self._blocking_timeout) 
+                                            + 's has been exceeded while '
+                                            'waiting for a synchronous '
+                                            'request to send.')
+    
+    def _submit_unserialized_request(self, request, extract_function=None, 
+                                     extract_args=(), priority=0, 
+                                     deadline=None):
+        # Send request immediately, returning a completed Future.
+        if deadline is None:
+            deadline = self._send_deadline()
         
-        # Update usage stats
-        if 'requestsLeft' in data['result']:
-            self._requests_left = int(data['result']['requestsLeft'])
-            self._bits_left = int(data['result']['bitsLeft'])
+        data = {'request': request, 'extract_function': extract_function, 
+                'extract_args': extract_args, 'deadline': deadline, 
+                'future': Future()}
         
-        # Set new server advisory delay
-        self._advisory_delay_lock.acquire()
-        if 'advisoryDelay' in data['result']:
-            # Convert millis to decimal seconds.
-            if sys.version_info[0] < 3.0:
-                # Python 2.7
-                self._advisory_delay = (long(data['result']['advisoryDelay']) 
-                                        / 1000.0)
+        data['future'].set_running_or_notify_cancel()
+        self._send_submitted_request(data)
+        
+        return data['future']
+    
+    def _submit_serialized_request(self, request, extract_function=None, 
+                                   extract_args=(), priority=0, 
+                                   deadline=None):
+        # Add request to the queue with its own Future.
+        data = {'request': request, 'extract_function': extract_function, 
+                'extract_args': extract_args, 'deadline': deadline, 
+                'future': Future()}
+        
+        # Cancelling the Future cancels the request.
+        def cancel(future):
+            if future.cancelled():
+                data['request'] = None
+        data['future'].add_done_callback(cancel)
+        
+        self._serialized_queue.put(data, priority, deadline)
+        
+        return data['future']
+    
+    def _threaded_request_sending(self):
+        # Thread to execute queued requests.
+        while True:
+            # Block and wait for the next slot and most urgent request.
+            data = self._serialized_queue.get()
+            
+            # If request still exists it hasn't been cancelled, mark it
+            # as being sent so it can no longer be.
+            if (data['request'] is not None 
+                    and data['future'].set_running_or_notify_cancel()):
+                self._send_submitted_request(data)
+    
+    def _send_submitted_request(self, data):
+        # Send request and set the response, or the result of its 
+        # extract function, or any exception on the request's Future.
+        future = data['future']
+        
+        try:
+            result = self._send_request_core(data['request'], data['deadline'])
+            
+            if 'exception' in result:
+                future.set_exception(result['exception'])
+            elif data['extract_function'] is None:
+                future.set_result(result['response'])
             else:
-                # Python 3+
-                self._advisory_delay = (int(data['result']['advisoryDelay']) 
-                                        / 1000.0)
-        else:
-            # Use default if none from server.
-            self._advisory_delay = _DEFAULT_DELAY
+                future.set_result(data['extract_function'](result['response'], 
+                                                           *data['extract_args']))
+        except Exception as e:
+            future.set_exception(e)
+    
+    def _send_request_core(self, request, deadline=None):
+        # Sleep until the next slot if necessary, unless it lies beyond
+        # deadline.
+        exception = self._scheduler.wait(deadline)
+        if exception is not None:
+            return { 'exception': exception }
         
+        # Send the request & parse the response.
+        session = self._get_http_session()
         try:
-            # Python 2.7
-            self._last_response_received_time = time.clock()
-        except AttributeError: 
-            # Python 3.3+
-            self._last_response_received_time = time.process_time()
+            response = session.post(_API_URL, data=json.dumps(request), 
+                                    headers={'content-type': 'application/json'},
+                                    timeout=self._http_timeout)
+            content = response.content
+        finally:
+            self._release_http_session()
         
-        self._advisory_delay_lock.release()
+        data = _parse_response(content, request)
         
-        return { 'response': data }
+        # A list of requests is sent as a JSON-RPC batch.
+        if isinstance(request, list):
+            return self._process_batch_response(data, request)
+        
+        return self._process_response(data)
+    
+    def _get_http_session(self):
+        # Return the keep-alive session shared by all requests from 
+        # this instance, replacing it if it has been idle for too long.
+        # Each call must be followed by _release_http_session once the 
+        # request has completed.
+        self._http_lock.acquire()
+        try:
+            now = _monotonic()
+            
+            if (self._http_session is not None 
+                and self._http_idle_timeout != -1 
+                and self._http_in_flight == 0
+                and now - self._http_last_used > self._http_idle_timeout):
+                self._close_http_session()
+                self._http_stats['expired'] += 1
+            
+            if self._http_session is None:
+                adapter = HTTPAdapter(pool_connections=1, 
+                                      pool_maxsize=self._http_pool_size)
+                self._http_session = requests.Session()
+                self._http_session.mount('https://', adapter)
+                self._http_session.mount('http://', adapter)
+                self._http_stats['sessions'] += 1
+            
+            self._http_in_flight += 1
+            return self._http_session
+        finally:
+            self._http_lock.release()
+    
+    def _release_http_session(self):
+        # The request using the session has completed, its idle time 
+        # starts now.
+        self._http_lock.acquire()
+        self._http_in_flight -= 1
+        self._http_last_used = _monotonic()
+        self._http_lock.release()
+    
+    def _close_http_session(self):
+        # Fold the session's counters into the totals and close its 
+        # connections. Must be called holding _http_lock.
+        for pool in self._http_connection_pools(self._http_session):
+            self._http_stats['requests'] += pool.num_requests
+            self._http_stats['connections'] += pool.num_connections
+        self._http_session.close()
+        self._http_session = None
+    
+    def _http_connection_pools(self, session):
+        # The urllib3 connection pools opened by the session.
+        pools = session.get_adapter(_API_URL).poolmanager.pools
+        return [pools[key] for key in pools.keys()]
     
     def _get_usage(self):
         # Issue a getUsage request to update bits and requests left.
         params = { 'apiKey':self._api_key }
         request = self._generate_request(_GET_USAGE_METHOD, params)
         response = self._send_request(request)
+
+
+class RandomOrgBatch(_RandomOrgClientBase):
+    """
+    RandomOrgBatch for sending several requests in one round trip.
     
-    def _generate_request(self, method, params):
-        # Base json request.
-        return { 'jsonrpc':'2.0', 'method':method, 'params':params, 
-                'id':uuid.uuid4().hex }
+    Collects requests and sends them to the server together as a 
+    single JSON-RPC 2.0 batch through the RandomOrgClient it was 
+    obtained from. Instances should only be obtained using 
+    RandomOrgClient's batch method, never created separately.
     
-    def _extract_response(self, response):
-        # Gets random data.
-        return response['result']['random']['data']
+    All request methods of RandomOrgClient are available and take the
+    same arguments, but instead of blocking each returns a Future 
+    which holds the result, or raises the exception the corresponding 
+    RandomOrgClient method would have raised, once the batch has been 
+    sent. Used as a context manager, the batch is sent on exit, or 
+    its Futures cancelled if the block raised an exception.
     
-    def _extract_signed_response(self, response, extract_function, 
-                                 decimal=True):
-        # Gets all random data and signature.
-        if decimal:
-            return { 'data':extract_function(response), 
-                    'random':response['result']['random'], 
-                    'signature':response['result']['signature'] }
-        else: 
-            return { 'data':extract_function(response, decimal),
-                    'random':response['result']['random'], 
-                    'signature':response['result']['signature']}
+    Public methods:
+    
+    All methods for generating randomness, retrieving signed results,
+    managing tickets and verifying signatures offered by 
+    RandomOrgClient, returning Futures, see RandomOrgClient.
+    
+    get_usage -- get a Future holding the API key's usage statistics.
+    send -- send all requests collected so far.
+    """
+    
+    def __init__(self, client):
+        """
+        Constructor.
+        
+        Should only be called by RandomOrgClient's batch method.
+        
+        Keyword arguments:
         
-    def _extract_verification_response(self, response):
-        # Gets verification boolean.
-        return bool(response['result']['authenticity'])
+        client -- RandomOrgClient through which requests are sent.
+        """
+        
+        self._client = client
+        self._api_key = client._api_key
+        self._public_key = client._public_key
+        self._verifications = client._verifications
+        self._ledger = client._ledger
+        self._serial_monitor = client._serial_monitor
+        
+        self._lock = threading.Lock()
+        self._calls = []
     
-    def _extract_result(self, response):
-        # Gets 'result' property of a return object. Primarily used
-        # for ticket-related methods.
-        return response['result']
+    def __enter__(self):
+        return self
     
-    def _extract_ints(self, response, decimal=True):
-        # json to integer list.
-        if decimal:
-            return list(map(int, self._extract_response(response)))
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Only send if the block completed, otherwise discard.
+        if exc_type is None:
+            self.send()
         else:
-            return self._extract_response(response)
+            self._cancel()
     
-    def _extract_int_sequences(self, response, decimal=True):
-        # json to integer sequences list.
-        if decimal:
-            return [list(map(int, rest)) for rest in 
-                    self._extract_response(response)]
-        else: 
-            return [list(rest) for rest 
-                    in self._extract_response(response)]
+    def __len__(self):
+        return len(self._calls)
+    
+    def get_usage(self):
+        """
+        Get usage statistics.
         
-    def _extract_doubles(self, response):
-        # json to double list.
-        return list(map(float, self._extract_response(response)))
+        Return a Future holding the usage statistics of the API key, 
+        i.e., the result of the getUsage method. See:
+        https://api.random.org/json-rpc/4/basic#getUsage
+        """
+        
+        params = { 'apiKey':self._api_key }
+        return self._invoke(_GET_USAGE_METHOD, params, self._extract_result)
     
-    def _extract_strings(self, response):
-        # json to string list (no change).
-        return self._extract_response(response)
+    def send(self):
+        """
+        Send batch.
+        
+        Send all requests collected so far to the server in a single 
+        round trip and resolve their Futures. Requests whose Futures 
+        have been cancelled are not sent. Errors specific to a 
+        single request, e.g., a ValueError for an invalid parameter, 
+        are only set on its Future. 
+        
+        Errors preventing the batch from being sent at all, e.g., a 
+        RandomOrgSendTimeoutError, are set on every Future and raised.
+        """
+        
+        self._lock.acquire()
+        calls = self._calls
+        self._calls = []
+        self._lock.release()
+        
+        # Drop requests whose Futures have been cancelled.
+        calls = [call for call in calls 
+                 if call['future'].set_running_or_notify_cancel()]
+        
+        if not calls:
+            return
+        
+        try:
+            responses = self._client._send_request([call['request'] 
+                                                    for call in calls])
+        except Exception as e:
+            for call in calls:
+                call['future'].set_exception(e)
+            raise
+        
+        for call, data in zip(calls, responses):
+            if 'exception' in data:
+                call['future'].set_exception(data['exception'])
+                continue
+            
+            try:
+                call['future'].set_result(call['extract_function'](data['response'], 
+                                                                   *call['extract_args']))
+            except Exception as e:
+                call['future'].set_exception(e)
     
-    def _extract_UUIDs(self, response):
-        # json to UUID list.
-        return list(map(uuid.UUID, self._extract_response(response)))
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Collect the request to be sent with the batch.
+        future = Future()
+        
+        self._lock.acquire()
+        self._calls.append({'request': self._generate_request(method, params), 
+                            'extract_function': extract_function, 
+                            'extract_args': extract_args, 'future': future})
+        self._lock.release()
+        
+        return future
     
-    def _extract_blobs(self, response):
-        # json to blob list (no change).
-        return self._extract_response(response)
+    def _local_result(self, result):
+        # Return the result in a completed Future.
+        future = Future()
+        future.set_result(result)
+        return future
     
-    def _url_formatting(self, s):
-        # adjust the formatting of elements used in url
-        if isinstance(s, dict):
-           s = json.dumps(s, separators=(',', ':'))
+    def _cancel(self):
+        # Discard all requests collected so far.
+        self._lock.acquire()
+        calls = self._calls
+        self._calls = []
+        self._lock.release()
         
-        # check if the string is base64 encoded
-        b64_pattern = '^([A-Za-z0-9+/]{4})*([A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{2}==)?$'
-        is_b64 = re.search(b64_pattern, s)
+        for call in calls:
+            call['future'].cancel()
+
+
+class RandomOrgClientPool(_RandomOrgClientBase):
+    """
+    RandomOrgClientPool for spreading requests over several API keys.
+    
+    Holds a RandomOrgClient for each of several API keys and sends each
+    request with the key able to send it soonest, i.e., the key with the
+    earliest next request slot once the requests it is already sending 
+    are accounted for. Keys backing off until midnight UTC after their 
+    daily request allowance has been exceeded, and keys known to have 
+    no requests or bits left, are skipped. If a request fails because a
+    key's allowance has been exceeded or the key has been stopped, it is
+    retried with the remaining keys.
+    
+    Tickets and signed results belong to the API key which created 
+    them, so create_tickets, reveal_tickets, list_tickets, get_ticket,
+    get_result and requests using a ticket_id are always sent with the 
+    first key. Use get_client to access any other key's results.
+    
+    Public methods:
+    
+    All methods for generating randomness, retrieving signed results,
+    managing tickets and verifying signatures offered by 
+    RandomOrgClient, see RandomOrgClient.
+    
+    get_client -- get the RandomOrgClient of an API key.
+    get_requests_left -- get estimated number of remaining API requests
+        of all keys.
+    get_bits_left -- get estimated number of bits left of all keys.
+    get_key_stats -- get utilisation statistics per API key.
+    """
+    
+    # Methods which must be sent with the API key owning the tickets or
+    # results involved.
+    _KEY_BOUND_METHODS = (_GET_RESULT_METHOD, _CREATE_TICKETS_METHOD, 
+                          _REVEAL_TICKETS_METHOD, _LIST_TICKETS_METHOD, 
+                          _GET_TICKET_METHOD)
+    
+    def __init__(self, api_keys, **kwargs):
+        """
+        Constructor.
         
-        if not is_b64:
-           s = s.encode()
-           s = base64.b64encode(s)
-           s = s.decode()
+        Obtain the RandomOrgClient instance of each API key.
+        
+        Raises a ValueError if no API keys are supplied.
+        
+        Keyword arguments:
+        
+        api_keys -- list of API keys obtained from the RANDOM.ORG 
+            website, see: https://api.random.org/api-keys
+        **kwargs -- arguments used to create the RandomOrgClient of 
+            each key, see RandomOrgClient. As only one instance of 
+            RandomOrgClient exists per key, they have no effect for 
+            keys already in use.
+        """
+        
+        if not api_keys:
+            raise ValueError('At least one API key is required.')
+        
+        self._clients = OrderedDict()
+        for api_key in api_keys:
+            self._clients[api_key] = RandomOrgClient(api_key, **kwargs)
+        
+        # key bound requests are sent with the first key
+        self._api_key = api_keys[0]
+        self._public_key = self._clients[self._api_key]._public_key
+        self._verifications = self._clients[self._api_key]._verifications
+        self._ledger = self._clients[self._api_key]._ledger
+        self._serial_monitor = self._clients[self._api_key]._serial_monitor
+        
+        # requests sent and in progress per key
+        self._lock = threading.Lock()
+        self._stats = dict((api_key, {'requests': 0, 'failovers': 0, 
+                                      'in_flight': 0}) 
+                           for api_key in self._clients)
     
-        # replace certain characters to make them url-safe
-        # (Percent-Encoding as described in RFC 3986 for PHP)
-        s = s.replace('=', '%3D')
-        s = s.replace('+', '%2B')
-        s = s.replace('/', '%2F')
+    def get_client(self, api_key):
+        """
+        Get the RandomOrgClient of an API key in the pool.
+        
+        Raises a KeyError if api_key is not in the pool.
+        
+        Keyword arguments:
+        
+        api_key -- API key of the client.
+        """
+        
+        return self._clients[api_key]
     
-        # return formatted string
-        return s
+    def get_requests_left(self):
+        """
+        Get remaining requests.
+        
+        Return the (estimated) number of remaining API requests 
+        available to all keys of the pool together. May raise the 
+        exceptions of RandomOrgClient.get_requests_left.
+        """
+        
+        return sum(client.get_requests_left() 
+                   for client in self._clients.values())
     
-    def _input_html(self, type, name, value):
-        # helper function to create html code with input tags
-        return ('<input type=\'' + str(type) + '\' name=\'' + str(name)
-                + '\' value=\'' + str(value) + '\' />')
+    def get_bits_left(self):
+        """
+        Get remaining bits.
+        
+        Return the (estimated) number of remaining true random bits 
+        available to all keys of the pool together. May raise the 
+        exceptions of RandomOrgClient.get_bits_left.
+        """
+        
+        return sum(client.get_bits_left() 
+                   for client in self._clients.values())
+    
+    def get_key_stats(self):
+        """
+        Get utilisation statistics per API key.
+        
+        Return a dictionary mapping each API key to a dictionary of:
+        
+        requests -- number of requests sent with the key by the pool.
+        failovers -- number of requests retried with another key after
+            failing with this one.
+        in_flight -- number of requests currently being sent.
+        requests_left -- (estimated) number of remaining API requests,
+            None if not yet known.
+        bits_left -- (estimated) number of remaining bits, None if not 
+            yet known.
+        next_slot_time -- earliest time the next request may be sent, 
+            see RandomOrgClient.get_next_slot_time.
+        backoff -- whether the key is backing off until midnight UTC.
+        """
+        
+        stats = {}
+        
+        self._lock.acquire()
+        try:
+            for api_key, client in self._clients.items():
+                stats[api_key] = dict(self._stats[api_key], 
+                                      requests_left=client._requests_left, 
+                                      bits_left=client._bits_left, 
+                                      next_slot_time=client.get_next_slot_time(), 
+                                      backoff=self._backing_off(client))
+        finally:
+            self._lock.release()
+        
+        return stats
+    
+    
+    # Private methods for class operation.
+    
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Send request with the key able to send it soonest, retrying 
+        # with the other keys if its allowance has been exceeded.
+        if method in self._KEY_BOUND_METHODS or 'ticketId' in params:
+            return self._clients[self._api_key]._invoke(method, params, 
+                                                        extract_function, 
+                                                        *extract_args)
+        
+        tried = set()
+        error = None
+        
+        while True:
+            api_key = self._select_key(tried)
+            
+            # No key left to try.
+            if api_key is None:
+                if error is not None:
+                    raise error
+                raise RandomOrgInsufficientRequestsError('None of the API keys '
+                                                         'in the pool has '
+                                                         'requests left.')
+            
+            tried.add(api_key)
+            params = dict(params, apiKey=api_key)
+            
+            try:
+                return self._clients[api_key]._invoke(method, params, 
+                                                      extract_function, 
+                                                      *extract_args)
+            except (RandomOrgInsufficientRequestsError, 
+                    RandomOrgInsufficientBitsError, 
+                    RandomOrgKeyNotRunningError) as e:
+                error = e
+                
+                self._lock.acquire()
+                self._stats[api_key]['failovers'] += 1
+                self._lock.release()
+            finally:
+                self._lock.acquire()
+                self._stats[api_key]['in_flight'] -= 1
+                self._lock.release()
+    
+    def _select_key(self, exclude):
+        # Return the key able to send a request soonest, not in 
+        # exclude, and count the request as in flight for it. Return 
+        # None if no key can send requests.
+        now = _monotonic()
+        selected = None
+        
+        self._lock.acquire()
+        try:
+            for api_key, client in self._clients.items():
+                if api_key in exclude or self._backing_off(client):
+                    continue
+                
+                # Allowance known to be used up, re-checked once usage 
+                # info is outdated.
+                if (client._requests_left is not None 
+                        and not client._usage_outdated(client._requests_left) 
+                        and (client._requests_left <= 0 or client._bits_left <= 0)):
+                    continue
+                
+                # Requests in flight will each take up an advisory delay.
+                ready = (max(client.get_next_slot_time(), now) 
+                         + self._stats[api_key]['in_flight'] * client._advisory_delay)
+                
+                if selected is None or ready < selected[0]:
+                    selected = (ready, api_key)
+            
+            if selected is None:
+                return None
+            
+            stats = self._stats[selected[1]]
+            stats['requests'] += 1
+            stats['in_flight'] += 1
+            
+            return selected[1]
+        finally:
+            self._lock.release()
+    
+    def _backing_off(self, client):
+        # Whether client's key is backing off until midnight UTC.
+        backoff = client._backoff
+        return backoff is not None and datetime.utcnow() < backoff
+
+
+class _RandomOrgSubmitter(_RandomOrgClientBase):
+    """
+    Request methods of a RandomOrgClient returning Futures.
+    
+    Used by RandomOrgClient's submit method, each request method 
+    issues its request through the client without waiting for the 
+    response and returns the Future holding its result.
+    """
+    
+    def __init__(self, client, priority=0, deadline=None):
+        """
+        Constructor.
+        
+        Keyword arguments:
+        
+        client -- RandomOrgClient through which requests are sent.
+        priority -- priority of the requests (default 0).
+        deadline -- time after which the requests may no longer be 
+            sent, see RandomOrgClient.submit (default None).
+        """
+        
+        self._client = client
+        self._api_key = client._api_key
+        self._public_key = client._public_key
+        self._verifications = client._verifications
+        self._ledger = client._ledger
+        self._serial_monitor = client._serial_monitor
+        self._priority = priority
+        self._deadline = deadline
+    
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Issue the request and return its Future.
+        return self._client._submit_request(self._generate_request(method, params), 
+                                            extract_function, extract_args, 
+                                            self._priority, self._deadline)
+    
+    def _local_result(self, result):
+        # Return the result in a completed Future.
+        future = Future()
+        future.set_result(result)
+        return future
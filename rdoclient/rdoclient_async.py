@@ -0,0 +1,461 @@
+"""
+RANDOM.ORG JSON-RPC API (Release 4) asyncio implementation.
+
+This module provides AsyncRandomOrgClient, an asyncio counterpart to
+RandomOrgClient. Every request method of RandomOrgClient is available
+as a coroutine which sends its request using the aiohttp library and
+obeys the same server advisory delay and backoff rules. Requires
+Python 3.5+ and aiohttp:
+
+    $ pip install rdoclient[async]
+
+Classes:
+
+AsyncRandomOrgClient -- asyncio class through which API functions are
+                        accessed.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .rdoclient import (_RandomOrgClientBase, RandomOrgSendTimeoutError,
+                        _API_URL, _GET_USAGE_METHOD, _SIGNED_METHODS,
+                        _parse_response,
+                        _DEFAULT_HTTP_POOL_SIZE, _DEFAULT_HTTP_IDLE_TIMEOUT)
+
+class AsyncRandomOrgClient(_RandomOrgClientBase):
+    """
+    AsyncRandomOrgClient class through which API functions are accessed
+    from asyncio code.
+
+    This class provides either serialized or unserialized (determined
+    on class creation) access to both the signed and unsigned methods
+    of the RANDOM.ORG API. Each method is a coroutine and must be
+    awaited, e.g.:
+
+        >>> r = AsyncRandomOrgClient(YOUR_API_KEY_HERE)
+        >>> await r.generate_integers(5, 0, 10)
+        [6, 2, 8, 9, 2]
+
+    If requests are to be issued serially they are added to an asyncio
+    Queue which is processed in sequence by a single Task, so waiting
+    callers do not occupy any threads.
+
+    All requests respect the server's advisoryDelay returned in any
+    responses, and back off until midnight UTC if the API key has
+    exceeded its daily request allowance, exactly as RandomOrgClient
+    does. Unlike RandomOrgClient, instances are not shared per API key
+    and caches are not supported.
+
+    With a coordination_dir, the shared scheduler's file locking runs
+    in the event loop's default executor, as does recording signed
+    results in a ledger, so neither blocks the event loop.
+
+    Public methods:
+
+    All methods for generating randomness, retrieving signed results,
+    managing tickets and verifying signatures offered by
+    RandomOrgClient, as coroutines, see RandomOrgClient. create_url and
+    create_html are ordinary methods.
+
+    get_requests_left -- get estimated number of remaining API requests.
+    get_bits_left -- get estimated number of bits left.
+    get_next_slot_time -- get earliest time the next request may be sent.
+    close -- close the connection pool and stop the serialized Task.
+    """
+
+    def __init__(self, api_key,
+                 blocking_timeout=24.0*60.0*60.0, http_timeout=120.0,
+                 serialized=True, http_pool_size=_DEFAULT_HTTP_POOL_SIZE,
+                 http_idle_timeout=_DEFAULT_HTTP_IDLE_TIMEOUT,
+                 coordination_dir=None, public_key=None,
+                 verification_cache_size=0, verification_cache_path=None,
+                 ledger=None, serial_monitor=None):
+        """
+        Constructor.
+
+        Initialize class. The HTTP session and, if applicable, the
+        serialized request Task are created on first use in the running
+        event loop.
+
+        Raises an ImportError if aiohttp is not installed.
+
+        Keyword arguments:
+
+        api_key -- API key obtained from the RANDOM.ORG website, see:
+            https://api.random.org/api-keys
+        blocking_timeout -- maximum time in seconds and fractions of
+            seconds to wait before being allowed to send a request.
+            Note this is a hint not a guarantee. Be advised advisory
+            delay from server must always be obeyed. Supply a value
+            of -1 to allow blocking forever. (default 24.0*60.0*60.0,
+            i.e., 1 day)
+        http_timeout -- maximum time in seconds and fractions of
+            seconds to wait for the server response to a request.
+            (default 120.0).
+        serialized -- determines whether or not requests from this
+            instance will be added to a Queue and issued serially or
+            sent when received, obeying any advisory delay (default
+            True).
+        http_pool_size -- maximum number of keep-alive connections to
+            the server held open by this instance (default 10).
+        http_idle_timeout -- time in seconds after which an unused
+            connection is closed. Supply a value of -1 to never close
+            idle connections (default 60.0).
+        coordination_dir -- directory in which to share the advisory
+            delay and any backoff of the API key with other processes,
+            see RandomOrgClient (default None).
+        public_key -- RSA public key with which verify_signature
+            verifies signatures locally instead of with the server,
+            see RandomOrgClient (default None).
+        verification_cache_size -- number of outcomes of signature
+            verifications with the server to remember, see
+            RandomOrgClient (default 0).
+        verification_cache_path -- path of a dbm database in which to
+            remember all outcomes of signature verifications with the
+            server, see RandomOrgClient (default None).
+        ledger -- RandomOrgLedger recording every signed result
+            received, from which get_result answers first
+            (default None).
+        serial_monitor -- RandomOrgSerialMonitor tracking the serial
+            numbers of the new signed results received (default None).
+        """
+
+        if aiohttp is None:
+            raise ImportError('AsyncRandomOrgClient requires the aiohttp '
+                              'library, see: https://docs.aiohttp.org')
+
+        if serialized:
+            self._send_request = self._send_serialized_request
+        else:
+            self._send_request = self._send_unserialized_request
+
+        self._serialized = serialized
+        self._api_key = api_key
+        self._blocking_timeout = blocking_timeout
+        self._http_timeout = http_timeout
+        self._http_pool_size = http_pool_size
+        self._http_idle_timeout = http_idle_timeout
+
+        # verify signatures locally if a public key is supplied, and
+        # remember verifications with the server if requested
+        self._public_key = self._load_public_key(public_key)
+        self._verifications = self._load_verifications(verification_cache_size,
+                                                       verification_cache_path)
+
+        # keep signed results locally and track their serial numbers
+        # if requested
+        self._ledger = ledger
+        self._serial_monitor = serial_monitor
+
+        # event loop bound resources, created on first use
+        self._loop = None
+        self._http_session = None
+        self._serialized_queue = None
+        self._serialized_task = None
+
+        # maintain advisory delay, usage statistics and backoff info
+        self._init_request_state(api_key, coordination_dir)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close client.
+
+        Close the connection pool and stop the serialized request Task.
+        Requests still queued or being sent fail. The client may still
+        be used afterwards, in which case new resources are created.
+        """
+
+        if self._serialized_task is not None:
+            task, queue = self._serialized_task, self._serialized_queue
+            self._serialized_task = None
+            self._serialized_queue = None
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+            # The Task may have been cancelled before it started.
+            self._fail_queued_requests(queue)
+
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+        self._loop = None
+
+
+    # Methods for accessing server usage statistics
+
+    async def get_requests_left(self):
+        """
+        Get remaining requests.
+
+        Return the (estimated) number of remaining API requests
+        available to the client, see RandomOrgClient.get_requests_left.
+        """
+
+        if self._usage_outdated(self._requests_left):
+            await self._get_usage()
+        return self._requests_left
+
+    async def get_bits_left(self):
+        """
+        Get remaining bits.
+
+        Return the (estimated) number of remaining true random bits
+        available to the client, see RandomOrgClient.get_bits_left.
+        """
+
+        if self._usage_outdated(self._bits_left):
+            await self._get_usage()
+        return self._bits_left
+
+    def get_next_slot_time(self):
+        """
+        Get time of next request slot.
+
+        Return the earliest time at which this instance may send its
+        next request, in seconds on the clock of time.monotonic(), see
+        RandomOrgClient.get_next_slot_time. Not a coroutine, reads the
+        shared state file if a coordination_dir is used.
+        """
+
+        return self._scheduler.next_slot_time()
+
+
+    # Private methods for class operation.
+
+    def _invoke(self, method, params, extract_function, *extract_args):
+        # Return a coroutine sending the request, so that the public
+        # methods shared with RandomOrgClient can be awaited.
+        return self._invoke_async(method, params, extract_function,
+                                  extract_args)
+
+    async def _local_result(self, result):
+        # Return the result from a coroutine like those of _invoke.
+        return result
+
+    async def _invoke_async(self, method, params, extract_function,
+                            extract_args):
+        # Send request and extract the result from the response.
+        request = self._generate_request(method, params)
+        response = await self._send_request(request)
+
+        # Signed results may be recorded in a ledger, which syncs its
+        # file.
+        return await self._call_blocking(method in _SIGNED_METHODS
+                                         and self._ledger is not None,
+                                         extract_function, response,
+                                         *extract_args)
+
+    async def _call_blocking(self, blocking, function, *args):
+        # Call function, in the default executor if it may block, e.g.,
+        # on flock or fsync, so that the event loop isn't blocked.
+        if not blocking:
+            return function(*args)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(function,
+                                                                  *args))
+
+    def _bind_loop(self):
+        # Event loop bound resources can't be shared between loops, so
+        # drop any created in a previous loop.
+        loop = asyncio.get_event_loop()
+
+        if self._loop is not loop:
+            if self._loop is not None:
+                logging.info('AsyncRandomOrgClient used in a new event loop, '
+                             'discarding resources of the previous loop')
+            self._loop = loop
+            self._discard_http_session()
+            self._serialized_queue = None
+            self._serialized_task = None
+
+        return loop
+
+    def _discard_http_session(self):
+        # Close the connections of a session created in a previous
+        # event loop. The session can't be awaited from this loop, so
+        # its connector is detached and closed directly. Connections
+        # of a loop which is closed already can only be marked closed.
+        session, self._http_session = self._http_session, None
+        if session is None:
+            return
+
+        connector = session.connector
+        session.detach()
+        if connector is None:
+            return
+
+        try:
+            closing = connector.close()
+        except RuntimeError:
+            return
+
+        # Depending on the version of aiohttp, close is a coroutine.
+        if inspect.isawaitable(closing):
+            future = asyncio.ensure_future(closing)
+            future.add_done_callback(
+                lambda future: future.cancelled() or future.exception())
+
+    async def _send_unserialized_request(self, request):
+        # Send request immediately.
+        self._bind_loop()
+        data = await self._send_request_core(request)
+
+        # Raise any thrown exceptions.
+        if 'exception' in data:
+            raise data['exception']
+
+        # Return response.
+        return data['response']
+
+    async def _send_serialized_request(self, request):
+        loop = self._bind_loop()
+
+        if self._serialized_task is None:
+            self._serialized_queue = asyncio.Queue()
+            self._serialized_task = loop.create_task(self._serialized_request_sending())
+
+        # Add request to the queue with its own Future.
+        data = {'request': request, 'future': loop.create_future(),
+                'sending': False}
+        self._serialized_queue.put_nowait(data)
+
+        # Wait on the Future for the specified blocking timeout. The
+        # Future is shielded so a timeout doesn't cancel a request
+        # that is already being sent.
+        try:
+            return await asyncio.wait_for(asyncio.shield(data['future']),
+                                          None if self._blocking_timeout == -1
+                                          else self._blocking_timeout)
+        except asyncio.TimeoutError:
+            # Request is being sent, wait for it to complete.
+            if data['sending']:
+                return await data['future']
+
+            # Request wasn't sent in time, cancel and raise exception.
+            data['request'] = None
+            raise RandomOrgSendTimeoutError('The defined maximum allowed '
+                                            'blocking time of '
+                                            + str(self._blocking_timeout)
+                                            + 's has been exceeded while '
+                                            'waiting for a synchronous '
+                                            'request to send.')
+        except asyncio.CancelledError:
+            # Caller cancelled, don't send the request if still queued.
+            data['request'] = None
+            raise
+
+    async def _serialized_request_sending(self):
+        # Task to execute queued requests.
+        queue = self._serialized_queue
+        data = None
+        try:
+            while True:
+                # Wait for a request.
+                data = None
+                data = await queue.get()
+
+                # If request still exists it hasn't been cancelled.
+                if data['request'] is None:
+                    continue
+
+                data['sending'] = True
+                try:
+                    result = await self._send_request_core(data['request'])
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    result = {'exception': e}
+
+                # Set result.
+                if not data['future'].done():
+                    if 'exception' in result:
+                        data['future'].set_exception(result['exception'])
+                    else:
+                        data['future'].set_result(result['response'])
+        except asyncio.CancelledError:
+            # Fail the request being sent and those still queued, so
+            # that no caller waits for them forever.
+            if data is not None and not data['future'].done():
+                data['future'].set_exception(
+                    RuntimeError('The AsyncRandomOrgClient was closed while '
+                                 'the request was being sent.'))
+            self._fail_queued_requests(queue)
+            raise
+
+    def _fail_queued_requests(self, queue):
+        # Fail the requests left in queue when the client is closed.
+        while True:
+            try:
+                data = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            if data['request'] is not None and not data['future'].done():
+                data['future'].set_exception(
+                    RandomOrgSendTimeoutError('The AsyncRandomOrgClient was '
+                                              'closed before the request '
+                                              'was sent.'))
+
+    async def _send_request_core(self, request):
+        # Sleep until the next slot if necessary. Responses received
+        # in the meantime may move the slot, so check again on waking.
+        deadline = self._send_deadline()
+        while True:
+            check = await self._call_blocking(self._scheduler.shared,
+                                              self._scheduler.check, deadline)
+            if 'exception' in check:
+                return check
+            if check['wait'] <= 0:
+                break
+            await asyncio.sleep(check['wait'])
+
+        # Send the request & parse the response.
+        timeout = aiohttp.ClientTimeout(total=self._http_timeout)
+        async with self._get_http_session().post(_API_URL,
+                                                 data=json.dumps(request),
+                                                 headers={'content-type': 'application/json'},
+                                                 timeout=timeout) as response:
+            data = _parse_response(await response.read(), request)
+
+        # A shared scheduler writes the advisory delay to its file.
+        return await self._call_blocking(self._scheduler.shared,
+                                         self._process_response, data)
+
+    def _get_http_session(self):
+        # Return the keep-alive session shared by all requests from
+        # this instance.
+        if self._http_session is None:
+            connector = aiohttp.TCPConnector(limit=self._http_pool_size,
+                                             keepalive_timeout=None
+                                             if self._http_idle_timeout == -1
+                                             else self._http_idle_timeout)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+
+        return self._http_session
+
+    async def _get_usage(self):
+        # Issue a getUsage request to update bits and requests left.
+        params = { 'apiKey':self._api_key }
+        request = self._generate_request(_GET_USAGE_METHOD, params)
+        await self._send_request(request)
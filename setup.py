@@ -18,7 +18,12 @@ setup(
     install_requires=[
         'requests',
         'six',
+        'futures; python_version < "3"',
     ],
+    extras_require={
+        'async': ['aiohttp; python_version >= "3.5"'],
+        'numpy': ['numpy'],
+    },
     project_urls={
         "Documentation": "https://api.random.org/json-rpc/4",
         "Source Code": "https://github.com/RandomOrg/JSON-RPC-Python",
@@ -4,10 +4,26 @@ RANDOM.ORG JSON-RPC API (Release 4) implementation tests.
 Run with py.test test_rdoclient.py
 """
 
+import base64
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import threading
 import time
 import uuid
 
-from datetime import datetime
+try:
+    # Python 3.5+
+    import asyncio
+except ImportError:
+    # Python 2.7
+    asyncio = None
+
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
 try:
     # Python 2.7
     from Queue import Empty
@@ -17,15 +33,90 @@ except ImportError:
 
 import unittest
 import pytest
+import requests
 import six # Added for asserting string types (Python 2.7/3.x - unicode/string)
 
 from rdoclient import *
+from rdoclient.rdoclient import _parse_response
 
 _API_KEY_1 = 'YOUR_API_KEY_HERE'
 _API_KEY_2 = 'YOUR_API_KEY_HERE'
 
 _FAKE_METHOD = 'fooBar'
 
+# Key pair for testing local signature verification: random object 
+# signed with the private key, and the public key in each supported form
+_SIGNED_RANDOM = json.loads('{"method":"generateSignedIntegers",'
+                            '"hashedApiKey":"HASH","n":3,"min":1,"max":6,'
+                            '"replacement":true,"base":10,'
+                            '"pregeneratedRandomization":null,'
+                            '"data":[4,1,6],"license":{"type":"developer",'
+                            '"text":"Random values licensed strictly for '
+                            'development and testing only","infoUrl":null},'
+                            '"licenseData":null,"userData":null,'
+                            '"ticketData":null,'
+                            '"completionTime":"2026-10-17 12:00:00Z",'
+                            '"serialNumber":42}', 
+                            object_pairs_hook=OrderedDict)
+_SIGNATURE = ('Se6wa643piORadXrxOcyLVWJfv3cFb/5lW25HSDAQrAA9v8s57/bqHE+3d7JqLZ'
+              'hv/7jFCoZxynmXaa/p5qL5atAcd98ElCBe32UE8JzfRHEzfjeWoDfWpzVdI2roO'
+              'Z7XnkKnOWsKzhtYX1WUVeKCeuabH7ecYvvjFLvkN9Wvf8=')
+
+# Response to generateSignedDecimalFractions signed with the same key, 
+# with numbers Python would serialize differently, e.g., 1e-05
+_SIGNED_DECIMAL_RESPONSE = ('{"jsonrpc":"2.0","result":{"random":'
+                            '{"method":"generateSignedDecimalFractions",'
+                            '"hashedApiKey":"HASH","n":3,"decimalPlaces":5,'
+                            '"replacement":true,'
+                            '"pregeneratedRandomization":null,'
+                            '"data":[0.00001,0.50000,0.12345],'
+                            '"license":{"type":"developer","text":"Random '
+                            'values licensed strictly for development and '
+                            'testing only","infoUrl":null},'
+                            '"licenseData":null,"userData":null,'
+                            '"ticketData":null,'
+                            '"completionTime":"2026-10-17 12:00:00Z",'
+                            '"serialNumber":43},"signature":'
+                            '"mqxUgHwcg8YvjCN9+uk1m34O3VcC2FbR6gwnIWV1dq3mqJr'
+                            'R/QuZGwm2oc2jul/X0x/mEIbm3cBRixlCW0xmDgb/bw31FRs'
+                            'EGJhOglbvkgL5/KgCAAsM6v8jSblacadQ3e6rirmopjM7MFB'
+                            'hG6z74gz8wY6Nb4sdOHywWhC4NZQ=","bitsUsed":50,'
+                            '"bitsLeft":100000,"requestsLeft":900,'
+                            '"advisoryDelay":0},"id":1}')
+
+_TEST_PUBLIC_KEY = """-----BEGIN PUBLIC KEY-----
+MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDCjSbbYRcnH/0wnzCAy3RcIBKr
+lQMN2WLl1n+VcpPEr/xmrkwfHpG6ehs6vjl8fyUG05LAFwjT23wU/6b14miPwTCK
+Xrv7cIVqi4WwNHIdX+IL1UVUqOsK+d1fIyDwCRRqgMICoCujUomvbJihfZjL1KAB
+W/wOi5QTj4uzTPBfQQIDAQAB
+-----END PUBLIC KEY-----
+"""
+_TEST_RSA_PUBLIC_KEY = """-----BEGIN RSA PUBLIC KEY-----
+MIGJAoGBAMKNJtthFycf/TCfMIDLdFwgEquVAw3ZYuXWf5Vyk8Sv/GauTB8ekbp6
+Gzq+OXx/JQbTksAXCNPbfBT/pvXiaI/BMIpeu/twhWqLhbA0ch1f4gvVRVSo6wr5
+3V8jIPAJFGqAwgKgK6NSia9smKF9mMvUoAFb/A6LlBOPi7NM8F9BAgMBAAE=
+-----END RSA PUBLIC KEY-----
+"""
+_TEST_CERTIFICATE = """-----BEGIN CERTIFICATE-----
+MIIB/DCCAWWgAwIBAgIUZZkHB/MpA7asQLiD/KHQCxg7XEYwDQYJKoZIhvcNAQEL
+BQAwDzENMAsGA1UEAwwEdGVzdDAgFw0yNjEwMTcwMTI5MTFaGA8yMTI2MDkyMzAx
+MjkxMVowDzENMAsGA1UEAwwEdGVzdDCBnzANBgkqhkiG9w0BAQEFAAOBjQAwgYkC
+gYEAwo0m22EXJx/9MJ8wgMt0XCASq5UDDdli5dZ/lXKTxK/8Zq5MHx6RunobOr45
+fH8lBtOSwBcI09t8FP+m9eJoj8Ewil67+3CFaouFsDRyHV/iC9VFVKjrCvndXyMg
+8AkUaoDCAqAro1KJr2yYoX2Yy9SgAVv8DouUE4+Ls0zwX0ECAwEAAaNTMFEwHQYD
+VR0OBBYEFAnkvlIeDYKbFhFBO9kCuMWANlt9MB8GA1UdIwQYMBaAFAnkvlIeDYKb
+FhFBO9kCuMWANlt9MA8GA1UdEwEB/wQFMAMBAf8wDQYJKoZIhvcNAQELBQADgYEA
+pbnqBESfEYDpJrK9HZCpgDEJhPfdsbfNO/6EasZAmrGHjRxJNKLjUrpx6vWAaBgQ
+La8Npj7bUFfzXhreWunIaM9Zvfltg9kB53u7bNUmCnr5ZH6xGigyLDvkjrdc5nMf
+mKhtyDANCOrD8QAYBafBYQ8qAZ4fQI51xJ+WuaSr1es=
+-----END CERTIFICATE-----
+"""
+_TEST_KEY_NUMBERS = (int('c28d26db6117271ffd309f3080cb745c2012ab95030dd962e5d67f'
+                         '957293c4affc66ae4c1f1e91ba7a1b3abe397c7f2506d392c01708'
+                         'd3db7c14ffa6f5e2688fc1308a5ebbfb70856a8b85b034721d5fe2'
+                         '0bd54554a8eb0af9dd5f2320f009146a80c202a02ba35289af6c98'
+                         'a17d98cbd4a0015bfc0e8b94138f8bb34cf05f41', 16), 65537)
+
 class TestRandomOrgSerialClient(unittest.TestCase):
     
     def setUp(self):
@@ -50,6 +141,950 @@ class TestRandomOrgSerialClient(unittest.TestCase):
             response = self._serial_client.generate_integers(10, 0, 10)
         
         self._serial_client._advisory_delay = 1.0
+    
+    def test_submit(self):
+        """Check submitted requests return Futures completed in turn."""
+        
+        futures = [self._serial_client.submit('generate_integers', 5, 0, 10) 
+                   for _ in range(3)]
+        
+        for future in futures:
+            response = future.result(timeout=30)
+            assert isinstance(response, list)
+            assert len(response) == 5
+    
+    def test_submit_cancel(self):
+        """Check a cancelled request isn't sent, and unknown methods are 
+        rejected."""
+        
+        first = self._serial_client.submit('generate_integers', 5, 0, 10)
+        second = self._serial_client.submit('generate_UUIDs', 1)
+        
+        assert second.cancel()
+        assert len(first.result(timeout=30)) == 5
+        assert second.cancelled()
+        
+        with pytest.raises(ValueError):
+            self._serial_client.submit('create_url', {}, '')
+    
+    def test_submit_priority(self):
+        """Check queued requests are sent highest priority first and 
+        requests past their deadline fail without being sent."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        order = []
+        
+        first = self._serial_client.submit('generate_integers', 1, 0, 10)
+        low = self._serial_client.submit('generate_integers', 1, 0, 10, 
+                                         priority=-1)
+        high = self._serial_client.submit('generate_integers', 1, 0, 10, 
+                                          priority=1)
+        expired = self._serial_client.submit('generate_integers', 1, 0, 10, 
+                                             deadline=monotonic() - 1)
+        
+        low.add_done_callback(order.append)
+        high.add_done_callback(order.append)
+        
+        with pytest.raises(RandomOrgSendTimeoutError):
+            expired.result(timeout=30)
+        
+        for future in (first, low, high):
+            assert len(future.result(timeout=30)) == 1
+        
+        assert order == [high, low]
+
+class TestRandomOrgCoalescingClient(unittest.TestCase):
+    
+    def setUp(self):
+        """Create client merging requests made within a second."""
+        self._client = RandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                       serialized=False, coalesce_window=1.0)
+    
+    def tearDown(self):
+        """Kill all clients."""
+        delattr(self._client, '_api_key')
+        self._client = None
+        RandomOrgClient.__key_indexed_instances = {}
+    
+    
+    def test_coalesced_requests(self):
+        """Check concurrent compatible requests are sent as one and each 
+        caller receives its own share."""
+        
+        responses = {}
+        
+        def draw(i):
+            responses[i] = self._client.generate_integers(i + 1, 0, 10)
+        
+        threads = [threading.Thread(target=draw, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        for i in range(4):
+            assert len(responses[i]) == i + 1
+        
+        assert self._client.get_connection_stats()['requests'] == 1
+    
+    def test_full_request_sent_early(self):
+        """Check a merged request is sent once no more requests can join
+        it, before the window is up."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        responses = []
+        
+        def draw():
+            responses.append(self._client.generate_integers(5000, 0, 10))
+        
+        start = monotonic()
+        
+        threads = [threading.Thread(target=draw) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert monotonic() - start < 1.0
+        assert [len(response) for response in responses] == [5000, 5000]
+        assert self._client.get_connection_stats()['requests'] == 1
+    
+    def test_lone_requests(self):
+        """Check a lone caller stops waiting for others to merge with 
+        once its request had nothing to merge with."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        
+        self._client.generate_integers(5, 0, 10)
+        
+        start = monotonic()
+        response = self._client.generate_integers(5, 0, 10)
+        
+        assert len(response) == 5
+        assert monotonic() - start < 1.0
+    
+    def test_incompatible_requests(self):
+        """Check requests without replacement are sent without waiting 
+        for others to merge with."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        start = monotonic()
+        
+        response = self._client.generate_integers(5, 0, 10, replacement=False)
+        
+        assert len(response) == 5
+        assert monotonic() - start < 1.0
+
+class TestAsyncRandomOrgClient(unittest.TestCase):
+    
+    def setUp(self):
+        """Create client in a fresh event loop."""
+        pytest.importorskip('aiohttp')
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._async_client = AsyncRandomOrgClient(_API_KEY_1, blocking_timeout=30)
+    
+    def tearDown(self):
+        """Close client and event loop."""
+        self._loop.run_until_complete(self._async_client.close())
+        self._loop.close()
+        asyncio.set_event_loop(None)
+    
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+    
+    
+    def test_info(self):
+        assert isinstance(self._run(self._async_client.get_requests_left()), int)
+        assert isinstance(self._run(self._async_client.get_bits_left()), int)
+    
+    def test_generate_integers(self):
+        """Check awaited generate_integers returns a list of ints."""
+        
+        response = self._run(self._async_client.generate_integers(10, 0, 10))
+        
+        assert isinstance(response, list)
+        
+        for i in response:
+            assert isinstance(i, int)
+    
+    def test_concurrent_serialized_requests(self):
+        """Check concurrently awaited requests are all served in turn."""
+        
+        responses = self._run(asyncio.gather(
+            *[self._async_client.generate_integers(1, 0, 10) for _ in range(3)]))
+        
+        assert len(responses) == 3
+        
+        for response in responses:
+            assert len(response) == 1
+    
+    def test_timeout_error(self):
+        """Check RandomOrgSendTimeoutError raised when allowed wait time is 
+        exceeded."""
+        
+        self._async_client._advisory_delay = 1000
+        
+        with pytest.raises(RandomOrgSendTimeoutError):
+            self._run(self._async_client.generate_integers(10, 0, 10))
+    
+    def test_close_fails_pending_requests(self):
+        """Check closing a client fails the requests being sent or still
+        queued, rather than leaving their callers waiting forever."""
+        
+        client = AsyncRandomOrgClient(_API_KEY_1, blocking_timeout=-1)
+        client._scheduler.response_received(1000)
+        
+        async def draw_and_close():
+            draws = [asyncio.ensure_future(client.generate_integers(1, 0, 10)) 
+                     for _ in range(3)]
+            await asyncio.sleep(0.1)
+            await client.close()
+            return await asyncio.wait_for(asyncio.gather(*draws, 
+                                                         return_exceptions=True), 
+                                          10)
+        
+        results = self._run(draw_and_close())
+        
+        assert isinstance(results[0], RuntimeError)
+        assert all(isinstance(r, RandomOrgSendTimeoutError) for r in results[1:])
+    
+    def test_new_event_loop(self):
+        """Check the connections of a previous event loop are closed 
+        when a client is used in a new one."""
+        
+        client = AsyncRandomOrgClient(_API_KEY_1, serialized=False)
+        
+        self._run(client.generate_integers(1, 0, 10))
+        session = client._http_session
+        connector = session.connector
+        
+        self._loop.close()
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        
+        response = self._run(client.generate_integers(1, 0, 10))
+        self._run(client.close())
+        
+        assert len(response) == 1
+        assert session.closed and connector.closed
+
+class TestRandomOrgCoordination(unittest.TestCase):
+    
+    def setUp(self):
+        """Create two clients for one key, as if in different processes,
+        sharing a coordination directory."""
+        pytest.importorskip('aiohttp')
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._directory = tempfile.mkdtemp()
+        self._clients = [AsyncRandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                              coordination_dir=self._directory) 
+                         for _ in range(2)]
+    
+    def tearDown(self):
+        """Close clients and event loop."""
+        for client in self._clients:
+            self._loop.run_until_complete(client.close())
+        self._loop.close()
+        asyncio.set_event_loop(None)
+        shutil.rmtree(self._directory)
+    
+    
+    def test_shared_advisory_delay(self):
+        """Check the advisory delay of a response received by one client 
+        applies to the other."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        start = monotonic()
+        
+        self._loop.run_until_complete(self._clients[0].generate_integers(1, 0, 10))
+        
+        slots = [client.get_next_slot_time() for client in self._clients]
+        
+        assert slots[1] > start
+        assert abs(slots[1] - slots[0]) < 0.1
+    
+    def test_shared_slot_reservation(self):
+        """Check requests sent at the same time by clients sharing a 
+        coordination directory are spaced by the advisory delay."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        
+        self._clients += [AsyncRandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                               coordination_dir=self._directory) 
+                          for _ in range(2)]
+        
+        # Learn the advisory delay.
+        self._loop.run_until_complete(self._clients[0].generate_integers(1, 0, 10))
+        delay = self._clients[0]._scheduler.advisory_delay
+        
+        sent = []
+        for client in self._clients:
+            check = client._scheduler.check
+            
+            def record(deadline=None, check=check):
+                result = check(deadline)
+                if result.get('wait') == 0:
+                    sent.append(monotonic())
+                return result
+            
+            client._scheduler.check = record
+        
+        self._loop.run_until_complete(asyncio.gather(
+            *[client.generate_integers(1, 0, 10) for client in self._clients]))
+        
+        sent.sort()
+        
+        assert delay > 0
+        assert len(sent) == len(self._clients)
+        assert all(b - a >= delay * 0.9 for a, b in zip(sent, sent[1:]))
+    
+    def test_shared_backoff(self):
+        """Check a backoff of one client applies to the other."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        
+        self._clients[0]._scheduler.set_backoff('Error 402: The API key has '
+                                                'no requests left today')
+        
+        assert self._clients[1].get_next_slot_time() > monotonic() + 1
+        
+        with pytest.raises(RandomOrgInsufficientRequestsError):
+            self._loop.run_until_complete(self._clients[1].generate_integers(1, 0, 10))
+
+class TestRandomOrgSignatureVerification(unittest.TestCase):
+    
+    def setUp(self):
+        """Create client verifying signatures with the test key."""
+        self._client = RandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                       serialized=False, 
+                                       public_key=_TEST_PUBLIC_KEY)
+    
+    def tearDown(self):
+        """Kill all clients."""
+        delattr(self._client, '_api_key')
+        self._client = None
+        RandomOrgClient.__key_indexed_instances = {}
+    
+    
+    def test_local_verification(self):
+        """Check signatures are verified without requests."""
+        
+        tampered = OrderedDict(_SIGNED_RANDOM, data=[6, 6, 6])
+        
+        assert self._client.verify_signature(_SIGNED_RANDOM, _SIGNATURE)
+        assert not self._client.verify_signature(tampered, _SIGNATURE)
+        assert not self._client.verify_signature(_SIGNED_RANDOM, 'SIG')
+        
+        with self._client.batch() as batch:
+            future = batch.verify_signature(_SIGNED_RANDOM, _SIGNATURE)
+        
+        assert future.result()
+        assert self._client.get_connection_stats()['requests'] == 0
+    
+    def test_decimal_verification(self):
+        """Check signed decimal fractions are verified as RANDOM.ORG 
+        serialized them, while behaving as floats."""
+        
+        request = { 'method': 'generateSignedDecimalFractions' }
+        result = _parse_response(_SIGNED_DECIMAL_RESPONSE.encode('utf-8'), 
+                                 request)['result']
+        random = result['random']
+        
+        assert random['data'] == [0.00001, 0.5, 0.12345]
+        assert all(isinstance(value, float) for value in random['data'])
+        assert self._client.verify_signature(random, result['signature'])
+        
+        # The numbers are recorded in a ledger as received too.
+        directory = tempfile.mkdtemp()
+        try:
+            ledger = RandomOrgLedger(os.path.join(directory, 'ledger'))
+            ledger.record(random, result['signature'])
+            ledger.close()
+            
+            ledger = RandomOrgLedger(os.path.join(directory, 'ledger'))
+            recorded = ledger.get(43)
+            ledger.close()
+            
+            assert self._client.verify_signature(recorded['random'], 
+                                                 recorded['signature'])
+        finally:
+            shutil.rmtree(directory)
+        
+        # Parsed as plain floats the numbers no longer serialize as 
+        # signed.
+        parsed = json.loads(_SIGNED_DECIMAL_RESPONSE, 
+                            object_pairs_hook=OrderedDict)['result']
+        assert not self._client.verify_signature(parsed['random'], 
+                                                 parsed['signature'])
+    
+    def test_key_formats(self):
+        """Check certificates, PKCS#1 keys and key numbers are 
+        accepted, and anything else raises a ValueError."""
+        
+        for key in (_TEST_CERTIFICATE, _TEST_RSA_PUBLIC_KEY.encode('ascii'), 
+                    _TEST_KEY_NUMBERS):
+            delattr(self._client, '_api_key')
+            self._client = RandomOrgClient(_API_KEY_1, serialized=False, 
+                                           public_key=key)
+            
+            assert self._client.verify_signature(_SIGNED_RANDOM, _SIGNATURE)
+        
+        delattr(self._client, '_api_key')
+        with pytest.raises(ValueError):
+            RandomOrgClient(_API_KEY_1, public_key='not a key')
+        self._client = RandomOrgClient(_API_KEY_1, serialized=False)
+    
+    def test_fallback(self):
+        """Check a signature failing local verification is verified 
+        with the server if requested."""
+        
+        tampered = OrderedDict(_SIGNED_RANDOM, data=[6, 6, 6])
+        
+        assert not self._client.verify_signature(tampered, _SIGNATURE, 
+                                                 fallback=True)
+        assert self._client.get_connection_stats()['requests'] == 1
+    
+    def test_verify_signatures(self):
+        """Check signatures are verified across processes, and those
+        failing with the server in one batch if requested."""
+        
+        signed = []
+        for i in range(600):
+            random = OrderedDict(_SIGNED_RANDOM, serialNumber=i)
+            if i == 42:
+                signed.append({ 'random': random, 'signature': _SIGNATURE })
+            else:
+                signed.append((random, _SIGNATURE))
+        
+        results = dict(self._client.verify_signatures(signed, processes=2))
+        
+        assert len(results) == 600
+        assert [i for i in results if results[i]] == [42]
+        assert self._client.get_connection_stats()['requests'] == 0
+        
+        results = list(self._client.verify_signatures(signed[40:45], 
+                                                      fallback=True))
+        
+        assert sorted(results) == [(40, False), (41, False), (42, True), 
+                                   (43, False), (44, False)]
+        assert self._client.get_connection_stats()['requests'] == 1
+    
+    def test_remembered_verifications(self):
+        """Check verifications with the server are only sent once, 
+        also after a restart."""
+        
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'verifications')
+        tampered = [OrderedDict(_SIGNED_RANDOM, serialNumber=i) 
+                    for i in range(3)]
+        
+        try:
+            delattr(self._client, '_api_key')
+            self._client = RandomOrgClient(_API_KEY_1, serialized=False, 
+                                           verification_cache_size=2, 
+                                           verification_cache_path=path)
+            
+            for random in tampered + tampered:
+                assert not self._client.verify_signature(random, _SIGNATURE)
+            
+            results = list(self._client.verify_signatures((random, _SIGNATURE)
+                                                          for random in tampered))
+            
+            assert sorted(results) == [(0, False), (1, False), (2, False)]
+            assert self._client.get_connection_stats()['requests'] == 3
+            
+            delattr(self._client, '_api_key')
+            self._client = RandomOrgClient(_API_KEY_1, serialized=False, 
+                                           verification_cache_path=path)
+            
+            assert not self._client.verify_signature(tampered[0], _SIGNATURE)
+            assert self._client.get_connection_stats()['requests'] == 0
+        finally:
+            shutil.rmtree(directory)
+
+class TestRandomOrgLedger(unittest.TestCase):
+    
+    def setUp(self):
+        """Create client recording signed results in a ledger."""
+        self._directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._directory, 'ledger')
+        self._ledger = RandomOrgLedger(self._path)
+        self._client = RandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                       serialized=False, ledger=self._ledger)
+    
+    def tearDown(self):
+        """Kill all clients and remove the ledger."""
+        delattr(self._client, '_api_key')
+        self._client = None
+        RandomOrgClient.__key_indexed_instances = {}
+        self._ledger.close()
+        shutil.rmtree(self._directory)
+    
+    
+    def test_get_result(self):
+        """Check signed results are recorded and get_result answers 
+        from the ledger."""
+        
+        response = self._client.generate_signed_integers(3, 0, 10)
+        serial_number = response['random']['serialNumber']
+        
+        result = self._client.get_result(serial_number)
+        
+        assert result == response
+        assert self._ledger.get(serial_number) == response
+        assert self._client.get_connection_stats()['requests'] == 1
+    
+    def test_lookups(self):
+        """Check results are found by ticket and time after reopening
+        a ledger, and an incomplete line is discarded."""
+        
+        for i in range(5):
+            random = OrderedDict(_SIGNED_RANDOM, serialNumber=i, 
+                                 completionTime='2026-10-17 12:00:0' 
+                                 + str(i) + 'Z')
+            if i == 3:
+                random['ticketData'] = { 'ticketId': 'TICKET', 
+                                        'previousTicketId': None, 
+                                        'nextTicketId': None }
+            self._ledger.record(random, _SIGNATURE)
+        
+        # Recorded results are ignored.
+        self._ledger.record(random, _SIGNATURE)
+        self._ledger.close()
+        
+        # Simulate a crash while appending a result.
+        with open(self._path, 'ab') as f:
+            f.write(b'{"random":')
+        
+        self._ledger = RandomOrgLedger(self._path)
+        
+        assert len(self._ledger) == 5
+        assert self._ledger.get(5) is None
+        assert self._ledger.get_by_ticket('TICKET')['random']['serialNumber'] == 3
+        assert self._ledger.get(4)['random'] == random
+        
+        results = self._ledger.get_range(datetime(2026, 10, 17, 12, 0, 1), 
+                                         '2026-10-17 12:00:03Z')
+        
+        assert [r['random']['serialNumber'] for r in results] == [1, 2]
+        
+        self._ledger.record(OrderedDict(random, serialNumber=5), _SIGNATURE)
+        self._ledger.close()
+        self._ledger = RandomOrgLedger(self._path)
+        
+        assert len(self._ledger) == 6
+
+class TestRandomOrgSerialMonitor(unittest.TestCase):
+    
+    def setUp(self):
+        """Create client tracking serial numbers."""
+        self._monitor = RandomOrgSerialMonitor()
+        self._client = RandomOrgClient(_API_KEY_1, blocking_timeout=30, 
+                                       serialized=False, 
+                                       serial_monitor=self._monitor)
+    
+    def tearDown(self):
+        """Kill all clients."""
+        delattr(self._client, '_api_key')
+        self._client = None
+        RandomOrgClient.__key_indexed_instances = {}
+    
+    
+    def test_gaps(self):
+        """Check missing, duplicate and late serial numbers are 
+        detected per key and day."""
+        
+        for serial_number, day in ((1, 17), (2, 17), (3, 17), (7, 17), 
+                                   (5, 18), (4, 18), (4, 18), (10, 18)):
+            random = OrderedDict(_SIGNED_RANDOM, serialNumber=serial_number,
+                                 completionTime='2026-10-' + str(day) 
+                                 + ' 12:00:00Z')
+            self._monitor.record(random)
+        
+        self._monitor.record(OrderedDict(_SIGNED_RANDOM, hashedApiKey='OTHER'))
+        
+        stats = self._monitor.get_stats()
+        
+        assert stats['OTHER']['missing'] == 0
+        assert stats['HASH'] == {'first': 1, 'last': 10, 'received': 8, 
+                                 'missing': 3, 'duplicates': 1, 
+                                 'out_of_order': 2}
+        assert self._monitor.get_gaps('HASH') == [(6, 6), (8, 9)]
+        
+        report = self._monitor.get_report()
+        
+        assert report['HASH']['gaps'] == [(6, 6), (8, 9)]
+        assert report['HASH']['days']['2026-10-18'] == {'received': 4, 
+                                                        'duplicates': 1, 
+                                                        'out_of_order': 2}
+    
+    def test_signed_responses(self):
+        """Check new signed results are tracked, but not those 
+        retrieved again."""
+        
+        responses = [self._client.generate_signed_integers(1, 0, 10) 
+                     for _ in range(2)]
+        self._client.get_result(responses[0]['random']['serialNumber'])
+        
+        stats = self._monitor.get_stats()
+        hashed_api_key = responses[0]['random']['hashedApiKey']
+        
+        assert stats[hashed_api_key]['received'] == 2
+        assert stats[hashed_api_key]['duplicates'] == 0
+
+class TestRandomOrgClientPool(unittest.TestCase):
+    
+    def setUp(self):
+        """Create pool."""
+        self._pool = RandomOrgClientPool([_API_KEY_1, _API_KEY_2], 
+                                         blocking_timeout=30, serialized=False)
+    
+    def tearDown(self):
+        """Kill all clients."""
+        for api_key in set([_API_KEY_1, _API_KEY_2]):
+            client = self._pool.get_client(api_key)
+            client._backoff = None
+            client._backoff_error = None
+            delattr(client, '_api_key')
+        self._pool = None
+        RandomOrgClient.__key_indexed_instances = {}
+    
+    
+    def test_generate_integers(self):
+        """Check requests are sent with a key of the pool and counted."""
+        
+        response = self._pool.generate_integers(10, 0, 10)
+        
+        assert isinstance(response, list)
+        assert len(response) == 10
+        
+        stats = self._pool.get_key_stats()
+        
+        assert sum(stats[api_key]['requests'] for api_key in stats) == 1
+        assert sum(stats[api_key]['in_flight'] for api_key in stats) == 0
+    
+    def test_backoff_skipped(self):
+        """Check keys backing off are skipped, and an error raised once 
+        none are left."""
+        
+        for api_key in (_API_KEY_1, _API_KEY_2):
+            client = self._pool.get_client(api_key)
+            client._backoff = datetime.utcnow() + timedelta(hours=1)
+            client._backoff_error = 'Error 402: The API key has no requests left today'
+        
+        with pytest.raises(RandomOrgInsufficientRequestsError):
+            self._pool.generate_integers(10, 0, 10)
+        
+        stats = self._pool.get_key_stats()
+        
+        assert stats[_API_KEY_1]['backoff']
+        assert stats[_API_KEY_1]['requests'] == 0
+
+class TestRandomOrgCache(unittest.TestCase):
+    
+    @staticmethod
+    def _request_function(values=None, requests=None, error=None):
+        # Fake request function answering a request for n values with 
+        # the next n counting integers, or with values(n) if given. 
+        # Requests are appended to the list requests if given, error is
+        # raised instead of answering if given.
+        counter = itertools.count()
+        
+        def request_function(request):
+            if requests is not None:
+                requests.append(request)
+            if error is not None:
+                raise error
+            
+            n = request['params']['n']
+            if values is not None:
+                data = values(n)
+            else:
+                data = [next(counter) for _ in range(n)]
+            
+            return { 'result': { 'random': { 'data': data } } }
+        
+        return request_function
+    
+    @staticmethod
+    def _process_function(response):
+        return response['result']['random']['data']
+    
+    
+    def test_adaptive_bulk_size(self):
+        """Check a cache consumed quickly requests more result sets at a 
+        time, within its high watermark."""
+        
+        requests = []
+        
+        request = { 'method': 'generateIntegers', 'params': { 'n': 5 } }
+        cache = RandomOrgCache(self._request_function(requests=requests), 
+                               self._process_function, request, 
+                               100, 5, 1, high_watermark=80)
+        
+        got = 0
+        start = time.time()
+        
+        while got < 500 and time.time() - start < 30:
+            try:
+                cache.get()
+                got += 1
+            except Empty:
+                time.sleep(0.001)
+        
+        sizes = [r['params']['n'] for r in requests]
+        
+        assert got == 500
+        assert sizes[0] == 5
+        assert 5 < max(sizes) <= 80
+    
+    def test_get_many(self):
+        """Check several result sets are taken at once and a blocking get
+        waits for the cache to be populated."""
+        
+        request = { 'method': 'generateIntegers', 'params': { 'n': 5 } }
+        cache = RandomOrgCache(self._request_function(), 
+                               self._process_function, request, 20, 5, 1)
+        
+        assert cache.get(timeout=10) == [0]
+        
+        results = cache.get_many(8, timeout=10)
+        assert len(results) == 8
+        assert all(len(r) == 1 for r in results)
+        
+        cache.stop()
+        time.sleep(0.5)
+        
+        left = len(cache.get_many(100))
+        
+        try:
+            cache.get_many(1)
+            assert False
+        except Empty:
+            pass
+        
+        try:
+            cache.get(timeout=0.1)
+            assert False
+        except Empty:
+            pass
+        
+        assert left > 0
+    
+    def test_iteration(self):
+        """Check iterating over a cache yields result sets until it is 
+        stopped and empty."""
+        
+        request = { 'method': 'generateIntegers', 'params': { 'n': 5 } }
+        cache = RandomOrgCache(self._request_function(), 
+                               self._process_function, request, 10, 5, 1)
+        
+        got = 0
+        for result in cache:
+            assert len(result) == 1
+            got += 1
+            if got == 25:
+                cache.stop()
+        
+        assert got >= 25
+    
+    def test_ring_buffer(self):
+        """Check threads draining a ring buffer cache each receive 
+        distinct result sets as arrays."""
+        
+        request = { 'method': 'generateIntegers', 'params': { 'n': 15 } }
+        cache = RandomOrgCache(self._request_function(), 
+                               self._process_function, request, 
+                               20, 5, 3, ring_buffer=True)
+        
+        taken = []
+        
+        def drain():
+            results = [cache.get(timeout=10) for _ in range(50)]
+            results.extend(cache.get_many(10, timeout=10))
+            taken.extend(results)
+        
+        threads = [threading.Thread(target=drain) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        cache.stop()
+        
+        assert len(taken) == 240
+        assert all(isinstance(r, array) and len(r) == 3 for r in taken)
+        
+        values = [v for r in taken for v in r]
+        assert len(set(values)) == len(values)
+    
+    def test_ring_buffer_invalid_result_sets(self):
+        """Check a ring buffer cache drops result sets of the wrong 
+        length or with values out of range rather than storing them."""
+        
+        # One value short, and the first out of range.
+        def values(n):
+            return [2 ** 70] + list(range(1, n - 1))
+        
+        request = { 'method': 'generateIntegers', 'params': { 'n': 15 } }
+        cache = RandomOrgCache(self._request_function(values), 
+                               self._process_function, request, 
+                               20, 5, 3, ring_buffer=True)
+        
+        taken = cache.get_many(10, timeout=10)
+        
+        cache.stop()
+        
+        assert len(taken) == 10
+        assert all(len(r) == 3 for r in taken)
+        assert all(0 <= v < 2 ** 31 for r in taken for v in r)
+    
+    def test_persistence(self):
+        """Check a cache with a path starts with the result sets left by 
+        a previous one, and never returns a result set twice."""
+        
+        failing_request_function = self._request_function(
+            error=RandomOrgSendTimeoutError('offline'))
+        
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'integers')
+        request = { 'method': 'generateIntegers', 
+                   'params': { 'apiKey': 'a', 'n': 5, 'min': 0, 'max': 9 } }
+        
+        try:
+            cache = RandomOrgCache(self._request_function(), 
+                                   self._process_function, 
+                                   request, 10, 5, 1, path=path)
+            consumed = [cache.get(timeout=10) for _ in range(15)]
+            cache.stop()
+            time.sleep(0.5)
+            
+            # Simulate a crash while appending a result set.
+            with open(path, 'ab') as f:
+                f.write(b'[99')
+            
+            request = dict(request, params=dict(request['params'], apiKey='b'))
+            cache = RandomOrgCache(failing_request_function, self._process_function,
+                                   request, 10, 5, 1, path=path)
+            left = cache.get_many(100)
+            cache.stop()
+            
+            values = [v for r in consumed + left for v in r]
+            assert len(left) > 0
+            assert len(set(values)) == len(values)
+            
+            # A different request doesn't get these result sets.
+            request = dict(request, params=dict(request['params'], max=5))
+            cache = RandomOrgCache(failing_request_function, self._process_function,
+                                   request, 10, 5, 1, path=path)
+            cache.stop()
+            
+            try:
+                cache.get()
+                assert False
+            except Empty:
+                pass
+        finally:
+            shutil.rmtree(directory)
+    
+    def test_shared(self):
+        """Check caches sharing a path are refilled by one of them only, 
+        and each result set is returned by exactly one of them."""
+        
+        request_function = self._request_function()
+        
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'integers')
+        request = { 'method': 'generateIntegers', 
+                   'params': { 'n': 5, 'min': 0, 'max': 9 } }
+        
+        try:
+            caches = [RandomOrgCache(request_function, self._process_function, 
+                                     request, 10, 5, 1, path=path, 
+                                     shared=True) for _ in range(2)]
+            
+            taken = [[], []]
+            
+            def drain(i):
+                for _ in range(40):
+                    taken[i].append(caches[i].get(timeout=10))
+            
+            threads = [threading.Thread(target=drain, args=(i,)) 
+                       for i in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            
+            for cache in caches:
+                cache.stop()
+            
+            values = [v for r in taken[0] + taken[1] for v in r]
+            assert len(values) == 80
+            assert len(set(values)) == 80
+            
+            # Only the first cache to be registered fetches.
+            fetching = [cache._store.fetching() for cache in caches]
+            assert fetching.count(True) == 1
+        finally:
+            shutil.rmtree(directory)
+
+class TestRandomOrgEntropyReservoir(unittest.TestCase):
+    
+    def setUp(self):
+        """Create reservoir fed by local blobs of counting bytes."""
+        
+        def values(n):
+            return [base64.b64encode(bytes(bytearray(range(256))))] * n
+        
+        request = { 'method': 'generateBlobs', 
+                   'params': { 'n': 1, 'size': 2048, 'format': 'base64' } }
+        self._cache = RandomOrgCache(TestRandomOrgCache._request_function(values), 
+                                     TestRandomOrgCache._process_function, 
+                                     request, 4, 1, 1)
+        self._reservoir = RandomOrgEntropyReservoir(self._cache)
+    
+    def tearDown(self):
+        self._cache.stop()
+    
+    def test_integers(self):
+        """Check integers are in range and drawn by rejection sampling."""
+        
+        # Bytes 0, 1, 2... read 3 bits at a time give 0, 0, 0, 0, 0, 4, 
+        # 0, 2, 0, 0, 6, 0, 2, of which 6 is out of range.
+        got = self._reservoir.get_integers(12, 10, 14, timeout=10)
+        
+        assert got == [10, 10, 10, 10, 10, 14, 10, 12, 10, 10, 10, 12]
+        
+        got = self._reservoir.get_integers(1000, -3, 3, timeout=10)
+        
+        assert all(-3 <= g <= 3 for g in got)
+    
+    def test_typed_values(self):
+        """Check decimal fractions, UUIDs and strings are well formed."""
+        
+        fractions = self._reservoir.get_decimal_fractions(10, timeout=10)
+        uuids = self._reservoir.get_UUIDs(10, timeout=10)
+        strings = self._reservoir.get_strings(10, 8, 'abc', timeout=10)
+        
+        assert all(0 <= f < 1 for f in fractions)
+        assert all(u.version == 4 for u in uuids)
+        assert all(len(st) == 8 and set(st) <= set('abc') for st in strings)
+    
+    def test_empty(self):
+        """Check an exhausted reservoir raises Empty."""
+        
+        self._reservoir.get_integers(1, 0, 1, timeout=10)
+        self._cache.stop()
+        time.sleep(0.5)
+        
+        try:
+            self._reservoir.get_UUIDs(1000)
+            assert False
+        except Empty:
+            pass
 
 class TestRandomOrgClient(unittest.TestCase):
     
@@ -70,6 +1105,56 @@ class TestRandomOrgClient(unittest.TestCase):
         assert isinstance(self._client.get_bits_left(), int)
     
     
+    def test_connection_reuse(self):
+        """Check consecutive requests reuse a keep-alive connection."""
+        
+        self._client.generate_integers(1, 0, 10)
+        self._client.generate_integers(1, 0, 10)
+        
+        stats = self._client.get_connection_stats()
+        
+        assert stats['requests'] >= 2
+        assert stats['reused'] >= 1
+        assert stats['reused'] == stats['requests'] - stats['connections']
+    
+    def test_session_in_use_not_expired(self):
+        """Check a session isn't discarded while a request is in flight, 
+        and is once idle for longer than http_idle_timeout."""
+        
+        self._client._http_idle_timeout = 0.2
+        
+        session = self._client._get_http_session()
+        time.sleep(0.3)
+        
+        assert self._client._get_http_session() is session
+        
+        self._client._release_http_session()
+        self._client._release_http_session()
+        
+        assert self._client._get_http_session() is session
+        self._client._release_http_session()
+        time.sleep(0.3)
+        
+        assert self._client._get_http_session() is not session
+        self._client._release_http_session()
+        
+        assert self._client.get_connection_stats()['expired'] == 1
+    
+    def test_next_slot_time(self):
+        """Check a request isn't sent before the advisory delay has passed."""
+        
+        monotonic = getattr(time, 'monotonic', time.time)
+        
+        self._client.generate_integers(1, 0, 10)
+        slot = self._client.get_next_slot_time()
+        
+        assert slot >= monotonic() - self._client._advisory_delay
+        
+        self._client.generate_integers(1, 0, 10)
+        
+        assert monotonic() >= slot
+        assert self._client.get_next_slot_time() > slot
+    
     def test_api_key_duplication(self):
         """Check new instance isn't created for same api key, 
         and different api key creates different instance."""
@@ -226,6 +1311,47 @@ class TestRandomOrgClient(unittest.TestCase):
         for i in response:
             assert isinstance(i, float)
     
+    def test_generate_numpy_output(self):
+        """Check numbers are returned as typed NumPy arrays on request."""
+        
+        numpy = pytest.importorskip('numpy')
+        
+        response = self._client.generate_integers(10, 0, 10, output='numpy')
+        
+        assert isinstance(response, numpy.ndarray)
+        assert response.dtype == numpy.int64
+        assert response.shape == (10,)
+        
+        response = self._client.generate_integer_sequences(4, 3, 0, 10, 
+                                                           output='numpy')
+        
+        assert response.shape == (4, 3)
+        
+        response = self._client.generate_gaussians(10, 10, 0.5, 5, 
+                                                   output='numpy')
+        
+        assert response.dtype == numpy.float64
+        
+        response = self._client.generate_integers(10, 0, 255, base=16, 
+                                                  output='numpy')
+        
+        assert response.dtype == numpy.int64
+        assert all(0 <= i <= 255 for i in response)
+    
+    def test_generate_decoded_integers(self):
+        """Check numbers in other bases are decoded on request."""
+        
+        response = self._client.generate_integers(10, -255, 255, base=16, 
+                                                  decode=True)
+        
+        assert all(isinstance(i, int) and -255 <= i <= 255 for i in response)
+        
+        response = self._client.generate_integer_sequences(3, 4, 0, 7, base=2, 
+                                                           decode=True)
+        
+        for sequence in response:
+            assert all(isinstance(i, int) and 0 <= i <= 7 for i in sequence)
+    
     def test_generate_gaussians(self):
         """Check generate gaussians returns a list of decimals."""
         
@@ -270,6 +1396,31 @@ class TestRandomOrgClient(unittest.TestCase):
             # Python 2.7: unicode; Python 3+: string
             assert isinstance(i, six.string_types)
     
+    def test_generate_decoded_blobs(self):
+        """Check generate blobs decodes blobs to bytes and to 
+        memoryview slices of one buffer."""
+        
+        response = self._client.generate_blobs(3, 64, output='bytes')
+        
+        assert len(response) == 3
+        for i in response:
+            assert isinstance(i, bytes)
+            assert len(i) == 8
+        
+        # Unpadded base64, padded base64 and hex blobs.
+        for size, format in ((96, 'base64'), (64, 'base64'), (64, 'hex')):
+            response = self._client.generate_blobs(3, size, format, 
+                                                   output='memoryview')
+            
+            assert len(response) == 3
+            for i in response:
+                assert isinstance(i, memoryview)
+                assert len(i) == size // 8
+                assert i.obj is response[0].obj
+        
+        with pytest.raises(ValueError):
+            self._client.generate_blobs(3, 64, output='numpy')
+    
     
     def test_generate_signed_integers(self):
         """Check generate signed integers returns a list of 
@@ -536,6 +1687,34 @@ class TestRandomOrgClient(unittest.TestCase):
         assert self._client.verify_signature(response['result']['random'], 
                                              response['result']['signature'])
     
+    def test_batch(self):
+        """Check requests sent in a batch each receive their own result."""
+        
+        with self._client.batch() as batch:
+            ints = batch.generate_integers(5, 0, 10)
+            uuids = batch.generate_UUIDs(2)
+            usage = batch.get_usage()
+        
+        assert len(ints.result()) == 5
+        
+        for u in uuids.result():
+            assert isinstance(u, uuid.UUID)
+        
+        assert isinstance(usage.result()['requestsLeft'], int)
+    
+    def test_batch_error(self):
+        """Check an error in one batched request is only raised by its 
+        own Future."""
+        
+        with self._client.batch() as batch:
+            invalid = batch.generate_integers(10001, 0, 10)
+            valid = batch.generate_integers(5, 0, 10)
+        
+        with pytest.raises(ValueError):
+            invalid.result()
+        
+        assert len(valid.result()) == 5
+    
     def test_cache(self):
         """Test empty cache and stop/resume functionality."""
         
@@ -557,6 +1736,27 @@ class TestRandomOrgClient(unittest.TestCase):
         
         assert isinstance(got, list)
     
+    def test_cache_manager(self):
+        """Check all caches of a client are populated by a single Thread."""
+        
+        threads = threading.active_count()
+        
+        caches = [self._client.create_integer_cache(1, 0, 10, cache_size=2) 
+                  for _ in range(3)]
+        
+        assert threading.active_count() <= threads + 1
+        
+        for cache in caches:
+            got = None
+            
+            while got is None:
+                try:
+                    got = cache.get()
+                except Empty:
+                    time.sleep(1)
+            
+            assert isinstance(got, list)
+    
     def test_create_integer_cache(self):
         """Check integer cache returns a list of ints on poll."""
         
@@ -575,6 +1775,22 @@ class TestRandomOrgClient(unittest.TestCase):
         for g in got:
             assert isinstance(g, int)
     
+    def test_create_numpy_cache(self):
+        """Check a cache with NumPy output returns array views."""
+        
+        numpy = pytest.importorskip('numpy')
+        
+        cache = self._client.create_integer_sequences_cache(2, 3, 0, 10, 
+                                                            cache_size=4, 
+                                                            output='numpy')
+        
+        got = cache.get(timeout=30)
+        cache.stop()
+        
+        assert isinstance(got, numpy.ndarray)
+        assert got.shape == (2, 3)
+        assert got.base is not None
+    
     def test_create_integer_sequences_cache(self):
         """Check integer sequences cache returns sequences of 
         ints on poll."""
@@ -690,6 +1906,128 @@ class TestRandomOrgClient(unittest.TestCase):
             # Python 2.7: unicode; Python 3+: string
             assert isinstance(g, six.string_types)
     
+    def test_create_decoded_blob_cache(self):
+        """Check a blob cache with memoryview output returns 
+        memoryviews, also when restored from its file."""
+        
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'blobs')
+        
+        try:
+            cache = self._client.create_blob_cache(2, 64, cache_size=4, 
+                                                   path=path, 
+                                                   output='memoryview')
+            got = cache.get(timeout=30)
+            cache.stop()
+            
+            assert len(got) == 2
+            for g in got:
+                assert isinstance(g, memoryview)
+                assert len(g) == 8
+            time.sleep(0.5)
+            
+            # Stopped cache has left result sets in the file.
+            cache = self._client.create_blob_cache(2, 64, cache_size=4, 
+                                                   path=path, 
+                                                   output='memoryview')
+            cache.stop()
+            got = cache.get()
+            
+            for g in got:
+                assert isinstance(g, memoryview)
+                assert len(g) == 8
+        finally:
+            shutil.rmtree(directory)
+    
+    def test_create_entropy_reservoir(self):
+        """Check entropy reservoir draws typed values from cached blobs."""
+        
+        reservoir = self._client.create_entropy_reservoir(blob_size=1024, 
+                                                          cache_size=2)
+        
+        got = reservoir.get_integers(10, 1, 6, timeout=30)
+        
+        assert len(got) == 10
+        assert all(1 <= g <= 6 for g in got)
+        
+        reservoir.stop()
+    
+    def test_create_ticket_pool(self):
+        """Check a chained ticket pool hands out tickets created in 
+        advance and the successors of those it used."""
+        
+        pool = self._client.create_ticket_pool(4, chained=True)
+        
+        response = pool.generate('generate_signed_integers', 2, 0, 10, 
+                                 timeout=30)
+        ticket_data = response['random']['ticketData']
+        
+        assert len(response['data']) == 2
+        assert pool.get() == ticket_data['nextTicketId']
+        assert pool.get(timeout=30) != ticket_data['ticketId']
+        
+        with pytest.raises(ValueError):
+            pool.generate('generate_integers', 2, 0, 10)
+        
+        pool.stop()
+    
+    def test_ticket_pool_returns_unused_tickets(self):
+        """Check a ticket pool takes back a ticket its draw failed to 
+        use."""
+        
+        pool = self._client.create_ticket_pool(1)
+        pool.stop()
+        pool.put('TICKET')
+        
+        with pytest.raises(TypeError):
+            pool.generate('generate_signed_integers', 2, 0, 10, colour='red')
+        
+        self._client._scheduler.set_backoff('Error 402: The API key has '
+                                            'no requests left today')
+        try:
+            with pytest.raises(RandomOrgInsufficientRequestsError):
+                pool.generate('generate_signed_integers', 2, 0, 10)
+        finally:
+            self._client._scheduler.backoff = None
+            self._client._scheduler.backoff_error = None
+        
+        assert pool.get() == 'TICKET'
+        
+        # Only a failure to connect is known to have sent nothing.
+        try:
+            requests.post('http://127.0.0.1:1/', timeout=5)
+            assert False
+        except requests.exceptions.ConnectionError as e:
+            refused = e
+        
+        disconnected = requests.exceptions.ConnectionError(
+            'Connection aborted.', 'Remote end closed connection')
+        if hasattr(json, 'JSONDecodeError'):
+            malformed = json.JSONDecodeError('Expecting value', '', 0)
+        else:
+            malformed = ValueError('No JSON object could be decoded')
+        
+        assert pool._unsent(refused)
+        assert not pool._unsent(disconnected)
+        assert not pool._unsent(requests.exceptions.ReadTimeout())
+        assert not pool._unsent(malformed)
+        assert not pool._unsent(RandomOrgTicketAlreadyUsedError('used'))
+    
+    def test_adopt_tickets(self):
+        """Check a ticket pool hands out existing unused tickets 
+        first if requested."""
+        
+        self._client.create_tickets(1, False)
+        
+        pool = self._client.create_ticket_pool(2, show_result=False, 
+                                               adopt=True)
+        pool.stop()
+        
+        ticket = self._client.get_ticket(pool.get())
+        
+        assert ticket['usedTime'] is None
+        assert ticket['showResult'] is False
+    
     def test_cached_info(self):
         assert isinstance(self._client.get_requests_left(), int)
         assert isinstance(self._client.get_bits_left(), int)